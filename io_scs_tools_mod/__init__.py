@@ -37,12 +37,11 @@ from time import time
 from bpy.props import CollectionProperty, StringProperty, PointerProperty, BoolProperty
 from bpy_extras.io_utils import ImportHelper, ExportHelper
 from io_scs_tools_mod.consts import Icons as _ICONS_consts
-from io_scs_tools_mod.imp import pix as _pix_import
-from io_scs_tools_mod.internals.callbacks import open_gl as _open_gl_callback
 from io_scs_tools_mod.internals.callbacks import persistent as _persistent_callback
 from io_scs_tools_mod.internals import icons as _icons
 from io_scs_tools_mod.operators.bases.export import SCSExportHelper as _SCSExportHelper
 from io_scs_tools_mod.utils import get_scs_globals as _get_scs_globals
+from io_scs_tools_mod.utils import timing as _timing_utils
 from io_scs_tools_mod.utils.view3d import has_view3d_space as _has_view3d_space
 from io_scs_tools_mod.utils.printout import lprint
 
@@ -101,6 +100,9 @@ class SCS_TOOLS_OT_Import(bpy.types.Operator, ImportHelper):
 
         start_time = time()
 
+        # importer is imported on first import only, to keep add-on enabling fast
+        from io_scs_tools_mod.imp import pix as _pix_import
+
         failed_files = []
         for filepath in paths:
 
@@ -347,86 +349,95 @@ classes = (
 # #################################################
 
 def register():
-    # CUSTOM ICONS INITIALIZATION
-    _icons.register()
-
-    # REGISTRATION OF OUR PROPERTIES
-    from io_scs_tools_mod.properties import register as props_register
-    props_register()
-
-    # PROPERTIES REGISTRATION INTO EXISTING CLASSES
-    bpy.types.Object.scs_object_look_inventory = CollectionProperty(
-        type=properties.object.ObjectLooksInventoryItem
-    )
-
-    bpy.types.Object.scs_object_part_inventory = CollectionProperty(
-        type=properties.object.ObjectPartInventoryItem
-    )
-
-    bpy.types.Object.scs_object_variant_inventory = CollectionProperty(
-        type=properties.object.ObjectVariantInventoryItem
-    )
-
-    bpy.types.Object.scs_object_animation_inventory = CollectionProperty(
-        type=properties.object.ObjectAnimationInventoryItem
-    )
-
-    bpy.types.WorkSpace.scs_props = PointerProperty(
-        name="SCS Tools Workspace Variables",
-        type=properties.workspace.WorkspaceSCSProps,
-        description="SCS Tools workspace variables"
-    )
-
-    bpy.types.Object.scs_props = PointerProperty(
-        name="SCS Tools Object Variables",
-        type=properties.object.ObjectSCSTools,
-        description="SCS Tools object variables",
-    )
-
-    bpy.types.Scene.scs_props = PointerProperty(
-        name="SCS Tools Scene Variables",
-        type=properties.scene.SceneSCSProps,
-        description="SCS Tools scene variables",
-    )
-
-    bpy.types.Mesh.scs_props = PointerProperty(
-        name="SCS Tools Mesh Variables",
-        type=properties.mesh.MeshSCSTools,
-        description="SCS Tools Mesh variables",
-    )
-
-    bpy.types.Material.scs_props = PointerProperty(
-        name="SCS Tools Material Variables",
-        type=properties.material.MaterialSCSTools,
-        description="SCS Tools Material variables",
-    )
-
-    bpy.types.Action.scs_props = PointerProperty(
-        name="SCS Tools Action Variables",
-        type=properties.action.ActionSCSTools,
-        description="SCS Tools Action variables",
-    )
-
-    # REGISTER UI
-    from io_scs_tools_mod.ui import register as ui_register
-    ui_register()
-
-    # REGISTER OPERATORS
-    from io_scs_tools_mod.operators import register as ops_register
-    ops_register()
-
-    # MAIN MODULE REGISTRATION
-    for cls in classes:
-        bpy.utils.register_class(cls)
-
-    # MENU REGISTRATION
-    bpy.types.TOPBAR_MT_editor_menus.append(menu_scs_tools)
-    bpy.types.TOPBAR_MT_file_import.append(menu_func_import)
-    bpy.types.TOPBAR_MT_file_export.append(menu_func_export)
-    bpy.types.VIEW3D_MT_add.prepend(add_menu_func)
-
-    # PERSISTENT HANDLERS
-    _persistent_callback.enable()
+    # registration timings are printed only on request, when Blender runs with debug enabled (--debug)
+    with _timing_utils.operation("add-on registration", to_stdout=True, print_summary=bpy.app.debug):
+
+        # CUSTOM ICONS INITIALIZATION
+        with _timing_utils.stage("icons"):
+            _icons.register()
+
+        # REGISTRATION OF OUR PROPERTIES
+        with _timing_utils.stage("properties"):
+            from io_scs_tools_mod.properties import register as props_register
+            props_register()
+
+            # PROPERTIES REGISTRATION INTO EXISTING CLASSES
+            bpy.types.Object.scs_object_look_inventory = CollectionProperty(
+                type=properties.object.ObjectLooksInventoryItem
+            )
+
+            bpy.types.Object.scs_object_part_inventory = CollectionProperty(
+                type=properties.object.ObjectPartInventoryItem
+            )
+
+            bpy.types.Object.scs_object_variant_inventory = CollectionProperty(
+                type=properties.object.ObjectVariantInventoryItem
+            )
+
+            bpy.types.Object.scs_object_animation_inventory = CollectionProperty(
+                type=properties.object.ObjectAnimationInventoryItem
+            )
+
+            bpy.types.WorkSpace.scs_props = PointerProperty(
+                name="SCS Tools Workspace Variables",
+                type=properties.workspace.WorkspaceSCSProps,
+                description="SCS Tools workspace variables"
+            )
+
+            bpy.types.Object.scs_props = PointerProperty(
+                name="SCS Tools Object Variables",
+                type=properties.object.ObjectSCSTools,
+                description="SCS Tools object variables",
+            )
+
+            bpy.types.Scene.scs_props = PointerProperty(
+                name="SCS Tools Scene Variables",
+                type=properties.scene.SceneSCSProps,
+                description="SCS Tools scene variables",
+            )
+
+            bpy.types.Mesh.scs_props = PointerProperty(
+                name="SCS Tools Mesh Variables",
+                type=properties.mesh.MeshSCSTools,
+                description="SCS Tools Mesh variables",
+            )
+
+            bpy.types.Material.scs_props = PointerProperty(
+                name="SCS Tools Material Variables",
+                type=properties.material.MaterialSCSTools,
+                description="SCS Tools Material variables",
+            )
+
+            bpy.types.Action.scs_props = PointerProperty(
+                name="SCS Tools Action Variables",
+                type=properties.action.ActionSCSTools,
+                description="SCS Tools Action variables",
+            )
+
+        # REGISTER UI
+        with _timing_utils.stage("ui"):
+            from io_scs_tools_mod.ui import register as ui_register
+            ui_register()
+
+        # REGISTER OPERATORS
+        with _timing_utils.stage("operators"):
+            from io_scs_tools_mod.operators import register as ops_register
+            ops_register()
+
+        # MAIN MODULE REGISTRATION
+        with _timing_utils.stage("main module"):
+            for cls in classes:
+                bpy.utils.register_class(cls)
+
+            # MENU REGISTRATION
+            bpy.types.TOPBAR_MT_editor_menus.append(menu_scs_tools)
+            bpy.types.TOPBAR_MT_file_import.append(menu_func_import)
+            bpy.types.TOPBAR_MT_file_export.append(menu_func_export)
+            bpy.types.VIEW3D_MT_add.prepend(add_menu_func)
+
+        # PERSISTENT HANDLERS
+        with _timing_utils.stage("persistent handlers"):
+            _persistent_callback.enable()
 
 
 def unregister():
@@ -434,6 +445,7 @@ def unregister():
     _icons.unregister()
 
     # REMOVE OPENGL HANDLERS
+    from io_scs_tools_mod.internals.callbacks import open_gl as _open_gl_callback
     _open_gl_callback.disable()
 
     # REMOVE PERSISTENT HANDLERS
@@ -29,6 +29,7 @@ from io_scs_tools_mod.utils.info import get_combined_ver_str
 from io_scs_tools_mod.utils.printout import lprint
 from io_scs_tools_mod.internals.structure import SectionData as _SectionData
 from io_scs_tools_mod.internals.containers import pix as _pix_container
+from io_scs_tools_mod.exp.transition_structs.armature import ArmatureTrans
 
 
 def _get_custom_channels(scs_animation, action):
@@ -85,7 +86,7 @@ def _get_custom_channels(scs_animation, action):
     return custom_channels
 
 
-def _get_bone_channels(scs_root_obj, armature, scs_animation, action, export_scale):
+def _get_bone_channels(armature, armature_trans, scs_animation, action):
     """Takes armature and action and returns bone channels.
     bone_channels structure example:
     [("Bone", [("_TIME", [0.1, 0.1, 0.1, 0.1, 0.1, 0.1, 0.1, 0.1, 0.1, 0.1, 0.1, 0.1]), ("_MATRIX", [])])]"""
@@ -95,18 +96,16 @@ def _get_bone_channels(scs_root_obj, armature, scs_animation, action, export_sca
     anim_export_step = action.scs_props.anim_export_step
     total_frames = (frame_end - frame_start) / anim_export_step
 
-    # armature matrix stores transformation of armature object against scs root
-    # and has to be added to all bones as they only armature space transformations
-    armature_mat = scs_root_obj.matrix_world.inverted() @ armature.matrix_world
-
     invalid_data = False  # flag to indicate invalid data state
     curves_per_bone = OrderedDict()  # store all the curves we are interested in per bone names
 
-    for bone in armature.data.bones:
-        for fcurve in action.fcurves:
+    fcurves = action.fcurves
+    for bone_name in armature_trans.get_bone_names():
+        bone_path = '["' + bone_name + '"]'
+        for fcurve in fcurves:
 
             # check if curve belongs to bone
-            if '["' + bone.name + '"]' in fcurve.data_path:
+            if bone_path in fcurve.data_path:
 
                 data_path = fcurve.data_path
                 array_index = fcurve.array_index
@@ -124,33 +123,26 @@ def _get_bone_channels(scs_root_obj, armature, scs_animation, action, export_sca
 
                 # write only recognized curves
                 if curve_type is not None:
-                    if bone.name not in curves_per_bone:
-                        curves_per_bone[bone.name] = {
+                    if bone_name not in curves_per_bone:
+                        curves_per_bone[bone_name] = {
                             "location": {},
                             "euler_rotation": {},
                             "quat_rotation": {},
                             "scale": {}
                         }
 
-                    curves_per_bone[bone.name][curve_type][array_index] = fcurve
+                    curves_per_bone[bone_name][curve_type][array_index] = fcurve
 
     for bone_name, bone_curves in curves_per_bone.items():
 
-        bone = armature.data.bones[bone_name]
         pose_bone = armature.pose.bones[bone_name]
         loc_curves = bone_curves["location"]
         euler_rot_curves = bone_curves["euler_rotation"]
         quat_rot_curves = bone_curves["quat_rotation"]
         sca_curves = bone_curves["scale"]
 
-        bone_rest_mat = armature_mat @ bone.matrix_local
-        if bone.parent:
-            parent_bone_rest_mat = (Matrix.Scale(export_scale, 4) @
-                                    _convert_utils.scs_to_blend_matrix().inverted() @
-                                    armature_mat @
-                                    bone.parent.matrix_local)
-        else:
-            parent_bone_rest_mat = Matrix()
+        # rest matrices are the same for all of the frames and animations, so take them precomputed
+        pre_frame_mat, post_frame_mat = armature_trans.get_bone_rest_data(bone_name)
 
         # GO THOUGH FRAMES
         actual_frame = frame_start
@@ -217,26 +209,8 @@ def _get_bone_channels(scs_root_obj, armature, scs_animation, action, export_sca
             # BLENDER FRAME MATRIX
             mat = mat_loc @ mat_rot @ mat_sca
 
-            # SCALE REMOVAL MATRIX
-            rest_location, rest_rotation, rest_scale = bone_rest_mat.decompose()
-            # print(' BONES rest_scale: %s' % str(rest_scale))
-            rest_scale = rest_scale * export_scale
-            scale_removal_matrix = Matrix()
-            scale_removal_matrix[0] = (1.0 / rest_scale[0], 0, 0, 0)
-            scale_removal_matrix[1] = (0, 1.0 / rest_scale[1], 0, 0)
-            scale_removal_matrix[2] = (0, 0, 1.0 / rest_scale[2], 0)
-            scale_removal_matrix[3] = (0, 0, 0, 1)
-
-            # SCALE MATRIX
-            scale_matrix = Matrix.Scale(export_scale, 4)
-
             # COMPUTE SCS FRAME MATRIX
-            frame_matrix = (parent_bone_rest_mat.inverted() @
-                            _convert_utils.scs_to_blend_matrix().inverted() @
-                            scale_matrix.inverted() @
-                            bone_rest_mat @
-                            mat @
-                            scale_removal_matrix.inverted())
+            frame_matrix = pre_frame_mat @ mat @ post_frame_mat
 
             # print('          actual_frame: %s - value: %s' % (actual_frame, frame_matrix))
             timings_stream.append(("__time__", scs_animation.length / total_frames), )
@@ -297,7 +271,7 @@ def _fill_channel_sections(data_list, channel_type="BoneChannel"):
     return sections
 
 
-def export(scs_root_obj, armature, scs_animation, dirpath, name_suffix, skeleton_filepath):
+def export(scs_root_obj, armature, scs_animation, dirpath, name_suffix, skeleton_filepath, armature_trans=None):
     """Exports PIA animation
 
     :param scs_root_obj: root object of current animation
@@ -312,6 +286,8 @@ def export(scs_root_obj, armature, scs_animation, dirpath, name_suffix, skeleton
     :type name_suffix: str
     :param skeleton_filepath: name of skeleton file that this animation works on
     :type skeleton_filepath: str
+    :param armature_trans: armature transitional structure shared by all animations of the armature; if None it's created for this export
+    :type armature_trans: io_scs_tools_mod.exp.transition_structs.armature.ArmatureTrans | None
     """
 
     # safety checks
@@ -330,7 +306,10 @@ def export(scs_root_obj, armature, scs_animation, dirpath, name_suffix, skeleton
     # DATA GATHERING
     total_time = scs_animation.length
     action = bpy.data.actions[scs_animation.action]
-    bone_channels = _get_bone_channels(scs_root_obj, armature, scs_animation, action, scs_globals.export_scale)
+    if armature_trans is None:
+        armature_trans = ArmatureTrans(scs_root_obj, armature, scs_globals.export_scale)
+
+    bone_channels = _get_bone_channels(armature, armature_trans, scs_animation, action)
     custom_channels = _get_custom_channels(scs_animation, action)
 
     # DATA CREATION
@@ -358,4 +337,5 @@ def export(scs_root_obj, armature, scs_animation, dirpath, name_suffix, skeleton
     filepath = os.path.join(dirpath, scs_animation.name + ".pia" + name_suffix)
 
     # print("************************************")
-    return _pix_container.write_data_to_file(pia_container, filepath, ind)
+    return _pix_container.write_data_to_file(pia_container, filepath, ind, background=True,
+                                             write_if_changed=scs_globals.export_write_if_changed)
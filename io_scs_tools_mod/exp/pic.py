@@ -19,12 +19,12 @@
 # Copyright (C) 2013-2014: SCS Software
 
 import bpy
-from mathutils import Vector, Matrix
+import numpy
+from mathutils import Matrix
 from io_scs_tools_mod.internals.structure import SectionData as _SectionData
 from io_scs_tools_mod.internals.containers import pix as _pix_container
 from io_scs_tools_mod.utils import convert as _convert_utils
 from io_scs_tools_mod.utils import name as _name_utils
-from io_scs_tools_mod.utils import mesh as _mesh_utils
 from io_scs_tools_mod.utils import get_scs_globals as _get_scs_globals
 from io_scs_tools_mod.utils.info import get_combined_ver_str
 from io_scs_tools_mod.utils.object import get_scs_root as _get_scs_root
@@ -69,14 +69,20 @@ def _fill_coll_material_section():
 def _fill_piece_sections(convex_coll_locators, export_scale):
     """Fills up "Piece" sections for convex colliders."""
 
+    # scs_position = Matrix.Scale(scs_globals.export_scale, 4) * io_utils.scs_to_blend_matrix().inverted() * mat_world * position ##
+    # transformation is the same for all of the convex vertices, so compute it only once and apply it on vertices as rows
+    transformation = numpy.array(Matrix.Scale(export_scale, 4) @ _convert_utils.scs_to_blend_matrix().inverted())
+    rotation_scale = transformation[:3, :3].T
+    translation = transformation[:3, 3]
+
     len_vertices = 0
     len_faces = 0
     piece_sections = []
     index = 0
     for item in convex_coll_locators:
         stream_cnt = 0
-        verts = item.scs_props.get("coll_convex_verts", 0)
-        faces = item.scs_props.get("coll_convex_faces", 0)
+        verts = item.scs_props.get("coll_convex_verts", ())
+        faces = item.scs_props.get("coll_convex_faces", ())
         if verts:
             stream_cnt += 1
 
@@ -93,18 +99,14 @@ def _fill_piece_sections(convex_coll_locators, export_scale):
 
         # VERTICES
         if verts:
-            vector_verts = []
-            for vert in verts:
-                # scs_position = Matrix.Scale(scs_globals.export_scale, 4) * io_utils.scs_to_blend_matrix().inverted() * mat_world * position ##
-                # POSITION
-                scs_position = Matrix.Scale(export_scale, 4) @ _convert_utils.scs_to_blend_matrix().inverted() @ Vector(vert)  # POSITION
-                vector_verts.append(Vector(scs_position))
-            section.sections.append(_pix_container.make_stream_section(vector_verts, "_POSITION", ()))
+            # POSITION
+            scs_positions = numpy.array(verts, dtype=numpy.float64) @ rotation_scale + translation
+            section.sections.append(_pix_container.make_stream_section(scs_positions, "_POSITION", (), data_format="FLOAT3"))
 
         # FACES (TRIANGLES)
         if faces:
             # FACE FLIPPING
-            flipped_faces = _mesh_utils.flip_faceverts(faces)
+            flipped_faces = numpy.array(faces, dtype=numpy.int64)[:, ::-1]
             section.sections.append(_pix_container.make_triangle_stream(flipped_faces))
 
         index += 1
@@ -302,7 +304,8 @@ def export(collision_locator_list, filepath, name_suffix, filename, used_parts):
     # FILE EXPORT
     ind = "    "
     pic_filepath = str(filepath + ".pic" + name_suffix)
-    result = _pix_container.write_data_to_file(pic_container, pic_filepath, ind)
+    result = _pix_container.write_data_to_file(pic_container, pic_filepath, ind, background=True,
+                                               write_if_changed=scs_globals.export_write_if_changed)
 
     # print("************************************")
     return result
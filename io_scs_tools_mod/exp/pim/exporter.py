@@ -38,6 +38,7 @@ from io_scs_tools_mod.internals.containers import pix as _pix_container
 from io_scs_tools_mod.utils import mesh as _mesh_utils
 from io_scs_tools_mod.utils import name as _name_utils
 from io_scs_tools_mod.utils import object as _object_utils
+from io_scs_tools_mod.utils import timing as _timing_utils
 from io_scs_tools_mod.utils import get_scs_globals as _get_scs_globals
 from io_scs_tools_mod.utils.convert import change_to_scs_uv_coordinates as _change_to_scs_uv_coordinates
 from io_scs_tools_mod.utils.convert import get_scs_transformation_components as _get_scs_transformation_components
@@ -49,6 +50,30 @@ _ZERO_NORMAL = Vector.Fill(3)
 """:type: Vector"""
 
 
+def _add_to_terrain_points_batch(terrain_points_batch, key, vert_i, position, normal):
+    """Adds vertex to terrain points batch of given variant and node, each vertex is added only once.
+
+    :param terrain_points_batch: terrain points batch, holding added vertex indices, positions and normals per variant and node
+    :type terrain_points_batch: dict[tuple[int, int], tuple[set[int], list[Vector], list[Vector]]]
+    :param key: variant index and node index
+    :type key: tuple[int, int]
+    :param vert_i: index of vertex in mesh
+    :type vert_i: int
+    :param position: position of vertex
+    :type position: Vector
+    :param normal: normal of vertex
+    :type normal: Vector
+    """
+    if key not in terrain_points_batch:
+        terrain_points_batch[key] = (set(), [], [])
+
+    vert_indices, positions, normals = terrain_points_batch[key]
+    if vert_i not in vert_indices:
+        vert_indices.add(vert_i)
+        positions.append(position)
+        normals.append(normal)
+
+
 def execute(dirpath, name_suffix, root_object, armature_object, skeleton_filepath, mesh_objects, model_locators,
             used_parts, used_materials, used_bones, used_terrain_points):
     """Executes export of PIM file for given data.
@@ -187,11 +212,13 @@ def execute(dirpath, name_suffix, root_object, armature_object, skeleton_filepat
         """:type: mathutils.Matrix"""
 
         # get initial mesh & extra copy of the mesh for normals
+        mesh_build_start = _timing_utils.start_stage()
         mesh = _object_utils.get_mesh(mesh_obj)
         mesh_for_normals = _mesh_utils.get_mesh_for_normals(mesh)
 
         # prepare meshes
         faces_mapping = _mesh_utils.bm_prepare_mesh_for_export(mesh, mesh_transf_mat, triangulate=True)
+        _timing_utils.end_stage("mesh build", mesh_build_start)
 
         # cache terrain points status, to avoid vertex group checking on each vertex if not present
         terrain_point_vert_groups_names = set()
@@ -208,7 +235,9 @@ def execute(dirpath, name_suffix, root_object, armature_object, skeleton_filepat
         has_unnormalized_skin = False  # indicates if object has vertices which bones weight sum is smaller then one
         last_tangents_uv_layer = None  # stores uv layer for which tangents were calculated, so tangents won't be calculated all over again
         max_vcolor = 0  # indicates maximum vertex color inside this model and is used to report unnormalized vertex color over 1.0
+        terrain_points_batch = {}  # stores terrain points of this object per variant and node, to be added to storage at once
 
+        streams_start = _timing_utils.start_stage()
         for poly in mesh.polygons:
 
             mat_index = poly.material_index
@@ -220,7 +249,7 @@ def execute(dirpath, name_suffix, root_object, armature_object, skeleton_filepat
                 pim_mat_effect = "eut2.dif"
                 objects_with_default_material[mesh_obj.name] = 1
             else:
-                material = mesh_obj.material_slots[mat_index].material
+                material = used_materials.get_equivalent(mesh_obj.material_slots[mat_index].material)
                 pim_mat_name = material.name
                 pim_mat_effect = material.scs_props.mat_effect_name
 
@@ -486,7 +515,7 @@ def execute(dirpath, name_suffix, root_object, armature_object, skeleton_filepat
 
                         # if no variants defined add globally (without variant block)
                         if len(root_object.scs_object_variant_inventory) == 0:
-                            used_terrain_points.add(-1, node_index, position, normal)
+                            _add_to_terrain_points_batch(terrain_points_batch, (-1, node_index), vert_i, position, normal)
                             continue
 
                         # finally iterate variant parts entries to find where this part is included
@@ -502,7 +531,7 @@ def execute(dirpath, name_suffix, root_object, armature_object, skeleton_filepat
                             for variant_part in variant.parts:
                                 if variant_part.name == mesh_obj.scs_props.scs_part and variant_part.include:
 
-                                    used_terrain_points.add(variant_i, node_index, position, normal)
+                                    _add_to_terrain_points_batch(terrain_points_batch, (variant_i, node_index), vert_i, position, normal)
                                     break
 
             # triangles
@@ -511,10 +540,16 @@ def execute(dirpath, name_suffix, root_object, armature_object, skeleton_filepat
             else:
                 mesh_piece.add_triangle(tuple(triangle_pvert_indices[::-1]))  # yep it's weird but it simply works vice versa
 
+        _timing_utils.end_stage("streams", streams_start)
+
         # free normals calculations & remove temporary mesh
         _mesh_utils.cleanup_mesh(mesh_for_normals)
         mesh_obj.to_mesh_clear()
 
+        # save collected terrain points to transitional structure
+        for (variant_i, node_index), (tp_vert_indices, tp_positions, tp_normals) in terrain_points_batch.items():
+            used_terrain_points.add_many(variant_i, node_index, tp_positions, tp_normals)
+
         # report missing data for each object
         if len(missing_uv_layers) > 0:
             for uv_lay_name in missing_uv_layers:
@@ -640,4 +675,5 @@ def execute(dirpath, name_suffix, root_object, armature_object, skeleton_filepat
     ind = "    "
     pim_filepath = os.path.join(dirpath, root_object.name + ".pim" + name_suffix)
     lprint("I Writting PIM file to %r ...", (pim_filepath,), immediate_timeout=0)
-    return _pix_container.write_data_to_file(pim_container, pim_filepath, ind, print_progress=True)
+    return _pix_container.write_data_to_file(pim_container, pim_filepath, ind, print_progress=True, background=True,
+                                             write_if_changed=scs_globals.export_write_if_changed)
@@ -203,7 +203,7 @@ def execute(dirpath, name_suffix, root_object, armature_object, skeleton_filepat
                 pim_mat_effect = "eut2.dif"
                 objects_with_default_material[mesh_obj.name] = 1
             else:
-                material = mesh_obj.material_slots[mat_index].material
+                material = used_materials.get_equivalent(mesh_obj.material_slots[mat_index].material)
                 pim_mat_name = material.name
                 pim_mat_effect = material.scs_props.mat_effect_name
 
@@ -530,4 +530,5 @@ def execute(dirpath, name_suffix, root_object, armature_object, skeleton_filepat
     ind = "    "
     pim_filepath = os.path.join(dirpath, root_object.name + ".pim" + name_suffix)
     lprint("I Writting PIM file to %r ...", (pim_filepath,), immediate_timeout=0)
-    return _pix_container.write_data_to_file(pim_container, pim_filepath, ind, print_progress=True)
+    return _pix_container.write_data_to_file(pim_container, pim_filepath, ind, print_progress=True, background=True,
+                                             write_if_changed=scs_globals.export_write_if_changed)
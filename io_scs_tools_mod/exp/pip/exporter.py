@@ -34,6 +34,7 @@ from io_scs_tools_mod.exp.pip.spawn_point import SpawnPoint
 from io_scs_tools_mod.exp.pip.trigger_point import TriggerPoint
 from io_scs_tools_mod.internals.containers import pix as _pix_container
 from io_scs_tools_mod.internals.connections.wrappers import collection as _connections_wrapper
+from io_scs_tools_mod.utils import get_scs_globals as _get_scs_globals
 from io_scs_tools_mod.utils.convert import get_scs_transformation_components as _get_scs_transformation_components
 from io_scs_tools_mod.utils.name import tokenize_name as _tokenize_name
 from io_scs_tools_mod.utils.printout import lprint
@@ -526,5 +527,6 @@ def execute(dirpath, filename, name_suffix, prefab_locator_list, offset_matrix,
     ind = "    "
     pip_filepath = path.join(dirpath, str(filename + ".pip" + name_suffix))
     lprint("I Writting PIP file to %r ...", (pip_filepath,), immediate_timeout=0)
-    result = _pix_container.write_data_to_file(pip_container, pip_filepath, ind, print_progress=True)
+    result = _pix_container.write_data_to_file(pip_container, pip_filepath, ind, print_progress=True, background=True,
+                                               write_if_changed=_get_scs_globals().export_write_if_changed)
     return result
@@ -53,15 +53,21 @@ def _fill_global_section(bone_cnt):
 def _fill_bones_sections(scs_root_obj, armature_obj, used_bones, export_scale):
     """Creates "Bones" section."""
     section = _SectionData("Bones")
-    for bone_name in used_bones:
-        bone = armature_obj.data.bones[bone_name]
 
-        # armature matrix stores transformation of armature object against scs root
-        # and has to be added to all bones as they only armature space transformations
-        armature_mat = scs_root_obj.matrix_world.inverted() @ armature_obj.matrix_world
+    # armature matrix stores transformation of armature object against scs root
+    # and has to be added to all bones as they only armature space transformations
+    armature_mat = scs_root_obj.matrix_world.inverted() @ armature_obj.matrix_world
+
+    # transformation is the same for all of the bones, so compute it only once
+    armature_scs_mat = Matrix.Scale(export_scale, 4) @ _convert_utils.scs_to_blend_matrix().inverted() @ armature_mat
+
+    bones = armature_obj.data.bones
+    for bone_name in used_bones:
+        bone = bones[bone_name]
 
-        bone_mat = (Matrix.Scale(export_scale, 4) @ _convert_utils.scs_to_blend_matrix().inverted() @ armature_mat @ bone.matrix_local)
-        section.data.append(("__bone__", bone.name, bone.parent, bone_mat.transposed()))
+        bone_mat = armature_scs_mat @ bone.matrix_local
+        bone_parent_name = bone.parent.name if bone.parent else ""
+        section.data.append(("__bone__", bone.name, bone_parent_name, bone_mat.transposed()))
     return section
 
 
@@ -83,7 +89,8 @@ def export(filepath, scs_root_obj, armature_object, used_bones):
 
     # FILE EXPORT
     ind = "    "
-    result = _pix_container.write_data_to_file(pis_container, filepath, ind)
+    result = _pix_container.write_data_to_file(pis_container, filepath, ind, background=True,
+                                               write_if_changed=scs_globals.export_write_if_changed)
 
     # print("************************************")
     return result
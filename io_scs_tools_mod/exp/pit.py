@@ -657,7 +657,8 @@ def export(root_object, filepath, name_suffix, used_parts, used_materials):
     # FILE EXPORT
     ind = "    "
     pit_filepath = str(filepath + ".pit" + name_suffix)
-    result = _pix_container.write_data_to_file(pit_container, pit_filepath, ind)
+    result = _pix_container.write_data_to_file(pit_container, pit_filepath, ind, background=True,
+                                               write_if_changed=scs_globals.export_write_if_changed)
 
     # print("************************************")
     return result
@@ -20,9 +20,11 @@
 
 import bpy
 import os
+from io_scs_tools_mod.internals.containers import pix as _pix_container
 from io_scs_tools_mod.utils import path as _path_utils
 from io_scs_tools_mod.utils import object as _object_utils
 from io_scs_tools_mod.utils import get_scs_globals as _get_scs_globals
+from io_scs_tools_mod.utils import timing as _timing_utils
 from io_scs_tools_mod.utils.printout import lprint
 from io_scs_tools_mod.exp import pia as _pia
 from io_scs_tools_mod.exp import pic as _pic
@@ -32,6 +34,7 @@ from io_scs_tools_mod.exp import pit_ef as _pit_ef
 from io_scs_tools_mod.exp.pim import exporter as _pim_exporter
 from io_scs_tools_mod.exp.pim_ef import exporter as _pim_ef_exporter
 from io_scs_tools_mod.exp.pip import exporter as _pip_exporter
+from io_scs_tools_mod.exp.transition_structs.armature import ArmatureTrans
 from io_scs_tools_mod.exp.transition_structs.bones import BonesTrans
 from io_scs_tools_mod.exp.transition_structs.materials import MaterialsTrans
 from io_scs_tools_mod.exp.transition_structs.parts import PartsTrans
@@ -160,93 +163,122 @@ def export(dirpath, name_suffix, root_object, game_object_list):
     scs_globals = _get_scs_globals()
     export_success = True
 
-    # EXPORT PIM
-    if scs_globals.export_pim_file:
-        in_args = (dirpath, name_suffix, root_object, armature_object, skeleton_filepath, mesh_objects, model_locators)
-        trans_structs_args = (parts, materials, bones, terrain_points)
+    with _timing_utils.operation("export of %r" % root_object.name):
 
-        if scs_globals.export_output_type == "5":
-            export_success = _pim_exporter.execute(*(in_args + trans_structs_args))
-        elif scs_globals.export_output_type == "EF":
-            export_success = _pim_ef_exporter.execute(*(in_args + trans_structs_args))
-        else:
-            export_success = False
-
-        # EXPORT PIC
-        if scs_globals.export_pic_file and export_success:
-            if collision_locators:
-                in_args = (collision_locators, dirpath + os.sep + root_object.name, name_suffix, root_object.name)
-                trans_structs_args = (parts,)
-                export_success = _pic.export(*(in_args + trans_structs_args))
-            else:
-                lprint("I No collider locator objects to export.")
-
-    # EXPORT PIP
-    if scs_globals.export_pip_file and prefab_locators and export_success:
-        in_args = (dirpath, root_object.name, name_suffix, prefab_locators, root_object.matrix_world)
-        trans_structs_args = (parts, terrain_points)
-        export_success = _pip_exporter.execute(*(in_args + trans_structs_args))
-
-    # EXPORT PIT
-    if scs_globals.export_pit_file and export_success:
-        in_args = (root_object, dirpath + os.sep + root_object.name, name_suffix)
-        trans_structs_args = (parts, materials)
-
-        if scs_globals.export_output_type == "5":
-            export_success = _pit.export(*(in_args + trans_structs_args))
-        elif scs_globals.export_output_type == "EF":
-            export_success = _pit_ef.export(*(in_args + trans_structs_args))
-        else:
-            export_success = False
-
-    # PIS, PIA
-    if root_object.scs_props.scs_root_animated == 'anim':
-        # EXPORT PIS
-        if scs_globals.export_pis_file and bones.are_present() and export_success:
-            export_success = _pis.export(os.path.join(dirpath, skeleton_filepath), root_object, armature_object, bones.get_as_list())
-
-        # EXPORT PIA
-        if scs_globals.export_pia_file and bones.are_present() and export_success:
-
-            anim_dirpath = _path_utils.get_animations_relative_filepath(root_object, dirpath)
-
-            if anim_dirpath is not None:
-
-                anim_dirpath = os.path.join(dirpath, anim_dirpath)
-                # make sure to get relative path from PIA to PIS (animations may use custom export path)
-                skeleton_filepath = _path_utils.get_skeleton_relative_filepath(armature_object, anim_dirpath, root_object.name) + name_suffix
-
-                exported_anims_names = {}  # store exported animations paths, so we can report duplicates and overwrites
-
-                for scs_anim in root_object.scs_object_animation_inventory:
-
-                    if scs_anim.export:  # check if export is disabled on animation itself
-
-                        # TODO: use bones transitional variable for safety checks
-                        export_success = _pia.export(root_object, armature_object, scs_anim, anim_dirpath, name_suffix, skeleton_filepath)
-
-                        if export_success:
-
-                            if scs_anim.name not in exported_anims_names:
-                                exported_anims_names[scs_anim.name] = 1
-                            else:
-                                exported_anims_names[scs_anim.name] += 1
-
-                for anim_name, export_count in exported_anims_names.items():
-
-                    if export_count > 1:
-
-                        lprint("W Detected %s animation instances on SCS Root Object: %r with same name: %r.\n\t   "
-                               "Only last one stayed exported as it overwrote previous ones!",
-                               (export_count, root_object.name, anim_name))
-
-            else:
-                lprint("E Custom animations export path is not relative to SCS Project Base Path.\n\t   " +
-                       "Animations won't be exported!")
-
-    elif armature_object and len(root_object.scs_object_animation_inventory) > 0:
-        lprint("W Armature and SCS Animations detected but not exported! If you are exporting animated model,\n\t   " +
-               "make sure to switch SCS Root Object %r to 'Animated Model'!", (root_object.name,))
+        # merge equivalent materials, so they are exported only once
+        if scs_globals.export_merge_equivalent_materials:
+            with _timing_utils.stage("material merge"):
+                merged_count = materials.merge_equivalent(root_object, mesh_objects)
+
+            if merged_count > 0:
+                lprint("I Equivalent materials merged on export:\n\t   %s",
+                       ("\n\t   ".join("%r -> %r" % pair for pair in materials.get_merged_pairs()),))
+
+        # write files on background thread, while data for next files are gathered
+        _pix_container.begin_background_writing()
+        try:
+
+            # EXPORT PIM
+            if scs_globals.export_pim_file:
+                in_args = (dirpath, name_suffix, root_object, armature_object, skeleton_filepath, mesh_objects, model_locators)
+                trans_structs_args = (parts, materials, bones, terrain_points)
+
+                with _timing_utils.stage("pim export"):
+                    if scs_globals.export_output_type == "5":
+                        export_success = _pim_exporter.execute(*(in_args + trans_structs_args))
+                    elif scs_globals.export_output_type == "EF":
+                        export_success = _pim_ef_exporter.execute(*(in_args + trans_structs_args))
+                    else:
+                        export_success = False
+
+                # EXPORT PIC
+                if scs_globals.export_pic_file and export_success:
+                    if collision_locators:
+                        in_args = (collision_locators, dirpath + os.sep + root_object.name, name_suffix, root_object.name)
+                        trans_structs_args = (parts,)
+                        with _timing_utils.stage("pic export"):
+                            export_success = _pic.export(*(in_args + trans_structs_args))
+                    else:
+                        lprint("I No collider locator objects to export.")
+
+            # EXPORT PIP
+            if scs_globals.export_pip_file and prefab_locators and export_success:
+                in_args = (dirpath, root_object.name, name_suffix, prefab_locators, root_object.matrix_world)
+                trans_structs_args = (parts, terrain_points)
+                with _timing_utils.stage("pip export"):
+                    export_success = _pip_exporter.execute(*(in_args + trans_structs_args))
+
+            # EXPORT PIT
+            if scs_globals.export_pit_file and export_success:
+                in_args = (root_object, dirpath + os.sep + root_object.name, name_suffix)
+                trans_structs_args = (parts, materials)
+
+                with _timing_utils.stage("pit export"):
+                    if scs_globals.export_output_type == "5":
+                        export_success = _pit.export(*(in_args + trans_structs_args))
+                    elif scs_globals.export_output_type == "EF":
+                        export_success = _pit_ef.export(*(in_args + trans_structs_args))
+                    else:
+                        export_success = False
+
+            # PIS, PIA
+            if root_object.scs_props.scs_root_animated == 'anim':
+                # EXPORT PIS
+                if scs_globals.export_pis_file and bones.are_present() and export_success:
+                    with _timing_utils.stage("pis export"):
+                        export_success = _pis.export(os.path.join(dirpath, skeleton_filepath), root_object, armature_object, bones.get_as_list())
+
+                # EXPORT PIA
+                if scs_globals.export_pia_file and bones.are_present() and export_success:
+
+                    anim_dirpath = _path_utils.get_animations_relative_filepath(root_object, dirpath)
+
+                    if anim_dirpath is not None:
+
+                        anim_dirpath = os.path.join(dirpath, anim_dirpath)
+                        # make sure to get relative path from PIA to PIS (animations may use custom export path)
+                        skeleton_filepath = _path_utils.get_skeleton_relative_filepath(armature_object, anim_dirpath, root_object.name) + name_suffix
+
+                        exported_anims_names = {}  # store exported animations paths, so we can report duplicates and overwrites
+
+                        # armature invariants are the same for all of the animations, so create them only once
+                        armature_trans = ArmatureTrans(root_object, armature_object, scs_globals.export_scale)
+
+                        for scs_anim in root_object.scs_object_animation_inventory:
+
+                            if scs_anim.export:  # check if export is disabled on animation itself
+
+                                # TODO: use bones transitional variable for safety checks
+                                with _timing_utils.stage("pia export"):
+                                    export_success = _pia.export(root_object, armature_object, scs_anim, anim_dirpath, name_suffix, skeleton_filepath,
+                                                                 armature_trans=armature_trans)
+
+                                if export_success:
+
+                                    if scs_anim.name not in exported_anims_names:
+                                        exported_anims_names[scs_anim.name] = 1
+                                    else:
+                                        exported_anims_names[scs_anim.name] += 1
+
+                        for anim_name, export_count in exported_anims_names.items():
+
+                            if export_count > 1:
+
+                                lprint("W Detected %s animation instances on SCS Root Object: %r with same name: %r.\n\t   "
+                                       "Only last one stayed exported as it overwrote previous ones!",
+                                       (export_count, root_object.name, anim_name))
+
+                    else:
+                        lprint("E Custom animations export path is not relative to SCS Project Base Path.\n\t   " +
+                               "Animations won't be exported!")
+
+            elif armature_object and len(root_object.scs_object_animation_inventory) > 0:
+                lprint("W Armature and SCS Animations detected but not exported! If you are exporting animated model,\n\t   " +
+                       "make sure to switch SCS Root Object %r to 'Animated Model'!", (root_object.name,))
+
+        finally:
+            # WAIT FOR ALL FILES TO BE WRITTEN, even if export failed, so no file is left queued
+            export_success = _pix_container.end_background_writing() and export_success
 
     # FINAL FEEDBACK
     context.window.cursor_modal_restore()
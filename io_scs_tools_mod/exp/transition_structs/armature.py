@@ -0,0 +1,108 @@
+# ##### BEGIN GPL LICENSE BLOCK #####
+#
+# This program is free software; you can redistribute it and/or
+# modify it under the terms of the GNU General Public License
+# as published by the Free Software Foundation; either version 2
+# of the License, or (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program; if not, write to the Free Software Foundation,
+# Inc., 51 Franklin Street, Fifth Floor, Boston, MA 02110-1301, USA.
+#
+# ##### END GPL LICENSE BLOCK #####
+
+from mathutils import Matrix
+from io_scs_tools_mod.utils import convert as _convert_utils
+
+
+class ArmatureTrans:
+    """Transitional armature class for storing armature invariants during export.
+    This storage shall be created once per export and then used by PIA exporter for all of the animations,
+    so rest matrices of bones and their inverses are computed only once per armature.
+    """
+
+    def __init__(self, scs_root_obj, armature, export_scale):
+        """Creates class instance of armature transitional structure.
+
+        :param scs_root_obj: scs root object of the armature
+        :type scs_root_obj: bpy.types.Object
+        :param armature: armature object
+        :type armature: bpy.types.Object
+        :param export_scale: export scale
+        :type export_scale: float
+        """
+        self.__armature = armature
+        """:type: bpy.types.Object"""
+        self.__export_scale = export_scale
+        """:type: float"""
+
+        # armature matrix stores transformation of armature object against scs root
+        # and has to be added to all bones as they only armature space transformations
+        self.__armature_mat = scs_root_obj.matrix_world.inverted() @ armature.matrix_world
+        """:type: mathutils.Matrix"""
+
+        self.__scale_mat = Matrix.Scale(export_scale, 4)
+        """:type: mathutils.Matrix"""
+        self.__scs_to_blend_mat_inv = _convert_utils.scs_to_blend_matrix().inverted()
+        """:type: mathutils.Matrix"""
+
+        self.__bone_names = [bone.name for bone in armature.data.bones]
+        """:type: list[str]"""
+        self.__bones_rest_data = {}
+        """:type: dict[str, tuple[mathutils.Matrix, mathutils.Matrix]]"""
+
+    def get_bone_names(self):
+        """Get names of all armature bones in armature order.
+
+        :return: bone names
+        :rtype: list[str]
+        """
+        return self.__bone_names
+
+    def get_bone_rest_data(self, bone_name):
+        """Get rest matrices of the bone needed for computing SCS frame matrix from Blender frame matrix as:
+        frame_matrix = pre_frame_mat @ blender_frame_mat @ post_frame_mat
+        Matrices are computed on first request and reused afterwards.
+
+        :param bone_name: name of the bone
+        :type bone_name: str
+        :return: pre frame and post frame matrices
+        :rtype: tuple[mathutils.Matrix, mathutils.Matrix]
+        """
+        if bone_name in self.__bones_rest_data:
+            return self.__bones_rest_data[bone_name]
+
+        bone = self.__armature.data.bones[bone_name]
+        export_scale = self.__export_scale
+
+        bone_rest_mat = self.__armature_mat @ bone.matrix_local
+        if bone.parent:
+            parent_bone_rest_mat = (self.__scale_mat @
+                                    self.__scs_to_blend_mat_inv @
+                                    self.__armature_mat @
+                                    bone.parent.matrix_local)
+        else:
+            parent_bone_rest_mat = Matrix()
+
+        # SCALE REMOVAL MATRIX
+        rest_location, rest_rotation, rest_scale = bone_rest_mat.decompose()
+        rest_scale = rest_scale * export_scale
+        scale_removal_matrix = Matrix()
+        scale_removal_matrix[0] = (1.0 / rest_scale[0], 0, 0, 0)
+        scale_removal_matrix[1] = (0, 1.0 / rest_scale[1], 0, 0)
+        scale_removal_matrix[2] = (0, 0, 1.0 / rest_scale[2], 0)
+        scale_removal_matrix[3] = (0, 0, 0, 1)
+
+        pre_frame_mat = (parent_bone_rest_mat.inverted() @
+                         self.__scs_to_blend_mat_inv @
+                         self.__scale_mat.inverted() @
+                         bone_rest_mat)
+        post_frame_mat = scale_removal_matrix.inverted()
+
+        self.__bones_rest_data[bone_name] = (pre_frame_mat, post_frame_mat)
+        return self.__bones_rest_data[bone_name]
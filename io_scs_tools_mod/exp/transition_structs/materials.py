@@ -20,6 +20,12 @@
 
 
 from collections import OrderedDict
+from hashlib import sha1
+from io_scs_tools_mod.internals import looks as _looks
+from io_scs_tools_mod.utils import property as _property_utils
+
+_IGNORED_PROPS_SUFFIXES = ("mat_id", "_tobj_load_time")
+"""Material properties suffixes which don't have any influence on exported material and are ignored in content hash."""
 
 
 class MaterialsTrans:
@@ -32,6 +38,62 @@ class MaterialsTrans:
         """
         self.__storage = OrderedDict()
         """:type: collections.OrderedDict[str, bpy.types.Material]"""
+        self.__equivalents = {}
+        """:type: dict[str, bpy.types.Material]"""
+        """Names of merged materials mapped to equivalent material which should be exported instead of them."""
+
+    def merge_equivalent(self, root_object, mesh_objects):
+        """Finds materials with equal content among materials used on given mesh objects.
+        Material content is compared in all looks of given root object, together with imported shader data.
+        Each group of equivalent materials is afterwards exported as one material, the one with lowest name,
+        so mapping stays the same from export to export.
+
+        :param root_object: SCS root object of exported game object
+        :type root_object: bpy.types.Object
+        :param mesh_objects: mesh objects of exported game object
+        :type mesh_objects: collections.abc.Iterable[bpy.types.Object]
+        :return: number of materials which will be merged into their equivalents
+        :rtype: int
+        """
+
+        materials = {}
+        for mesh_obj in mesh_objects:
+            for slot in mesh_obj.material_slots:
+                if slot.material:
+                    materials[slot.material.name] = slot.material
+
+        canonical_materials = {}
+        for material_name in sorted(materials):
+            material = materials[material_name]
+            canonical_material = canonical_materials.setdefault(self.__get_content_hash__(root_object, material), material)
+
+            if canonical_material != material:
+                self.__equivalents[material_name] = canonical_material
+
+        return len(self.__equivalents)
+
+    def get_equivalent(self, material):
+        """Gets material which should be exported instead of given one.
+
+        :param material: Blender material
+        :type material: bpy.types.Material | None
+        :return: equivalent material if given material was merged; given material otherwise
+        :rtype: bpy.types.Material | None
+        """
+
+        if material is None:
+            return None
+
+        return self.__equivalents.get(material.name, material)
+
+    def get_merged_pairs(self):
+        """Returns names of merged materials paired with names of materials they were merged into.
+
+        :return: pairs of merged material name and equivalent material name
+        :rtype: list[tuple[str, str]]
+        """
+
+        return [(material_name, self.__equivalents[material_name].name) for material_name in sorted(self.__equivalents)]
 
     def add(self, material_name, material):
         """Adds material to storage.
@@ -58,3 +120,50 @@ class MaterialsTrans:
             pairs.append((material_name, self.__storage[material_name]))
 
         return pairs
+
+    @staticmethod
+    def __get_content_hash__(root_object, material):
+        """Calculates hash of all material data which ends up in exported material.
+
+        :param root_object: SCS root object holding looks of given material
+        :type root_object: bpy.types.Object
+        :param material: Blender material
+        :type material: bpy.types.Material
+        :return: content hash of given material
+        :rtype: str
+        """
+
+        scs_props = {}
+        if "scs_props" in material:
+            for prop_name, prop_value in material["scs_props"].items():
+                if not prop_name.endswith(_IGNORED_PROPS_SUFFIXES):
+                    scs_props[prop_name] = _property_utils.get_id_prop_as_py_object(prop_value)
+
+        shader_attributes = None
+        if "scs_shader_attributes" in material:
+            shader_attributes = _property_utils.get_id_prop_as_py_object(material["scs_shader_attributes"])
+
+        look_entries = _looks.get_material_entries(root_object, material)
+        for mat_entries in look_entries.values():
+            for prop_name in [prop_name for prop_name in mat_entries if prop_name.endswith(_IGNORED_PROPS_SUFFIXES)]:
+                del mat_entries[prop_name]
+
+        content = (__to_hashable__(scs_props), __to_hashable__(shader_attributes), __to_hashable__(look_entries))
+        return sha1(repr(content).encode("utf-8")).hexdigest()
+
+
+def __to_hashable__(value):
+    """Converts native python object to nested tuples with sorted dictionary items, so equal content gives equal representation.
+
+    :param value: native python object, as returned from ID property conversion
+    :type value: any
+    :return: value with all dictionaries and lists converted to tuples
+    :rtype: any
+    """
+
+    if isinstance(value, dict):
+        return tuple((key, __to_hashable__(value[key])) for key in sorted(value))
+    elif isinstance(value, (list, tuple)):
+        return tuple(__to_hashable__(item) for item in value)
+    else:
+        return value
@@ -19,12 +19,21 @@
 # Copyright (C) 2015: SCS Software
 
 import math
+import numpy
 from io_scs_tools_mod.consts import PrefabLocators as _PL_consts
 
+_CELL_KEY_SIZE = 1 << 20
+"""Number of possible values of each cell coordinate inside cell key used for bulk insertion."""
+_CELL_KEY_OFFSET = _CELL_KEY_SIZE >> 1
+"""Offset of cell coordinates inside cell key, so negative coordinates can be encoded."""
+
 
 class TerrainPntsTrans:
     """Transitional terrain points class for storing terrain points position and normal per variant index and node index.
     This storage shall be use to collect&store terrain points in PIM exporter and then use it in PIP exporter.
+
+    Points closer than minimal terrain points distance are considered the same point, so for quick search of
+    already stored points each (variant, node) entry has uniform grid with cell size of minimal distance.
     """
 
     class Entry:
@@ -38,12 +47,52 @@ class TerrainPntsTrans:
                                  pow(self.position[2] - other.position[2], 2))
             return distance < _PL_consts.TERRAIN_POINTS_MIN_DISTANCE
 
+    @staticmethod
+    def __get_cell__(position):
+        """Gets grid cell of given position.
+
+        :param position: position of terrain point
+        :type position: Vector | tuple[float]
+        :return: integer coordinates of the grid cell
+        :rtype: tuple[int]
+        """
+        cell_size = _PL_consts.TERRAIN_POINTS_MIN_DISTANCE
+        return (math.floor(position[0] / cell_size),
+                math.floor(position[1] / cell_size),
+                math.floor(position[2] / cell_size))
+
     def __init__(self):
         """Creates class instance of terrain points transitional structure.
         """
 
         self.__storage = {}
-        """:type: dict[str, list[TerrainPntsTrans.Entry]]"""
+        """:type: dict[tuple[int, int], list[TerrainPntsTrans.Entry]]"""
+
+        self.__grids = {}
+        """:type: dict[tuple[int, int], dict[tuple[int], list[TerrainPntsTrans.Entry]]]"""
+
+        self.__node_variants = {}
+        """:type: dict[int, dict[int, list[TerrainPntsTrans.Entry]]]"""
+
+    def __ensure__(self, key):
+        """Ensures storage, grid and node map entries for given (variant index, node index) key.
+
+        :param key: variant index and node index
+        :type key: tuple[int, int]
+        :return: list of stored terrain points and grid of them
+        :rtype: tuple[list[TerrainPntsTrans.Entry], dict[tuple[int], list[TerrainPntsTrans.Entry]]]
+        """
+
+        if key not in self.__storage:
+            variant_index, node_index = key
+            self.__storage[key] = []
+            self.__grids[key] = {}
+
+            if node_index not in self.__node_variants:
+                self.__node_variants[node_index] = {}
+            self.__node_variants[node_index][variant_index] = self.__storage[key]
+
+        return self.__storage[key], self.__grids[key]
 
     def add(self, variant_index, node_index, position, normal):
         """Adds new terrain point to storage.
@@ -58,14 +107,119 @@ class TerrainPntsTrans:
         :type normal: Vector
         """
 
-        key = str(variant_index) + ":" + str(node_index)
-        if key not in self.__storage:
-            self.__storage[key] = []
+        entries, grid = self.__ensure__((variant_index, node_index))
+        TerrainPntsTrans.__add_entry__(entries, grid, position, normal, TerrainPntsTrans.__get_cell__(position))
+
+    @staticmethod
+    def __add_entry__(entries, grid, position, normal, cell):
+        """Adds terrain point to given entries and grid, if there is no near point stored already.
+
+        :param entries: stored terrain points of (variant, node)
+        :type entries: list[TerrainPntsTrans.Entry]
+        :param grid: grid of stored terrain points of (variant, node)
+        :type grid: dict[tuple[int], list[TerrainPntsTrans.Entry]]
+        :param position: position of terrain point
+        :type position: Vector
+        :param normal: normal of terrain point
+        :type normal: Vector
+        :param cell: grid cell of terrain point position
+        :type cell: tuple[int] | list[int]
+        """
 
-        # save only unique position points
+        # save only unique position points, near points can only be in the same or neighbour cells
         tp_entry = TerrainPntsTrans.Entry(position, normal)
-        if tp_entry not in self.__storage[key]:
-            self.__storage[key].append(tp_entry)
+        for x in range(cell[0] - 1, cell[0] + 2):
+            for y in range(cell[1] - 1, cell[1] + 2):
+                for z in range(cell[2] - 1, cell[2] + 2):
+                    neighbour = grid.get((x, y, z))
+                    if neighbour and tp_entry in neighbour:
+                        return
+
+        cell = tuple(cell)
+        if cell not in grid:
+            grid[cell] = [tp_entry]
+        else:
+            grid[cell].append(tp_entry)
+
+        entries.append(tp_entry)
+
+    @staticmethod
+    def __get_isolated__(cells, grid):
+        """Finds points which are the only point inside neighbourhood of their cell, considering given points
+        and points already stored in grid. Such points can't be near any other point, so they can be stored without distance checks.
+
+        :param cells: grid cells of points as array of shape (n, 3)
+        :type cells: numpy.ndarray
+        :param grid: grid of already stored terrain points
+        :type grid: dict[tuple[int], list[TerrainPntsTrans.Entry]]
+        :return: boolean array telling for each point if it's isolated
+        :rtype: numpy.ndarray
+        """
+
+        stored_cells = numpy.array(list(grid.keys()), dtype=numpy.int64).reshape(-1, 3)
+
+        # cells too far away can't be encoded into keys, so rather check all points one by one
+        for arr in (cells, stored_cells):
+            if arr.size and (arr.min() <= -_CELL_KEY_OFFSET or arr.max() >= _CELL_KEY_OFFSET - 1):
+                return numpy.zeros(len(cells), dtype=bool)
+
+        def encode(arr):
+            arr = arr + _CELL_KEY_OFFSET
+            return (arr[:, 0] * _CELL_KEY_SIZE + arr[:, 1]) * _CELL_KEY_SIZE + arr[:, 2]
+
+        def is_occupied(query_keys, sorted_keys):
+            if len(sorted_keys) == 0:
+                return numpy.zeros(len(query_keys), dtype=bool)
+            indices = numpy.minimum(numpy.searchsorted(sorted_keys, query_keys), len(sorted_keys) - 1)
+            return sorted_keys[indices] == query_keys
+
+        keys, inverse, counts = numpy.unique(encode(cells), return_inverse=True, return_counts=True)
+        stored_keys = numpy.unique(encode(stored_cells))
+        occupied_keys = numpy.union1d(keys, stored_keys)
+
+        # own cell can be occupied only by the point itself, neighbour cells can't be occupied at all
+        isolated = (counts == 1) & ~is_occupied(keys, stored_keys)
+        for x in (-1, 0, 1):
+            for y in (-1, 0, 1):
+                for z in (-1, 0, 1):
+                    if x == y == z == 0:
+                        continue
+                    isolated &= ~is_occupied(keys + (x * _CELL_KEY_SIZE + y) * _CELL_KEY_SIZE + z, occupied_keys)
+
+        return isolated[inverse.reshape(-1)]
+
+    def add_many(self, variant_index, node_index, positions, normals):
+        """Adds multiple terrain points to storage at once, for example all points of one vertex group.
+        Grid cells of all the points are computed at once and points alone in their cell neighbourhood
+        are stored directly, only the rest of the points is checked for near points one by one in given order.
+
+        :param variant_index:
+        :type variant_index: int
+        :param node_index:
+        :type node_index: int
+        :param positions: positions of terrain points
+        :type positions: collections.abc.Sequence[Vector]
+        :param normals: normals of terrain points, in the same order as positions
+        :type normals: collections.abc.Sequence[Vector]
+        """
+
+        entries, grid = self.__ensure__((variant_index, node_index))
+
+        if len(positions) == 0:
+            return
+
+        cells = numpy.floor(numpy.array(positions, dtype=numpy.float64) / _PL_consts.TERRAIN_POINTS_MIN_DISTANCE).astype(numpy.int64)
+        isolated = TerrainPntsTrans.__get_isolated__(cells, grid)
+
+        for position, normal, cell, is_isolated in zip(positions, normals, cells.tolist(), isolated.tolist()):
+
+            if not is_isolated:
+                TerrainPntsTrans.__add_entry__(entries, grid, position, normal, cell)
+                continue
+
+            tp_entry = TerrainPntsTrans.Entry(position, normal)
+            grid[tuple(cell)] = [tp_entry]
+            entries.append(tp_entry)
 
     def ensure_entry(self, variant_index, node_index):
         """Ensures that variant in given node is present.
@@ -78,9 +232,7 @@ class TerrainPntsTrans:
         :rtype:
         """
 
-        key = str(variant_index) + ":" + str(node_index)
-        if key not in self.__storage:
-            self.__storage[key] = []
+        self.__ensure__((variant_index, node_index))
 
     def get(self, node_index):
         """Get terrain point for given node index.
@@ -91,13 +243,4 @@ class TerrainPntsTrans:
         :rtype: dict[int, list[TerrainPntsTrans.Entry]]
         """
 
-        tp_dict = {}
-
-        for key in self.__storage:
-
-            variant_i, node = key.split(":")
-            if int(node) == node_index:
-
-                tp_dict[int(variant_i)] = self.__storage[key]
-
-        return tp_dict
+        return dict(self.__node_variants.get(node_index, {}))
@@ -211,7 +211,7 @@ def load(root_object, pia_files, armature, pis_filepath=None, bones=None):
                 path = os.path.split(pia_filepath)[0]
                 pia_skeleton = os.path.join(path, pia_skeleton)
                 if os.path.isfile(pia_skeleton):
-                    bones = _pis.load(pia_skeleton, armature, get_only=True)
+                    bones = _pis.load(pia_skeleton)
                 else:
                     lprint("\nE The filepath %r doesn't exist!", (_path_utils.readable_norm(pia_skeleton),))
 
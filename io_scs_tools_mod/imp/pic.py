@@ -232,7 +232,7 @@ def _get_locator_part(parts, index):
     return "defaultpart"
 
 
-def load(filepath):
+def load(filepath, unique_names=None):
     scs_globals = _get_scs_globals()
 
     print("\n************************************")
@@ -323,7 +323,8 @@ def load(filepath):
              locator_parameters,
              locator_convex_piece) = _get_locator(section)
             lprint('I Adding a Locator: "%s"', locator_name)
-            locator = _object_utils.create_locator_empty(locator_name, locator_position, locator_rotation, (1, 1, 1), 1.0, 'Collision')
+            locator = _object_utils.create_locator_empty(locator_name, locator_position, locator_rotation, (1, 1, 1), 1.0, 'Collision',
+                                                           unique_names=unique_names)
             locator.scs_props.scs_part = _get_locator_part(parts, locator_index)
             locator.scs_props.locator_collider_centered = True
             locator.scs_props.locator_collider_mass = locator_weight
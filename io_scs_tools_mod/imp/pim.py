@@ -19,12 +19,12 @@
 # Copyright (C) 2013-2022: SCS Software
 
 import bpy
-import bmesh
-import array
+import numpy
+import os
 from re import match
-from mathutils import Vector
 from io_scs_tools_mod.consts import Mesh as _MESH_consts
 from io_scs_tools_mod.consts import Operators as _OP_consts
+from io_scs_tools_mod.imp import pis as _pis
 from io_scs_tools_mod.imp.transition_structs.terrain_points import TerrainPntsTrans
 from io_scs_tools_mod.internals.containers import pix as _pix_container
 from io_scs_tools_mod.utils.printout import lprint
@@ -32,6 +32,7 @@ from io_scs_tools_mod.utils.printout import handle_unused_arg
 from io_scs_tools_mod.utils import convert as _convert_utils
 from io_scs_tools_mod.utils import object as _object_utils
 from io_scs_tools_mod.utils import mesh as _mesh_utils
+from io_scs_tools_mod.utils import timing as _timing_utils
 from io_scs_tools_mod.utils import get_scs_globals as _get_scs_globals
 
 
@@ -381,9 +382,89 @@ def get_piece_skin_properties(section):
     return skin_piece_idx, skin_stream_cnt, skin_streams
 
 
+def __finalize_skinning__(skinning_lists):
+    """Converts skinning vertex indices and weights lists into arrays.
+
+    :param skinning_lists: lists of vertex indices and weights per bone per piece name
+    :type skinning_lists: dict[str, dict[str, tuple[list[int], list[float]]]]
+    :return: arrays of vertex indices and weights per bone per piece name
+    :rtype: dict[str, dict[str, tuple[numpy.ndarray, numpy.ndarray]]]
+    """
+    object_skinning = {}
+    for piece_name, piece_skinning in skinning_lists.items():
+        object_skinning[piece_name] = {}
+        for vg_name, (vertices, weights) in piece_skinning.items():
+            object_skinning[piece_name][vg_name] = (numpy.array(vertices, dtype=numpy.int64), numpy.array(weights, dtype=numpy.float32))
+
+    return object_skinning
+
+
+def _get_skinning_from_streams(skin_streams, objects_data, bones):
+    """Collects skinning of all pieces from global "Skin" section streams.
+
+    :param skin_streams: skin streams as returned by get_skin_properties
+    :type skin_streams: list
+    :param objects_data: pieces data, indexed by piece index
+    :type objects_data: dict
+    :param bones: bone names
+    :type bones: list[str]
+    :return: arrays of vertex indices and weights per bone per piece name
+    :rtype: dict[str, dict[str, tuple[numpy.ndarray, numpy.ndarray]]]
+    """
+    skinning_lists = {}
+    for skin_stream in skin_streams:
+        for stream in skin_stream:
+            for data in stream[5]:  # index 5 is data block, see _get_skin_stream
+                for rec in data['clones']:
+                    obj = objects_data[rec[0]][1]  # piece name
+                    if obj not in skinning_lists:
+                        skinning_lists[obj] = {}
+                    piece_skinning = skinning_lists[obj]
+                    vertex = rec[1]
+                    for weight in data['weights']:
+                        vg = bones[weight[0]]
+                        if vg not in piece_skinning:
+                            piece_skinning[vg] = ([], [])
+                        piece_skinning[vg][0].append(vertex)
+                        piece_skinning[vg][1].append(weight[1])
+
+    return __finalize_skinning__(skinning_lists)
+
+
+def _get_skinning_from_piece_streams(piece_skin_data, objects_data, bones):
+    """Collects skinning of all pieces from "PieceSkin" sections streams.
+
+    :param piece_skin_data: piece skin streams per piece index, as returned by get_piece_skin_properties
+    :type piece_skin_data: dict[int, list]
+    :param objects_data: pieces data, indexed by piece index
+    :type objects_data: dict
+    :param bones: bone names
+    :type bones: list[str]
+    :return: arrays of vertex indices and weights per bone per piece name
+    :rtype: dict[str, dict[str, tuple[numpy.ndarray, numpy.ndarray]]]
+    """
+    skinning_lists = {}
+    for piece_idx, piece_skin_streams in piece_skin_data.items():
+        obj = objects_data[piece_idx][1]  # piece name
+        if obj not in skinning_lists:
+            skinning_lists[obj] = {}
+        piece_skinning = skinning_lists[obj]
+        for skin_stream in piece_skin_streams:
+            for stream in skin_stream:
+                for data in stream[5]:  # index 5 is data block, see _get_piece_skin_stream
+                    vertex_indices = data['vertex_indices']
+                    for weight in data['weights']:
+                        vg = bones[weight[0]]
+                        if vg not in piece_skinning:
+                            piece_skinning[vg] = ([], [])
+                        piece_skinning[vg][0].extend(vertex_indices)
+                        piece_skinning[vg][1].extend((weight[1],) * len(vertex_indices))
+
+    return __finalize_skinning__(skinning_lists)
+
+
 def _create_piece(
         context,
-        preview_model,
         name,
         ob_material,
         mesh_vertices,
@@ -399,7 +480,6 @@ def _create_piece(
         materials_data,
         points_to_weld_list,
         terrain_points_trans,
-        ignore_backfaces=False
 ):
     handle_unused_arg(__file__, _create_piece.__name__, "mesh_tangents", mesh_tangents)
     handle_unused_arg(__file__, _create_piece.__name__, "mesh_scalars", mesh_scalars)
@@ -413,28 +493,41 @@ def _create_piece(
     mesh = bpy.data.meshes.new(name)
 
     # COORDINATES TRANSFORMATION
-    transformed_mesh_vertices = [_convert_utils.change_to_scs_xyz_coordinates(vec, import_scale) for vec in mesh_vertices]
+    transformed_mesh_vertices = numpy.array(mesh_vertices, dtype=numpy.float32).reshape(-1, 3)[:, (0, 2, 1)]
+    transformed_mesh_vertices *= (import_scale, -import_scale, import_scale)
 
     context.window_manager.progress_update(0.1)
 
     # VISUALISE IMPORTED NORMALS (DEBUG)
     # visualise_normals(name, transformed_mesh_vertices, mesh_normals, import_scale)
 
-    # MESH CREATION
-    bm = bmesh.new()
+    # WELDING MAP - index of original vertex for each vertex
+    if points_to_weld_list is None:
+        verts_map = numpy.arange(len(mesh_vertices))
+    else:
+        verts_map = points_to_weld_list
 
-    # VERTICES
-    _mesh_utils.bm_make_vertices(bm, transformed_mesh_vertices)
+    # FACES - back faces are triangles re-using vertices of already existing triangle in reversed order
+    mesh_triangles = numpy.array(mesh_triangles, dtype=numpy.int64).reshape(-1, 3)
+    new_faces_i, back_faces_i = _mesh_utils.get_faces_split(mesh_triangles, verts_map)
     context.window_manager.progress_update(0.2)
 
-    # FACES
-    mesh_triangles, back_triangles = _mesh_utils.bm_make_faces(bm, mesh_triangles, points_to_weld_list)
+    # MESH CREATION
+    verts_src, loops_src = _mesh_utils.mesh_make_geometry(mesh,
+                                                          transformed_mesh_vertices,
+                                                          mesh_triangles[new_faces_i],
+                                                          mesh_triangles[back_faces_i],
+                                                          verts_map)
     context.window_manager.progress_update(0.3)
 
+    if len(back_faces_i) > 0:
+        lprint("W Found %s back face(s) without it's own vertices on object %r, additional vertices were added!",
+               (len(back_faces_i), name))
+
     # UV LAYERS
     if mesh_uv:
         for uv_layer_name in mesh_uv:
-            _mesh_utils.bm_make_uv_layer(5, bm, mesh_triangles, uv_layer_name, mesh_uv[uv_layer_name]["data"])
+            _mesh_utils.mesh_make_uv_layer(mesh, uv_layer_name, mesh_uv[uv_layer_name]["data"], loops_src)
     context.window_manager.progress_update(0.4)
 
     # VERTEX COLOR
@@ -448,59 +541,42 @@ def _create_piece(
     vcolor_corrupt = False
     for vc_layer_name in mesh_rgb_final:
 
+        vc_layer_data = numpy.array(mesh_rgb_final[vc_layer_name], dtype=numpy.float32)
+        vc_layer_data = vc_layer_data.reshape(len(mesh_vertices), -1)
+
         # check for vcolor bigger than possible float range (since we divide our vcolor by 2 max value is 2)
         max_vcolor = 2.0
-        for k, vc_entry in enumerate(mesh_rgb_final[vc_layer_name]):
-            for j, value in enumerate(vc_entry):
-                if value > max_vcolor:
-                    mesh_rgb_final[vc_layer_name][k][j] = max_vcolor
-                    vcolor_corrupt = True
+        if numpy.any(vc_layer_data > max_vcolor):
+            numpy.minimum(vc_layer_data, max_vcolor, out=vc_layer_data)
+            vcolor_corrupt = True
 
-        _mesh_utils.bm_make_vc_layer(5, bm, vc_layer_name, mesh_rgb_final[vc_layer_name])
+        _mesh_utils.mesh_make_vc_layer(mesh, vc_layer_name, vc_layer_data, loops_src)
 
     if vcolor_corrupt:
         lprint("W Piece %r has vertices with vertex color greater the 1.0, clamping it!", (name,))
 
     context.window_manager.progress_update(0.5)
 
-    bm.to_mesh(mesh)
-    mesh.update()
-    bm.free()
-
     if _MESH_consts.default_vcol in mesh.color_attributes:
         # make sure to set default vcolor attribute as active
         mesh.color_attributes.active_color = mesh.color_attributes[_MESH_consts.default_vcol]
         mesh.color_attributes.render_color_index = mesh.color_attributes.active_color_index
 
-    # NORMALS - has to be applied after bmesh creation as they are set directly to mesh
-    if _get_scs_globals().import_use_normals:
+    # set polygons to use smooth representation
+    mesh.polygons.foreach_set("use_smooth", numpy.ones(len(mesh.polygons), dtype=bool))
 
-        mesh.create_normals_split()
-
-        # first set normals directly to loops
-        for loop in mesh.loops:
-            curr_n = _convert_utils.scs_to_blend_matrix() @ Vector(mesh_normals[loop.vertex_index])
-            loop.normal[:] = curr_n
+    # NORMALS - has to be applied after geometry creation as they are set directly to mesh
+    if _get_scs_globals().import_use_normals:
 
-        # then we have to go trough very important step they say,
-        # as without validation we get wrong result for some normals
+        # validation is very important step they say, as without it we get wrong result for some normals
         mesh.validate(clean_customdata=False)  # *Very* important to not remove lnors here!
 
-        # set polygons to use smooth representation
-        mesh.polygons.foreach_set("use_smooth", [True] * len(mesh.polygons))
-
-        # finally fill clnors from loops normals and apply them (taken from official Blenders scripts)
-        clnors = array.array('f', [0.0] * (len(mesh.loops) * 3))
-        mesh.loops.foreach_get("normal", clnors)
-        mesh.normals_split_custom_set(tuple(zip(*(iter(clnors),) * 3)))
+        normals = numpy.array(mesh_normals, dtype=numpy.float32).reshape(-1, 3)[:, (0, 2, 1)]
+        normals[:, 1] *= -1
+        mesh.normals_split_custom_set_from_vertices(normals[verts_src])
         mesh.use_auto_smooth = True
         mesh.auto_smooth_angle = 3.14
 
-        mesh.free_normals_split()
-    else:
-        # set polygons to use smooth representation only
-        mesh.polygons.foreach_set("use_smooth", [True] * len(mesh.polygons))
-
     context.window_manager.progress_update(0.6)
 
     # Create object out of mesh and link it to active layer collection.
@@ -517,62 +593,50 @@ def _create_piece(
     context.window_manager.progress_update(0.8)
 
     # TERRAIN POINTS (VERTEX GROUPS)
-    for vertex_i, vertex_pos in enumerate(mesh_vertices):
+    tp_indices = terrain_points_trans.get_indices(numpy.asarray(mesh_vertices)[verts_src])
 
-        tp_entries = terrain_points_trans.get(vertex_pos)
+    # add vertices to all combinations of variants/nodes
+    # from found terrain points transitional structures
+    for (variant_i, node_i), vertex_indices in tp_indices.items():
 
-        # add current vertex to all combinations of variants/nodes
-        # from found terrain points transitional structures
-        for tp_entry in tp_entries:
+        # first 6 chars in vertex group name will represent variant index
+        # this way we will be able to identify variant during vertex groups
+        # cleanup if this vertex will be set to multiple variants
+        vg_name = str(variant_i).zfill(6) + _OP_consts.TerrainPoints.vg_name_prefix + str(node_i)
 
-            # first 6 chars in vertex group name will represent variant index
-            # this way we will be able to identify variant during vertex groups
-            # cleanup if this vertex will be set to multiple variants
-            vg_name = str(tp_entry.variant_i).zfill(6) + _OP_consts.TerrainPoints.vg_name_prefix + str(tp_entry.node_i)
+        if vg_name not in obj.vertex_groups:
+            obj.vertex_groups.new(name=vg_name)
 
-            if vg_name not in obj.vertex_groups:
-                obj.vertex_groups.new(name=vg_name)
-
-            vertex_group = obj.vertex_groups[vg_name]
-            vertex_group.add([vertex_i], 1.0, "REPLACE")
+        vertex_group = obj.vertex_groups[vg_name]
+        vertex_group.add(vertex_indices, 1.0, "REPLACE")
 
     # SKINNING (VERTEX GROUPS)
     if object_skinning:
         if name in object_skinning:
-            for vertex_group_name in object_skinning[name]:
+            for vertex_group_name, (skin_vertices, skin_weights) in object_skinning[name].items():
                 vertex_group = obj.vertex_groups.new(name=vertex_group_name)
-                for vertex_i, vertex in enumerate(object_skinning[name][vertex_group_name]):
-                    weight = object_skinning[name][vertex_group_name][vertex]
-                    if weight != 0.0:
-                        if vertex in points_to_weld_list:
-                            vertex = points_to_weld_list[vertex]
-                        vertex_group.add([vertex], weight, "ADD")
+
+                nonzero = skin_weights != 0.0
+                entries, vertex_indices = _mesh_utils.get_created_vertices(verts_src, verts_map[skin_vertices[nonzero]])
+                weights = skin_weights[nonzero][entries]
+
+                # group vertices with the same weight, so each group is added at once
+                order = numpy.argsort(weights, kind="stable")
+                weights = weights[order]
+                vertex_indices = vertex_indices[order]
+                splits = numpy.flatnonzero(weights[1:] != weights[:-1]) + 1
+                for group_vertices, group_weights in zip(numpy.split(vertex_indices, splits), numpy.split(weights, splits)):
+                    if len(group_vertices) > 0:
+                        vertex_group.add(group_vertices.tolist(), float(group_weights[0]), "ADD")
         else:
             lprint('\nE Missing skin group %r! Skipping...', name)
 
     context.window_manager.progress_update(0.9)
 
-    # DELETE ORPHAN VERTICES (LEFT IN THE GEOMETRY FROM SMOOTHING RECONSTRUCTION)
-    if points_to_weld_list:
-        bm = bmesh.new()
-        bm.from_mesh(mesh)
-
-        bm.verts.ensure_lookup_table()
-        for vert_i in points_to_weld_list.keys():
-            bm.verts[vert_i].select_set(True)
-
-        verts = [v for v in bm.verts if v.select]
-        if verts:
-            bmesh.ops.delete(bm, geom=verts, context='VERTS')
-
-        # APPLYING BMESH TO MESH
-        bm.to_mesh(mesh)
-        bm.free()
-
     context.window_manager.progress_update(1.0)
 
     # MATERIAL
-    if len(materials_data) > 0 and not preview_model:
+    if len(materials_data) > 0:
         # Assign a material to the last slot
         used_material = bpy.data.materials[materials_data[ob_material][0]]
         obj.data.materials.append(used_material)
@@ -596,40 +660,6 @@ def _create_piece(
 
     context.window_manager.progress_end()
 
-    # if back triangles are present, then create new object with
-    # back triangles and merge it to original
-    if len(back_triangles) > 0 and not ignore_backfaces:
-
-        back_obj = _create_piece(context, preview_model, "back_" + name,
-                                 ob_material,
-                                 mesh_vertices,
-                                 mesh_normals,
-                                 mesh_tangents,
-                                 mesh_rgb,
-                                 mesh_rgba,
-                                 mesh_scalars,
-                                 object_skinning,
-                                 mesh_uv,
-                                 mesh_tuv,
-                                 back_triangles,
-                                 materials_data,
-                                 points_to_weld_list,
-                                 terrain_points_trans,
-                                 ignore_backfaces=True)
-
-        lprint("W Found %s back face(s) without it's own vertices on object %r, additional vertices were added!",
-               (len(back_obj.data.polygons), obj.name))
-
-        # creation of back face object used all original vertices
-        # for proper index accessing during binding all of the data blocks to vertices.
-        # Because of that we have to remove vertices which are not really used
-        # in back faces mesh, so called "loose" vertices
-        back_obj.data = _mesh_utils.bm_delete_loose(back_obj.data)
-
-        # finally join back object with original
-        with context.temp_override(active_object=obj, selected_editable_objects=back_obj):
-            bpy.ops.object.join()
-
     return obj
 
 
@@ -676,17 +706,53 @@ def visualise_normals(name, transformed_mesh_vertices, mesh_normals, import_scal
 '''
 
 
-def load_pim_file(context, filepath, terrain_points_trans=None, preview_model=False):
-    """Loads the actual PIM file type. This is used also for loading of 'Preview Models'.
+def create_skeleton(context, filepath, bones, skeleton):
+    """Creates armature with given bones. If PIS file referenced by PIM is found,
+    bones are created directly in their rest transformations loaded from it.
+
+    :param context: Blender context
+    :type context: bpy.types.Context
+    :param filepath: PIM file path
+    :type filepath: str
+    :param bones: bone names
+    :type bones: list[str]
+    :param skeleton: PIS file path relative to PIM file directory as written in PIM globals; or None
+    :type skeleton: str | None
+    :return: (created armature, bones loaded from PIS file or None if file wasn't found)
+    :rtype: (bpy.types.Object, dict[str, list] | None)
+    """
+    skeleton_bones = None
+    bones_rest = None
+
+    if skeleton:
+        # pis file path is created from directory of pim file and skeleton definition inside pim header
+        pis_filepath = os.path.dirname(filepath) + os.sep + skeleton
+        if os.path.isfile(pis_filepath):
+            lprint("I Importing PIS ...", immediate_timeout=0)
+            lprint('\nD PIS filepath:\n  %s', (pis_filepath,))
+            with _timing_utils.stage("pis import"):
+                skeleton_bones = _pis.load(pis_filepath)
+                bones_rest = _pis.get_bones_rest(skeleton_bones)
+
+    armature = _object_utils.create_armature(context, bones, bones_rest=bones_rest)
+
+    if skeleton_bones:
+        _pis.setup_armature(armature, skeleton_bones)
+
+    return armature, skeleton_bones
+
+
+def load_pim_file(context, filepath, terrain_points_trans=None, unique_names=None):
+    """Loads the actual PIM file type.
 
     :param filepath: File path to be imported
     :type filepath: str
-    :param preview_model: Load geomety as Preview Model
-    :type preview_model: bool
     :param terrain_points_trans: transitional structure with filled terrain points from PIP; or None
     :type terrain_points_trans: io_scs_tools_mod.imp.transition_structs.terrain_points.TerrainPntsTrans | None
-    :return: ({'FINISHED'}, objects, skinned_objects, locators, armature, skeleton) or preview model object
-    :rtype: tuple | bpy.types.Object
+    :param unique_names: unique names allocator of Blender objects used for created locators; None to check names against all objects
+    :type unique_names: io_scs_tools_mod.utils.name.UniqueNames | None
+    :return: ({'FINISHED'}, objects, locators, armature, skeleton, skeleton_bones, materials)
+    :rtype: tuple
     """
 
     # create empty terrain points transitional structure if none is passed
@@ -707,7 +773,7 @@ def load_pim_file(context, filepath, terrain_points_trans=None, preview_model=Fa
 
     if format_version not in (5,):
         lprint('\nE Unknown PIM file version! Version %r is not currently supported by PIM importer.', format_version)
-        return {'CANCELLED'}, None, None, [], None, None
+        return {'CANCELLED'}, None, None, [], None, None, None
 
     # LOAD GLOBALS
     (vertex_count,
@@ -764,7 +830,7 @@ def load_pim_file(context, filepath, terrain_points_trans=None, preview_model=Fa
                  mesh_uv,
                  mesh_tuv,
                  mesh_triangles) = _get_piece_streams(section)
-                points_to_weld_list = {}
+                points_to_weld_list = None
                 if mesh_normals:
                     # print('Piece %i going to "make_posnorm_list"...' % ob_index)
                     if scs_globals.import_use_welding:
@@ -855,7 +921,7 @@ def load_pim_file(context, filepath, terrain_points_trans=None, preview_model=Fa
                 piece_skin_count -= 1
 
     # CREATE MATERIALS
-    if scs_globals.import_pim_file and not preview_model:
+    if scs_globals.import_pim_file:
         lprint("\nI ------ Creating materials: ------")
 
         for mat_i in materials_data:
@@ -871,38 +937,11 @@ def load_pim_file(context, filepath, terrain_points_trans=None, preview_model=Fa
     # PREPARE VERTEX GROUPS FOR SKINNING
     object_skinning = {}
     if scs_globals.import_pim_file and scs_globals.import_pis_file and bones:
-        if skin_streams:  # global skinning section
-            for skin_stream in skin_streams:
-                for stream_i, stream in enumerate(skin_stream):
-                    for data in stream[5]:  # index 5 is data block, see _get_skin_stream
-                        # print(' ORIGIN - data: %s' % str(data))
-                        for rec in data['clones']:
-                            obj = objects_data[rec[0]][1]  # piece name
-                            if obj not in object_skinning:
-                                object_skinning[obj] = {}
-                            vertex = rec[1]
-                            for weight in data['weights']:
-                                vg = bones[weight[0]]
-                                if vg not in object_skinning[obj]:
-                                    object_skinning[obj][vg] = {}
-                                vw = weight[1]
-                                object_skinning[obj][vg][vertex] = vw
-        elif piece_skin_data:  # or skinning per piece
-            for piece_idx, piece_skin_streams in piece_skin_data.items():
-                obj = objects_data[piece_idx][1]  # piece name
-                for skin_stream in piece_skin_streams:
-                    for stream_i, stream in enumerate(skin_stream):
-                        for data in stream[5]:  # index 5 is data block, see _get_skin_stream
-                            # print(' ORIGIN - data: %s' % str(data))
-                            for vertex_idx in data['vertex_indices']:
-                                if obj not in object_skinning:
-                                    object_skinning[obj] = {}
-                                for weight in data['weights']:
-                                    vg = bones[weight[0]]
-                                    if vg not in object_skinning[obj]:
-                                        object_skinning[obj][vg] = {}
-                                    vw = weight[1]
-                                    object_skinning[obj][vg][vertex_idx] = vw
+        with _timing_utils.stage("skinning"):
+            if skin_streams:  # global skinning section
+                object_skinning = _get_skinning_from_streams(skin_streams, objects_data, bones)
+            elif piece_skin_data:  # or skinning per piece
+                object_skinning = _get_skinning_from_piece_streams(piece_skin_data, objects_data, bones)
 
     # CREATE OBJECTS
     lprint("\nI ------ Creating mesh objects: -------")
@@ -911,45 +950,32 @@ def load_pim_file(context, filepath, terrain_points_trans=None, preview_model=Fa
     objects_data_count = len(objects_data)
     for obj_i in objects_data:
 
-        # PARTS - search part first so preview model can possibly ignore objects with prescribed variant
+        # PARTS
         part_name = None
         for part in parts_data:
             if parts_data[part][0] is not None and obj_i in parts_data[part][0]:
                 part_name = part.lower()
 
-        if preview_model:
-
-            # ignore pieces with "coll" parts
-            if match(r'^coll([0-9]?|_.*)$', part_name):
-                lprint("I Ignoring piece with part collision part name %r for preview model!", (part_name,))
-                continue
-
-            # ignore pieces with shadow and none material effects
-            used_mat_effect = materials_data[objects_data[obj_i][2]][1]
-            if ".shadowonly" in used_mat_effect or ".fakeshadow" in used_mat_effect or used_mat_effect.startswith("eut2.none"):
-                lprint("I Ignoring piece with material having shadow or none effect for preview model!")
-                continue
-
         # print('objects_data[obj_i]: %s' % str(objects_data[obj_i]))
-        obj = _create_piece(
-            objects_data[obj_i][0],  # context
-            preview_model,
-            objects_data[obj_i][1],  # piece_name
-            objects_data[obj_i][2],  # ob_material
-            objects_data[obj_i][3],  # mesh_vertices
-            objects_data[obj_i][4],  # mesh_normals
-            objects_data[obj_i][5],  # mesh_tangents
-            objects_data[obj_i][6],  # mesh_rgb
-            objects_data[obj_i][7],  # mesh_rgba
-            objects_data[obj_i][8],  # mesh_scalars
-            object_skinning,
-            objects_data[obj_i][9],  # mesh_uv
-            objects_data[obj_i][10],  # mesh_tuv
-            objects_data[obj_i][11],  # mesh_triangles
-            materials_data,
-            objects_data[obj_i][12],  # points_to_weld_list
-            terrain_points_trans,
-        )
+        with _timing_utils.stage("mesh build"):
+            obj = _create_piece(
+                objects_data[obj_i][0],  # context
+                objects_data[obj_i][1],  # piece_name
+                objects_data[obj_i][2],  # ob_material
+                objects_data[obj_i][3],  # mesh_vertices
+                objects_data[obj_i][4],  # mesh_normals
+                objects_data[obj_i][5],  # mesh_tangents
+                objects_data[obj_i][6],  # mesh_rgb
+                objects_data[obj_i][7],  # mesh_rgba
+                objects_data[obj_i][8],  # mesh_scalars
+                object_skinning,
+                objects_data[obj_i][9],  # mesh_uv
+                objects_data[obj_i][10],  # mesh_tuv
+                objects_data[obj_i][11],  # mesh_triangles
+                materials_data,
+                objects_data[obj_i][12],  # points_to_weld_list
+                terrain_points_trans,
+            )
 
         piece_name = objects_data[obj_i][1]
         if obj:
@@ -977,23 +1003,9 @@ def load_pim_file(context, filepath, terrain_points_trans=None, preview_model=Fa
 
     lprint("I -------------------------------------")
 
-    if preview_model:
-
-        # abort loading if no meshes inside imported model
-        if len(objects) == 0 and len(skinned_objects) == 0:
-            return None
-
-        # get active object for joining meshes into it
-        active_object = objects[0] if len(objects) > 0 else skinned_objects[0]
-
-        with context.temp_override(active_object=active_object, selected_editable_objects=objects + skinned_objects):
-            bpy.ops.object.join()
-
-        return active_object
-
     # CREATE MODEL LOCATORS
     locators = []
-    if scs_globals.import_pim_file and not preview_model:
+    if scs_globals.import_pim_file:
         lprint("\nI ------ Creating model locators: ------")
 
         locators_data_count = len(locators_data)
@@ -1007,6 +1019,7 @@ def load_pim_file(context, filepath, terrain_points_trans=None, preview_model=Fa
                 1.0,  # loc_size
                 'Model',  # loc_type
                 locators_data[loc_i][1],  # loc_hookup
+                unique_names=unique_names
             )
             # loc = create_locator(
             # locators_data[loc_i][0],  # loc_name
@@ -1036,27 +1049,13 @@ def load_pim_file(context, filepath, terrain_points_trans=None, preview_model=Fa
 
     # CREATE SKELETON (ARMATURE)
     armature = None
+    skeleton_bones = None
     if scs_globals.import_pis_file and bones:
-        bpy.ops.object.add(type='ARMATURE', enter_editmode=True)
-        for bone in bones:
-            bpy.ops.armature.bone_primitive_add(name=bone)
-        bpy.ops.object.editmode_toggle()
-        # bpy.context.object.data.show_names = True
-        armature = bpy.context.object
+        armature, skeleton_bones = create_skeleton(context, filepath, bones, skeleton)
 
         # ADD ARMATURE MODIFIERS TO SKINNED OBJECTS
         for obj in skinned_objects:
-            # print('...adding Armature modifier to %r...' % str(obj.name))
-            bpy.context.view_layer.objects.active = obj
-            bpy.ops.object.modifier_add(type='ARMATURE')
-            arm_modifier = None
-            for modifier in obj.modifiers:
-                if modifier.type == 'ARMATURE':
-                    arm_modifier = modifier
-                    break
-            if arm_modifier:
-                arm_modifier.object = armature
-            obj.parent = armature
+            _object_utils.add_armature_modifier(obj, armature)
 
     # WARNING PRINTOUTS
     if piece_count < 0:
@@ -1068,10 +1067,105 @@ def load_pim_file(context, filepath, terrain_points_trans=None, preview_model=Fa
     if piece_skin_count < 0:
         lprint("W Some PieceSkins not found, but were declared!")
 
-    return {'FINISHED'}, objects, locators, armature, skeleton, materials_data.values()
+    return {'FINISHED'}, objects, locators, armature, skeleton, skeleton_bones, materials_data.values()
+
+
+def load_preview_mesh(filepath, mesh):
+    """Loads geometry of the PIM file as one merged mesh, used for 'Preview Models'.
+    Only positions, triangles and normals are loaded, materials, skinning and locators are skipped
+    and no objects are created. Pieces from collision parts and pieces with shadow or none effect are ignored.
+
+    :param filepath: File path to be loaded
+    :type filepath: str
+    :param mesh: empty mesh into which geometry should be loaded
+    :type mesh: bpy.types.Mesh
+    :return: True if any geometry was loaded; False otherwise
+    :rtype: bool
+    """
+
+    scs_globals = _get_scs_globals()
+    import_scale = scs_globals.import_scale
+
+    pim_container = _pix_container.get_data_from_file(filepath, '    ')
+
+    format_version = get_header(pim_container)[0]
+    if format_version not in (5,):
+        lprint('\nE Unknown PIM file version! Version %r is not currently supported by PIM importer.', format_version)
+        return False
+
+    materials_effects = {}
+    pieces_data = {}
+    piece_parts = {}
+    for section in pim_container:
+        if section.type == 'Material':
+            material_i, materials_alias, materials_effect = get_material_properties(section)
+            if not material_i:
+                material_i = len(materials_effects)
+            materials_effects[material_i] = materials_effect
+        elif section.type == 'Piece':
+            ob_index, ob_material, ob_vertex_cnt, ob_tris_cnt, ob_stream_cnt = get_piece_properties(section)
+            if ob_vertex_cnt == 0 or ob_tris_cnt == 0:
+                continue
+            mesh_vertices, mesh_normals, _, _, _, _, _, _, mesh_triangles = _get_piece_streams(section)
+            pieces_data[ob_index] = (ob_material, mesh_vertices, mesh_normals, mesh_triangles)
+        elif section.type == 'Part':
+            part_name, part_piece_count, part_locator_count, part_pieces, part_locators = get_part_properties(section)
+            if part_pieces is not None and isinstance(part_pieces, int):
+                part_pieces = [part_pieces]
+            for piece_i in part_pieces or []:
+                piece_parts[piece_i] = part_name.lower()
+
+    vertices = []
+    normals = []
+    triangles = []
+    verts_offset = 0
+    for piece_i, (ob_material, mesh_vertices, mesh_normals, mesh_triangles) in pieces_data.items():
+
+        # ignore pieces with "coll" parts
+        part_name = piece_parts.get(piece_i)
+        if part_name and match(r'^coll([0-9]?|_.*)$', part_name):
+            continue
+
+        # ignore pieces with shadow and none material effects
+        used_mat_effect = materials_effects.get(ob_material, "")
+        if ".shadowonly" in used_mat_effect or ".fakeshadow" in used_mat_effect or used_mat_effect.startswith("eut2.none"):
+            continue
+
+        vertices.append(numpy.array(mesh_vertices, dtype=numpy.float32).reshape(-1, 3))
+        triangles.append(numpy.array(mesh_triangles, dtype=numpy.int64).reshape(-1, 3) + verts_offset)
+        if mesh_normals:
+            normals.append(numpy.array(mesh_normals, dtype=numpy.float32).reshape(-1, 3))
+        else:
+            normals.append(numpy.zeros((len(mesh_vertices), 3), dtype=numpy.float32))
+
+        verts_offset += len(mesh_vertices)
+
+    # abort loading if no meshes inside the model
+    if not vertices:
+        return False
+
+    vertices = numpy.concatenate(vertices)[:, (0, 2, 1)]
+    vertices *= (import_scale, -import_scale, import_scale)
+    triangles = numpy.concatenate(triangles)
+
+    verts_map = numpy.arange(len(vertices))
+    new_faces_i, back_faces_i = _mesh_utils.get_faces_split(triangles, verts_map)
+    verts_src, loops_src = _mesh_utils.mesh_make_geometry(mesh, vertices, triangles[new_faces_i], triangles[back_faces_i], verts_map)
+
+    mesh.polygons.foreach_set("use_smooth", numpy.ones(len(mesh.polygons), dtype=bool))
+
+    if scs_globals.import_use_normals:
+        normals = numpy.concatenate(normals)[:, (0, 2, 1)]
+        normals[:, 1] *= -1
+        mesh.validate(clean_customdata=False)
+        mesh.normals_split_custom_set_from_vertices(normals[verts_src])
+        mesh.use_auto_smooth = True
+        mesh.auto_smooth_angle = 3.14
+
+    return True
 
 
-def load(context, filepath, terrain_points_trans):
+def load(context, filepath, terrain_points_trans, unique_names=None):
     """Loads the PIM file type.
 
     :param context: Blender Context
@@ -1080,7 +1174,9 @@ def load(context, filepath, terrain_points_trans):
     :type filepath: str
     :param terrain_points_trans: transitional structure with filled terrain points from PIP; or None
     :type terrain_points_trans: io_scs_tools_mod.imp.transition_structs.terrain_points.TerrainPntsTrans | None
-    :return: (result, objects, locators, armature, skeleton)
+    :param unique_names: unique names allocator of Blender objects used for created locators; None to check names against all objects
+    :type unique_names: io_scs_tools_mod.utils.name.UniqueNames | None
+    :return: (result, objects, locators, armature, skeleton, skeleton_bones, materials)
     :rtype: tuple
     """
 
@@ -1089,12 +1185,12 @@ def load(context, filepath, terrain_points_trans):
     print("**      (c)2014 SCS Software      **")
     print("************************************\n")
 
-    result, objects, locators, armature, skeleton, mats_info = load_pim_file(
+    result, objects, locators, armature, skeleton, skeleton_bones, mats_info = load_pim_file(
         context,
         filepath,
         terrain_points_trans,
-        preview_model=False
+        unique_names=unique_names
     )
 
     print("************************************")
-    return result, objects, locators, armature, skeleton, mats_info
+    return result, objects, locators, armature, skeleton, skeleton_bones, mats_info
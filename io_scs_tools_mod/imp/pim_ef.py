@@ -32,6 +32,7 @@ from io_scs_tools_mod.imp.pim import get_locator_properties
 from io_scs_tools_mod.imp.pim import get_bones_properties
 from io_scs_tools_mod.imp.pim import get_skin_properties
 from io_scs_tools_mod.imp.pim import get_piece_skin_properties
+from io_scs_tools_mod.imp.pim import create_skeleton
 from io_scs_tools_mod.imp.transition_structs.terrain_points import TerrainPntsTrans
 from io_scs_tools_mod.internals.containers import pix as _pix_container
 from io_scs_tools_mod.utils.printout import lprint
@@ -456,7 +457,7 @@ def _create_piece(
     return obj
 
 
-def load_pim_file(context, filepath, terrain_points_trans=None, preview_model=False):
+def load_pim_file(context, filepath, terrain_points_trans=None, preview_model=False, unique_names=None):
     """Loads the actual PIM file type. This is used also for loading of 'Preview Models'.
 
     :param filepath: File path to be imported
@@ -465,7 +466,9 @@ def load_pim_file(context, filepath, terrain_points_trans=None, preview_model=Fa
     :type preview_model: bool
     :param terrain_points_trans: transitional structure with filled terrain points from PIP; or None
     :type terrain_points_trans: io_scs_tools_mod.imp.transition_structs.terrain_points.TerrainPntsTrans | None
-    :return: ({'FINISHED'}, objects, skinned_objects, locators, armature, skeleton) or preview model object
+    :param unique_names: unique names allocator of Blender objects used for created locators; None to check names against all objects
+    :type unique_names: io_scs_tools_mod.utils.name.UniqueNames | None
+    :return: ({'FINISHED'}, objects, locators, armature, skeleton, skeleton_bones, materials) or preview model object
     :rtype: tuple | bpy.types.Object
     """
 
@@ -486,7 +489,7 @@ def load_pim_file(context, filepath, terrain_points_trans=None, preview_model=Fa
 
     if format_version not in (1,):
         lprint('\nE Unknown PIM.EF file version! Version %r is not currently supported by PIM.EF importer.', format_version)
-        return {'CANCELLED'}, None, None, [], None, None
+        return {'CANCELLED'}, None, None, [], None, None, None
 
     # LOAD GLOBALS
     (vertex_count,
@@ -767,6 +770,7 @@ def load_pim_file(context, filepath, terrain_points_trans=None, preview_model=Fa
                 1.0,  # loc_size
                 'Model',  # loc_type
                 locators_data[loc_i][1],  # loc_hookup
+                unique_names=unique_names
             )
             # loc = create_locator(
             # locators_data[loc_i][0],  # loc_name
@@ -794,28 +798,13 @@ def load_pim_file(context, filepath, terrain_points_trans=None, preview_model=Fa
 
     # CREATE SKELETON (ARMATURE)
     armature = None
+    skeleton_bones = None
     if scs_globals.import_pis_file and bones:
-        bpy.ops.object.add(type='ARMATURE', enter_editmode=False)
-        bpy.ops.object.editmode_toggle()
-        for bone in bones:
-            bpy.ops.armature.bone_primitive_add(name=bone)
-        bpy.ops.object.editmode_toggle()
-        # bpy.context.object.data.show_names = True
-        armature = bpy.context.object
+        armature, skeleton_bones = create_skeleton(context, filepath, bones, skeleton)
 
         # ADD ARMATURE MODIFIERS TO SKINNED OBJECTS
         for obj in skinned_objects:
-            # print('...adding Armature modifier to %r...' % str(obj.name))
-            bpy.context.view_layer.objects.active = obj
-            bpy.ops.object.modifier_add(type='ARMATURE')
-            arm_modifier = None
-            for modifier in obj.modifiers:
-                if modifier.type == 'ARMATURE':
-                    arm_modifier = modifier
-                    break
-            if arm_modifier:
-                arm_modifier.object = armature
-            obj.parent = armature
+            _object_utils.add_armature_modifier(obj, armature)
 
     # WARNING PRINTOUTS
     if piece_count < 0:
@@ -827,10 +816,10 @@ def load_pim_file(context, filepath, terrain_points_trans=None, preview_model=Fa
     if piece_skin_count < 0:
         lprint("W Some PieceSkins not found, but were declared!")
 
-    return {'FINISHED'}, objects, locators, armature, skeleton, materials_data.values()
+    return {'FINISHED'}, objects, locators, armature, skeleton, skeleton_bones, materials_data.values()
 
 
-def load(context, filepath, terrain_points_trans):
+def load(context, filepath, terrain_points_trans, unique_names=None):
     """Loads the PIM file type.
 
     :param context: Blender Context
@@ -839,7 +828,9 @@ def load(context, filepath, terrain_points_trans):
     :type filepath: str
     :param terrain_points_trans: transitional structure with filled terrain points from PIP; or None
     :type terrain_points_trans: io_scs_tools_mod.imp.transition_structs.terrain_points.TerrainPntsTrans | None
-    :return: (result, objects, locators, armature, skeleton)
+    :param unique_names: unique names allocator of Blender objects used for created locators; None to check names against all objects
+    :type unique_names: io_scs_tools_mod.utils.name.UniqueNames | None
+    :return: (result, objects, locators, armature, skeleton, skeleton_bones, materials)
     :rtype: tuple
     """
 
@@ -848,12 +839,13 @@ def load(context, filepath, terrain_points_trans):
     print("**      (c)2017 SCS Software      **")
     print("************************************\n")
 
-    result, objects, locators, armature, skeleton, mats_info = load_pim_file(
+    result, objects, locators, armature, skeleton, skeleton_bones, mats_info = load_pim_file(
         context,
         filepath,
         terrain_points_trans,
-        preview_model=False
+        preview_model=False,
+        unique_names=unique_names
     )
 
     print("************************************")
-    return result, objects, locators, armature, skeleton, mats_info
+    return result, objects, locators, armature, skeleton, skeleton_bones, mats_info
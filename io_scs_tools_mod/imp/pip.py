@@ -409,7 +409,8 @@ def _create_node_locator(
         node_name,
         node_index,
         node_position,
-        node_direction
+        node_direction,
+        unique_names=None
 ):
     locator = _object_utils.create_locator_empty(node_name,
                                                  node_position,
@@ -420,7 +421,8 @@ def _create_node_locator(
                                                  ),
                                                  (1, 1, 1),
                                                  0.1,
-                                                 'Prefab')
+                                                 'Prefab',
+                                                 unique_names=unique_names)
     if locator:
         locator.scs_props.locator_prefab_type = 'Control Node'
         locator.scs_props.locator_prefab_con_node_index = str(node_index)
@@ -434,9 +436,11 @@ def _create_sign_locator(
         sign_rotation,
         sign_model_id,
         sign_part,
-        scs_sign_model_inventory
+        scs_sign_model_inventory,
+        unique_names=None
 ):
-    locator = _object_utils.create_locator_empty(sign_name, sign_position, sign_rotation, (1, 1, 1), 0.1, 'Prefab')
+    locator = _object_utils.create_locator_empty(sign_name, sign_position, sign_rotation, (1, 1, 1), 0.1, 'Prefab',
+                                                 unique_names=unique_names)
     if locator:
         locator.scs_props.locator_prefab_type = 'Sign'
         sign_model_value = _inventory.get_item_name(scs_sign_model_inventory, sign_model_id, report_errors=True)
@@ -450,9 +454,11 @@ def _create_spawn_locator(
         spawn_name,
         spawn_position,
         spawn_rotation,
-        spawn_type
+        spawn_type,
+        unique_names=None
 ):
-    locator = _object_utils.create_locator_empty(spawn_name, spawn_position, spawn_rotation, (1, 1, 1), 0.1, 'Prefab')
+    locator = _object_utils.create_locator_empty(spawn_name, spawn_position, spawn_rotation, (1, 1, 1), 0.1, 'Prefab',
+                                                 unique_names=unique_names)
     if locator:
         locator.scs_props.locator_prefab_type = 'Spawn Point'
         locator.scs_props.locator_prefab_spawn_type = str(spawn_type)
@@ -468,9 +474,11 @@ def _create_traffic_light_locator(
         tsem_intervals,
         tsem_cycle,
         tsem_profile,
-        scs_tsem_profile_inventory
+        scs_tsem_profile_inventory,
+        unique_names=None
 ):
-    locator = _object_utils.create_locator_empty(tsem_name, tsem_position, tsem_rotation, (1, 1, 1), 0.1, 'Prefab')
+    locator = _object_utils.create_locator_empty(tsem_name, tsem_position, tsem_rotation, (1, 1, 1), 0.1, 'Prefab',
+                                                 unique_names=unique_names)
     if locator:
         locator.scs_props.locator_prefab_type = 'Traffic Semaphore'
         locator.scs_props.locator_prefab_tsem_id = str(tsem_id)
@@ -489,7 +497,7 @@ def _create_traffic_light_locator(
     return locator
 
 
-def _create_nav_locator(nav_locator_data):
+def _create_nav_locator(nav_locator_data, unique_names=None):
     """."""
     name = nav_locator_data['np_name']
     position = nav_locator_data['np_pos']
@@ -502,7 +510,7 @@ def _create_nav_locator(nav_locator_data):
             math.radians(direction[1]),
             math.radians(direction[2])
         )
-    locator = _object_utils.create_locator_empty(name, position, direction, (1, 1, 1), 0.1, 'Prefab')
+    locator = _object_utils.create_locator_empty(name, position, direction, (1, 1, 1), 0.1, 'Prefab', unique_names=unique_names)
 
     if locator:
         locator.scs_props.locator_prefab_type = 'Navigation Point'
@@ -542,8 +550,10 @@ def _create_map_locator(
         map_visual_flags,
         map_nav_flags,
         map_position,
+        unique_names=None
 ):
-    locator = _object_utils.create_locator_empty(map_name, map_position, (0, 0, 0), (1, 1, 1), 0.1, 'Prefab')
+    locator = _object_utils.create_locator_empty(map_name, map_position, (0, 0, 0), (1, 1, 1), 0.1, 'Prefab',
+                                                 unique_names=unique_names)
     if locator:
         locator.scs_props.locator_prefab_type = 'Map Point'
 
@@ -597,9 +607,11 @@ def _create_trigger_locator(
         trp_reset_delay,
         trp_flags,
         trp_position,
-        scs_trigger_actions_inventory
+        scs_trigger_actions_inventory,
+        unique_names=None
 ):
-    locator = _object_utils.create_locator_empty(trp_name, trp_position, (0, 0, 0), (1, 1, 1), 0.1, 'Prefab')
+    locator = _object_utils.create_locator_empty(trp_name, trp_position, (0, 0, 0), (1, 1, 1), 0.1, 'Prefab',
+                                                 unique_names=unique_names)
     if locator:
         locator.scs_props.locator_prefab_type = 'Trigger Point'
 
@@ -617,13 +629,15 @@ def _create_trigger_locator(
     return locator
 
 
-def load(filepath, terrain_points_trans):
+def load(filepath, terrain_points_trans, unique_names=None):
     """Loads given PIP file.
 
     :param filepath: complete filepath to PIP file
     :type filepath: str
     :param terrain_points_trans: terrain points transitional structure where terrain points shall be saved
     :type terrain_points_trans: io_scs_tools_mod.imp.transition_structs.terrain_points.TerrainPntsTrans
+    :param unique_names: unique names allocator of Blender objects used for created locators; None to check names against all objects
+    :type unique_names: io_scs_tools_mod.utils.name.UniqueNames | None
     :return: set of operator result and list of created locators
     :rtype: tuple[set, list[bpy.types.Objects]]
     """
@@ -672,6 +686,12 @@ def load(filepath, terrain_points_trans):
 
     locators = []
 
+    # unique names allocators for each locator type
+    node_names = _name_utils.UniqueNames()
+    sign_names = _name_utils.UniqueNames()
+    spawn_names = _name_utils.UniqueNames()
+    tsem_names = _name_utils.UniqueNames()
+
     # node_index = 0
     sign_index = 0
     spawn_index = 0
@@ -693,8 +713,9 @@ def load(filepath, terrain_points_trans):
 
             if node_name is None:
                 node_name = str('Node_Locator_' + str(node_index))
+                node_names.add(node_name)
             else:
-                node_name = _name_utils.get_unique(node_name, nodes_data.keys())
+                node_name = _name_utils.get_unique(node_name, node_names)
 
             node_direction = _curve_utils.set_direction(node_direction)
 
@@ -717,8 +738,9 @@ def load(filepath, terrain_points_trans):
 
             if sign_name is None:
                 sign_name = str('Sign_Locator_' + str(sign_index))
+                sign_names.add(sign_name)
             else:
-                sign_name = _name_utils.get_unique(sign_name, signs_data.keys())
+                sign_name = _name_utils.get_unique(sign_name, sign_names)
 
             signs_data[sign_name] = (
                 sign_index,
@@ -736,8 +758,9 @@ def load(filepath, terrain_points_trans):
 
             if spawn_name is None:
                 spawn_name = str('Sign_Locator_' + str(spawn_index))
+                spawn_names.add(spawn_name)
             else:
-                spawn_name = _name_utils.get_unique(spawn_name,  spawn_points_data.keys())
+                spawn_name = _name_utils.get_unique(spawn_name, spawn_names)
 
             spawn_points_data[spawn_name] = (
                 spawn_index,
@@ -758,8 +781,9 @@ def load(filepath, terrain_points_trans):
 
             if tsem_name is None:
                 tsem_name = str('Semaphore_Locator_' + str(tsem_index))
+                tsem_names.add(tsem_name)
             else:
-                tsem_name = _name_utils.get_unique(tsem_name, traffic_lights_data.keys())
+                tsem_name = _name_utils.get_unique(tsem_name, tsem_names)
 
             if tsem_id is None:
                 tsem_id = -1
@@ -870,6 +894,7 @@ def load(filepath, terrain_points_trans):
             nodes_data[name][0],  # node_index
             nodes_data[name][1],  # node_position
             nodes_data[name][2],  # node_direction
+            unique_names=unique_names
         )
 
         tp_pos_l = nodes_data[name][5]
@@ -901,7 +926,8 @@ def load(filepath, terrain_points_trans):
             signs_data[name][2],
             signs_data[name][3],
             signs_data[name][4],
-            scs_inventories.sign_models
+            scs_inventories.sign_models,
+            unique_names=unique_names
         )
         if loc:
             _print_locator_result(loc, "Sign", name)
@@ -915,6 +941,7 @@ def load(filepath, terrain_points_trans):
             spawn_points_data[name][1],
             spawn_points_data[name][2],
             spawn_points_data[name][3],
+            unique_names=unique_names
         )
         if loc:
             _print_locator_result(loc, "Spawn Point", name)
@@ -932,7 +959,8 @@ def load(filepath, terrain_points_trans):
             traffic_lights_data[name][4],  # tsem_intervals
             traffic_lights_data[name][5],  # tsem_cycle
             traffic_lights_data[name][6],  # tsem_profile
-            scs_inventories.tsem_profiles
+            scs_inventories.tsem_profiles,
+            unique_names=unique_names
         )
         if loc:
             _print_locator_result(loc, "Traffic Semaphore", name)
@@ -1069,7 +1097,7 @@ def load(filepath, terrain_points_trans):
 
                 continue
 
-            loc = _create_nav_locator(nav_locator_data)
+            loc = _create_nav_locator(nav_locator_data, unique_names=unique_names)
             _set_nav_locator_props(loc, nav_locator_data, loc_key == "start")
             locators.append(loc)
             if loc:
@@ -1150,6 +1178,7 @@ def load(filepath, terrain_points_trans):
             map_point[2],
             map_point[3],
             map_point[4],
+            unique_names=unique_names
         )
 
         _print_locator_result(loc, "Map Point", name)
@@ -1196,7 +1225,8 @@ def load(filepath, terrain_points_trans):
             tr_point[4],
             tr_point[5],
             tr_point[6],
-            scs_inventories.trigger_actions
+            scs_inventories.trigger_actions,
+            unique_names=unique_names
         )
 
         _print_locator_result(loc, "Trigger Point", name)
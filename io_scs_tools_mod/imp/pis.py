@@ -18,8 +18,6 @@
 
 # Copyright (C) 2013-2014: SCS Software
 
-import os
-import bpy
 from mathutils import Vector
 from io_scs_tools_mod.consts import Bones as _BONE_consts
 from io_scs_tools_mod.utils.printout import lprint
@@ -70,6 +68,11 @@ def _get_global(pis_container):
     return bone_count
 
 
+def _get_bone_matrix(matrix):
+    """Converts bone matrix from PIS file to Blender space."""
+    return _convert_utils.scs_to_blend_matrix() @ matrix.transposed()
+
+
 def _get_bones(pis_container):
     """Receives a Bones section and returns its data in a dictionary:
     bones[bone_name] = (bone_parent, bone_matrix)"""
@@ -82,12 +85,79 @@ def _get_bones(pis_container):
     return bones
 
 
-def load(filepath, armature, get_only=False):
+def get_bones_rest(bones):
+    """Computes rest transformations of the bones loaded from PIS file, ready to be used for armature creation.
+
+    :param bones: bones loaded from PIS file; bones[bone_name] = [bone_parent, bone_matrix]
+    :type bones: dict[str, list]
+    :return: rest data of each bone; bones_rest[bone_name] = (head, tail, roll, bone_parent, use_connect)
+    :rtype: dict[str, tuple]
+    """
     scs_globals = _get_scs_globals()
     import_scale = scs_globals.import_scale
     bone_import_scale = scs_globals.import_bone_scale
     connected_bones = scs_globals.import_connected_bones
 
+    # CONNECTED BONES - Collect children of all bones...
+    # NOTE: Doesn't work as expected! Disabled for now in UI.
+    # Child bones gets position offset and there is also a problem when translation
+    # is animated, for which connected bones doesn't allow.
+    children = {}
+    if connected_bones:
+        for bone_name in bones:
+            children[bone_name] = [item for item in bones if bones[item][0] == bone_name]
+
+    bones_rest = {}
+    for bone_name, (bone_parent, matrix) in bones.items():
+
+        # COMPUTE BONE TRANSFORMATION
+        bone_matrix = _get_bone_matrix(matrix)
+        axis, angle = _convert_utils.mat3_to_vec_roll(bone_matrix)
+
+        head = bone_matrix.to_translation().to_3d() * import_scale
+        tail = head + Vector(axis).normalized() * bone_import_scale * import_scale
+
+        if connected_bones and len(children[bone_name]) == 1:
+            tail = _get_bone_matrix(bones[children[bone_name][0]][1]).to_translation().to_3d() * import_scale
+
+        use_connect = connected_bones and len(children.get(bone_parent, ())) == 1
+
+        bones_rest[bone_name] = (head, tail, angle, bone_parent, use_connect)
+
+    return bones_rest
+
+
+def setup_armature(armature, bones):
+    """Sets up armature created with rest transformations of the bones loaded from PIS file.
+
+    :param armature: armature object created from PIS bones
+    :type armature: bpy.types.Object
+    :param bones: bones loaded from PIS file; bones[bone_name] = [bone_parent, bone_matrix]
+    :type bones: dict[str, list]
+    """
+    for pose_bone in armature.pose.bones:
+
+        if pose_bone.name not in bones:
+            continue
+
+        # save initial bone scaling to use it in calculation when importing PIA animations
+        # NOTE: bones after import always have scale of 1:
+        # 1. because edit bones don't have scale, just tail and head
+        # 2. because any scaling in pose bones will be overwritten by animation itself
+        pose_bone[_BONE_consts.init_scale_key] = _get_bone_matrix(bones[pose_bone.name][1]).to_scale()
+
+    armature.data.show_axes = True
+    armature.display_type = 'WIRE'
+
+
+def load(filepath):
+    """Loads bones from the PIS file.
+
+    :param filepath: PIS file path
+    :type filepath: str
+    :return: loaded bones; bones[bone_name] = [bone_parent, bone_matrix]
+    :rtype: dict[str, list]
+    """
     print("\n************************************")
     print("**      SCS PIS Importer          **")
     print("**      (c)2014 SCS Software      **")
@@ -134,78 +204,5 @@ def load(filepath, armature, get_only=False):
     # LOAD BONES
     bones = _get_bones(pis_container)
 
-    if get_only:  # only return bones (used when importing PIA from panel)
-        return bones
-
-    # PROVIDE AN ARMATURE
-    if not armature:
-        lprint('\nE No Armature for file "%s"!', (os.path.basename(filepath),))
-        return {'CANCELLED'}, None
-
-    bpy.context.view_layer.objects.active = armature
-    bpy.ops.object.mode_set(mode='EDIT')
-
-    # CONNECTED BONES - Add information about all children...
-    if connected_bones:
-        for bone in bones:
-            # print('  bone: %r - %r\n%s\n' % (bone, bones[bone][0], str(bones[bone][1])))
-            children = []
-            for item in bones:
-                if bone == bones[item][0]:
-                    children.append(item)
-            bones[bone].append(children)
-            # print('  bone: %r - %r\n%s\n' % (bone, bones[bone][0], str(bones[bone][2])))
-
-    for bone_i, bone in enumerate(armature.data.bones):
-        # print('----- bone: %r ------------------------------' % bone.name)
-
-        # SET PARENT
-        if bones[bone.name][0] != "":  # if bone has parent...
-            # print('  %r --> %r' % (bone.name, bones[bone.name][0]))
-            # armature.data.edit_bones[bone.name].use_connect = False
-            armature.data.edit_bones[bone.name].parent = armature.data.edit_bones[bones[bone.name][0]]
-            # else:
-            # print('  %r - NO parent' % bone.name)
-
-        # COMPUTE BONE TRANSFORMATION
-        matrix = bones[bone.name][1]
-        bone_matrix = _convert_utils.scs_to_blend_matrix() @ matrix.transposed()
-        axis, angle = _convert_utils.mat3_to_vec_roll(bone_matrix)
-        # print(' * %r - angle: %s' % (bone.name, angle))
-
-        # SET BONE TRANSFORMATION
-        armature.data.edit_bones[bone.name].head = bone_matrix.to_translation().to_3d() * import_scale
-        armature.data.edit_bones[bone.name].tail = (armature.data.edit_bones[bone.name].head +
-                                                    Vector(axis).normalized() *
-                                                    bone_import_scale *
-                                                    import_scale)
-        armature.data.edit_bones[bone.name].roll = angle
-
-        # save initial bone scaling to use it in calculation when importing PIA animations
-        # NOTE: bones after import always have scale of 1:
-        # 1. because edit bones don't have scale, just tail and head
-        # 2. because any scaling in pose bones will be overwritten by animation itself
-        armature.pose.bones[bone.name][_BONE_consts.init_scale_key] = bone_matrix.to_scale()
-
-        # CONNECTED BONES
-        # NOTE: Doesn't work as expected! Disabled for now in UI.
-        # Child bones gets position offset and there is also a problem when translation
-        # is animated, for which connected bones doesn't allow.
-        if connected_bones:
-            if len(bones[bone.name][2]) == 1:
-                matrix = bones[bones[bone.name][2][0]][1]
-                bone_matrix = _convert_utils.scs_to_blend_matrix() @ matrix.transposed()
-                armature.data.edit_bones[bone.name].tail = bone_matrix.to_translation().to_3d() * import_scale
-                armature.data.edit_bones[bones[bone.name][2][0]].use_connect = True
-
-    bpy.ops.object.mode_set(mode='OBJECT')
-    armature.data.show_axes = True
-    armature.display_type = 'WIRE'
-
-    # WARNING PRINTOUTS
-    # if piece_count < 0: Print(dump_level, '\nW More Pieces found than were declared!')
-    # if piece_count > 0: Print(dump_level, '\nW Some Pieces not found, but were declared!')
-    # if dump_level > 1: print('')
-
     print("************************************")
     return bones
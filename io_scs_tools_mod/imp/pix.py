@@ -26,7 +26,6 @@ from io_scs_tools_mod.imp import pic as _pic
 from io_scs_tools_mod.imp import pim as _pim
 from io_scs_tools_mod.imp import pim_ef as _pim_ef
 from io_scs_tools_mod.imp import pip as _pip
-from io_scs_tools_mod.imp import pis as _pis
 from io_scs_tools_mod.imp import pit as _pit
 from io_scs_tools_mod.imp.transition_structs.terrain_points import TerrainPntsTrans
 from io_scs_tools_mod.internals import inventory as _inventory
@@ -35,6 +34,7 @@ from io_scs_tools_mod.utils import material as _material_utils
 from io_scs_tools_mod.utils import name as _name_utils
 from io_scs_tools_mod.utils import object as _object_utils
 from io_scs_tools_mod.utils import path as _path_utils
+from io_scs_tools_mod.utils import timing as _timing_utils
 from io_scs_tools_mod.utils.printout import lprint
 
 
@@ -142,7 +142,7 @@ def _are_shader_data_compatible(preset_section, material_attributes, material_te
     return True
 
 
-def _create_scs_root_object(name, loaded_variants, loaded_looks, mats_info, objects, locators, armature):
+def _create_scs_root_object(name, loaded_variants, loaded_looks, mats_info, objects, locators, armature, unique_names=None):
     """Creates an 'SCS Root Object' (Empty Object) for currently imported
     'SCS Game Object' and parent all import content to it.
 
@@ -160,6 +160,8 @@ def _create_scs_root_object(name, loaded_variants, loaded_looks, mats_info, obje
     :type locators: list
     :param armature: Armature Object
     :type armature: bpy.types.Object
+    :param unique_names: unique names allocator of Blender objects; None to check name against all objects
+    :type unique_names: io_scs_tools_mod.utils.name.UniqueNames | None
     :return: SCS Root Object
     :rtype: bpy.types.Object
     """
@@ -167,7 +169,7 @@ def _create_scs_root_object(name, loaded_variants, loaded_looks, mats_info, obje
     context = bpy.context
 
     # MAKE THE 'SCS ROOT OBJECT' NAME UNIQUE
-    name = _name_utils.get_unique(name, bpy.data.objects)
+    name = _name_utils.get_unique(name, unique_names if unique_names is not None else bpy.data.objects)
 
     # CREATE EMPTY OBJECT & MAKE A PROPER SETTINGS TO THE 'SCS Game Object' OBJECT
     scs_root_object = bpy.data.objects.new(name, None)
@@ -286,6 +288,7 @@ def _create_scs_root_object(name, loaded_variants, loaded_looks, mats_info, obje
         look_mat_settings = look[1]
 
         # setup all the materials. NOTE: They should be already created by PIM import.
+        shader_setup_start = _timing_utils.start_stage()
         for mat_info in mats_info:
             mat = bpy.data.materials[mat_info[0]]
             if mat_info[2] in look_mat_settings:
@@ -337,6 +340,8 @@ def _create_scs_root_object(name, loaded_variants, loaded_looks, mats_info, obje
                     if "scs_tex_aliases" in mat:
                         del mat["scs_tex_aliases"]
 
+        _timing_utils.end_stage("shader setup", shader_setup_start)
+
         # create new look entry on root
         bpy.ops.object.scs_tools_add_look(look_name=look_name, instant_apply=False)
 
@@ -369,161 +374,178 @@ def load(context, filepath, name_suffix="", suppress_reports=False):
     bpy.context.window.cursor_modal_set('WAIT')
     scs_globals = _get_scs_globals()
 
-    if not suppress_reports:
-        lprint("", report_errors=-1, report_warnings=-1)  # Clear the 'error_messages' and 'warning_messages'
-
-    collision_locators = []
-    prefab_locators = []
-    loaded_variants = []
-    loaded_looks = []
-    objects = []
-    locators = []
-    mats_info = []
-    scs_root_object = skeleton = bones = armature = None
-
-    # TRANSITIONAL STRUCTURES
-    terrain_points = TerrainPntsTrans()
-
-    # IMPORT PIP -> has to be loaded before PIM because of terrain points
-    if scs_globals.import_pip_file:
-        lprint("I Importing PIP ...", immediate_timeout=0)
-        pip_filepath = filepath + ".pip" + name_suffix
-        if os.path.isfile(pip_filepath):
-            lprint('\nD PIP filepath:\n  %s', (pip_filepath,))
-            # print('PIP filepath:\n  %s' % pip_filepath)
-            result, prefab_locators = _pip.load(pip_filepath, terrain_points)
-        else:
-            lprint('\nI No PIP file.')
-            # print('INFO - No PIP file.')
-
-    # IMPORT PIM
-    if scs_globals.import_pim_file or scs_globals.import_pis_file:
-        lprint("I Importing PIM ...", immediate_timeout=0)
-        pim_filepath = filepath + ".pim" + name_suffix
-        if pim_filepath:
-            if os.path.isfile(pim_filepath):
-                lprint('\nD PIM filepath:\n  %s', (_path_utils.readable_norm(pim_filepath),))
-
-                if pim_filepath.endswith(".pim"):
-                    result, objects, locators, armature, skeleton, mats_info = _pim.load(
-                        context,
-                        pim_filepath,
-                        terrain_points_trans=terrain_points
-                    )
-                elif pim_filepath.endswith(".pim.ef"):
-                    result, objects, locators, armature, skeleton, mats_info = _pim_ef.load(
-                        context,
-                        pim_filepath,
-                        terrain_points_trans=terrain_points
-                    )
+    with _timing_utils.operation("import of %r" % os.path.basename(filepath)):
+
+        if not suppress_reports:
+            lprint("", report_errors=-1, report_warnings=-1)  # Clear the 'error_messages' and 'warning_messages'
+
+        collision_locators = []
+        prefab_locators = []
+        loaded_variants = []
+        loaded_looks = []
+        objects = []
+        locators = []
+        mats_info = []
+        scs_root_object = skeleton = bones = armature = None
+
+        # TRANSITIONAL STRUCTURES
+        terrain_points = TerrainPntsTrans()
+
+        # index object names only once per import, so created locators and root get unique names without scanning all objects
+        object_names = _name_utils.UniqueNames(bpy.data.objects)
+
+        # IMPORT PIP -> has to be loaded before PIM because of terrain points
+        if scs_globals.import_pip_file:
+            lprint("I Importing PIP ...", immediate_timeout=0)
+            pip_filepath = filepath + ".pip" + name_suffix
+            if os.path.isfile(pip_filepath):
+                lprint('\nD PIP filepath:\n  %s', (pip_filepath,))
+                # print('PIP filepath:\n  %s' % pip_filepath)
+                with _timing_utils.stage("pip import"):
+                    result, prefab_locators = _pip.load(pip_filepath, terrain_points, unique_names=object_names)
+            else:
+                lprint('\nI No PIP file.')
+                # print('INFO - No PIP file.')
+
+        # IMPORT PIM
+        if scs_globals.import_pim_file or scs_globals.import_pis_file:
+            lprint("I Importing PIM ...", immediate_timeout=0)
+            pim_filepath = filepath + ".pim" + name_suffix
+            if pim_filepath:
+                if os.path.isfile(pim_filepath):
+                    lprint('\nD PIM filepath:\n  %s', (_path_utils.readable_norm(pim_filepath),))
+
+                    with _timing_utils.stage("pim import"):
+                        if pim_filepath.endswith(".pim"):
+                            result, objects, locators, armature, skeleton, bones, mats_info = _pim.load(
+                                context,
+                                pim_filepath,
+                                terrain_points_trans=terrain_points,
+                                unique_names=object_names
+                            )
+                        elif pim_filepath.endswith(".pim.ef"):
+                            result, objects, locators, armature, skeleton, bones, mats_info = _pim_ef.load(
+                                context,
+                                pim_filepath,
+                                terrain_points_trans=terrain_points,
+                                unique_names=object_names
+                            )
+                        else:
+                            lprint("\nE Unknown PIM file extension! Shouldn't happen...")
+
+                    # pieces and armature are named by Blender, so mark their names as used too
+                    for obj in objects:
+                        object_names.add(obj.name)
+                    if armature:
+                        object_names.add(armature.name)
                 else:
-                    lprint("\nE Unknown PIM file extension! Shouldn't happen...")
+                    lprint('\nI No file found at %r!' % (_path_utils.readable_norm(pim_filepath),))
             else:
-                lprint('\nI No file found at %r!' % (_path_utils.readable_norm(pim_filepath),))
-        else:
-            lprint('\nI No filepath provided!')
-
-    # IMPORT PIT
-    bpy.context.view_layer.objects.active = None
-    if scs_globals.import_pit_file:
-        lprint("I Importing PIT ...", immediate_timeout=0)
-        pit_filepath = filepath + ".pit" + name_suffix
-        if os.path.isfile(pit_filepath):
-            lprint('\nD PIT filepath:\n  %s', (pit_filepath,))
-            # print('PIT filepath:\n  %s' % pit_filepath)
-            result, loaded_variants, loaded_looks = _pit.load(pit_filepath)
-        else:
-            lprint('\nI No PIT file.')
-            # print('INFO - No PIT file.')
-
-    # IMPORT PIC
-    if scs_globals.import_pic_file:
-        lprint("I Importing PIC ...", immediate_timeout=0)
-        pic_filepath = filepath + ".pic" + name_suffix
-        if os.path.isfile(pic_filepath):
-            lprint('\nD PIC filepath:\n  %s', (pic_filepath,))
-            # print('PIC filepath:\n  %s' % pic_filepath)
-            result, collision_locators = _pic.load(pic_filepath)
-        else:
-            lprint('\nI No PIC file.')
-            # print('INFO - No PIC file.')
-
-    # SETUP 'SCS GAME OBJECTS'
-    lprint("I Setup of SCS game object ...", immediate_timeout=0)
-    for item in collision_locators:
-        locators.append(item)
-    for item in prefab_locators:
-        locators.append(item)
-    path, filename = os.path.split(filepath)
-    if objects or locators or (armature and skeleton):
-        scs_root_object = _create_scs_root_object(filename, loaded_variants, loaded_looks, mats_info, objects, locators, armature)
-
-        # Additionally if user wants to have automatically set custom export path, then let him have it :P
-        if scs_globals.import_preserve_path_for_export:
-            relative_export_path = _path_utils.relative_path(scs_globals.scs_project_path, path)
-            if path.startswith(scs_globals.scs_project_path) and relative_export_path != path:
-                scs_root_object.scs_props.scs_root_object_export_filepath = relative_export_path
-                scs_root_object.scs_props.scs_root_object_allow_custom_path = True
+                lprint('\nI No filepath provided!')
+
+        # IMPORT PIT
+        bpy.context.view_layer.objects.active = None
+        if scs_globals.import_pit_file:
+            lprint("I Importing PIT ...", immediate_timeout=0)
+            pit_filepath = filepath + ".pit" + name_suffix
+            if os.path.isfile(pit_filepath):
+                lprint('\nD PIT filepath:\n  %s', (pit_filepath,))
+                # print('PIT filepath:\n  %s' % pit_filepath)
+                with _timing_utils.stage("pit import"):
+                    result, loaded_variants, loaded_looks = _pit.load(pit_filepath)
             else:
-                lprint("W Can not preserve import path for export on import SCS Root %r, "
-                       "as import was done from outside of current SCS Project Base Path!",
-                       (scs_root_object.name,))
-    else:
-        lprint("W Model file: %r is empty, nothing could be imported!", (filename,))
-
-    # IMPORT PIS
-    if scs_globals.import_pis_file and skeleton:
-        lprint("I Importing PIS ...", immediate_timeout=0)
-        # pis file path is created from directory of pim file and skeleton definition inside pim header
-        pis_filepath = os.path.dirname(filepath) + os.sep + skeleton
-        if os.path.isfile(pis_filepath):
-            lprint('\nD PIS filepath:\n  %s', (pis_filepath,))
-
-            # strip off name suffix from skeleton path
-            skeleton = skeleton[:-len(name_suffix)]
-
-            # fill in custom data if PIS file is from other directory
-            if skeleton[:-4] != scs_root_object.name:
-                armature.scs_props.scs_skeleton_custom_export_dirpath = "//" + os.path.relpath(os.path.dirname(pis_filepath),
-                                                                                               scs_globals.scs_project_path)
-                armature.scs_props.scs_skeleton_custom_name = os.path.basename(skeleton[:-4])
-
-            bones = _pis.load(pis_filepath, armature)
+                lprint('\nI No PIT file.')
+                # print('INFO - No PIT file.')
+
+        # IMPORT PIC
+        if scs_globals.import_pic_file:
+            lprint("I Importing PIC ...", immediate_timeout=0)
+            pic_filepath = filepath + ".pic" + name_suffix
+            if os.path.isfile(pic_filepath):
+                lprint('\nD PIC filepath:\n  %s', (pic_filepath,))
+                # print('PIC filepath:\n  %s' % pic_filepath)
+                with _timing_utils.stage("pic import"):
+                    result, collision_locators = _pic.load(pic_filepath, unique_names=object_names)
+            else:
+                lprint('\nI No PIC file.')
+                # print('INFO - No PIC file.')
+
+        # SETUP 'SCS GAME OBJECTS'
+        lprint("I Setup of SCS game object ...", immediate_timeout=0)
+        for item in collision_locators:
+            locators.append(item)
+        for item in prefab_locators:
+            locators.append(item)
+        path, filename = os.path.split(filepath)
+        if objects or locators or (armature and skeleton):
+            with _timing_utils.stage("scs root setup"):
+                scs_root_object = _create_scs_root_object(filename, loaded_variants, loaded_looks, mats_info, objects, locators, armature,
+                                                          unique_names=object_names)
+
+            # Additionally if user wants to have automatically set custom export path, then let him have it :P
+            if scs_globals.import_preserve_path_for_export:
+                relative_export_path = _path_utils.relative_path(scs_globals.scs_project_path, path)
+                if path.startswith(scs_globals.scs_project_path) and relative_export_path != path:
+                    scs_root_object.scs_props.scs_root_object_export_filepath = relative_export_path
+                    scs_root_object.scs_props.scs_root_object_allow_custom_path = True
+                else:
+                    lprint("W Can not preserve import path for export on import SCS Root %r, "
+                           "as import was done from outside of current SCS Project Base Path!",
+                           (scs_root_object.name,))
         else:
-            bones = None
-            lprint('\nI No PIS file.')
-
-        # IMPORT PIA
-        if scs_globals.import_pia_file and bones:
-            lprint("I Importing PIAs ...", immediate_timeout=0)
-            basepath = os.path.dirname(filepath)
-            # Search for PIA files in model's directory and its subdirectiories...
-            lprint('\nD Searching the directory for PIA files:\n   %s', (basepath,))
-            # print('\nSearching the directory for PIA files:\n   %s' % str(basepath))
-            pia_files = []
-            index = 0
-            for root, dirs, files in os.walk(basepath):
-                if not scs_globals.import_include_subdirs_for_pia:
-                    if index > 0:
-                        break
-                # print('  root: %s - dirs: %s - files: %s' % (str(root), str(dirs), str(files)))
-                for file in files:
-                    if file.endswith(".pia" + name_suffix):
-                        pia_filepath = os.path.join(root, file)
-                        pia_files.append(pia_filepath)
-                index += 1
-
-            if len(pia_files) > 0:
-                lprint('D PIA files found:')
-                for pia_filepath in pia_files:
-                    lprint('D %r', pia_filepath)
-                # print('armature: %s\nskeleton: %r\nbones: %s\n' % (str(armature), str(skeleton), str(bones)))
-                _pia.load(scs_root_object, pia_files, armature, pis_filepath, bones)
+            lprint("W Model file: %r is empty, nothing could be imported!", (filename,))
+
+        # IMPORT PIS
+        # NOTE: PIS bones are already loaded during PIM import, so armature bones get rest transformations on creation
+        if scs_globals.import_pis_file and skeleton:
+            # pis file path is created from directory of pim file and skeleton definition inside pim header
+            pis_filepath = os.path.dirname(filepath) + os.sep + skeleton
+            if bones:
+
+                # strip off name suffix from skeleton path
+                skeleton = skeleton[:-len(name_suffix)]
+
+                # fill in custom data if PIS file is from other directory
+                if skeleton[:-4] != scs_root_object.name:
+                    armature.scs_props.scs_skeleton_custom_export_dirpath = "//" + os.path.relpath(os.path.dirname(pis_filepath),
+                                                                                                   scs_globals.scs_project_path)
+                    armature.scs_props.scs_skeleton_custom_name = os.path.basename(skeleton[:-4])
+
             else:
-                lprint('\nI No PIA files.')
+                lprint('\nI No PIS file.')
+
+            # IMPORT PIA
+            if scs_globals.import_pia_file and bones:
+                lprint("I Importing PIAs ...", immediate_timeout=0)
+                basepath = os.path.dirname(filepath)
+                # Search for PIA files in model's directory and its subdirectiories...
+                lprint('\nD Searching the directory for PIA files:\n   %s', (basepath,))
+                # print('\nSearching the directory for PIA files:\n   %s' % str(basepath))
+                pia_files = []
+                index = 0
+                for root, dirs, files in os.walk(basepath):
+                    if not scs_globals.import_include_subdirs_for_pia:
+                        if index > 0:
+                            break
+                    # print('  root: %s - dirs: %s - files: %s' % (str(root), str(dirs), str(files)))
+                    for file in files:
+                        if file.endswith(".pia" + name_suffix):
+                            pia_filepath = os.path.join(root, file)
+                            pia_files.append(pia_filepath)
+                    index += 1
+
+                if len(pia_files) > 0:
+                    lprint('D PIA files found:')
+                    for pia_filepath in pia_files:
+                        lprint('D %r', pia_filepath)
+                    # print('armature: %s\nskeleton: %r\nbones: %s\n' % (str(armature), str(skeleton), str(bones)))
+                    with _timing_utils.stage("pia import"):
+                        _pia.load(scs_root_object, pia_files, armature, pis_filepath, bones)
+                else:
+                    lprint('\nI No PIA files.')
 
-    # fix scene objects count so it won't trigger copy cycle
-    bpy.context.scene.scs_cached_num_objects = len(bpy.context.scene.objects)
+        # fix scene objects count so it won't trigger copy cycle
+        bpy.context.scene.scs_cached_num_objects = len(bpy.context.scene.objects)
 
     # FINAL FEEDBACK
     bpy.context.window.cursor_modal_restore()
@@ -19,11 +19,19 @@
 # Copyright (C) 2015: SCS Software
 
 
+import numpy
+
+
 class TerrainPntsTrans:
     """Transitional terrain points class for storing terrain points position and normal per variant index and node index.
     This storage shall be use to collect&store terrain points in PIP importer and then used it in PIM importer.
     """
 
+    PRECISION = 1000
+    """Quantization of positions into hash grid cells.
+    NOTE: currently matching is done on milimeter precision, because
+    better precision in some cases didn't recover all of the points."""
+
     class Entry:
         def __init__(self, variant_i, node_i):
             self.variant_i = variant_i
@@ -33,25 +41,23 @@ class TerrainPntsTrans:
             return self.variant_i == other.variant_i and self.node_i == other.node_i
 
     @staticmethod
-    def __stringfy_key__(position):
-        """Creates string key from position vector.
-
-        NOTE: currently matching is done on milimeter precision, because
-        better precision in some cases didn't recover all of the points.
+    def __quantize_key__(position):
+        """Creates hash grid cell key from position vector.
 
         :param position:
         :type position: mathutils.Vector | tuple
-        :return: string representation of position
-        :rtype: str
+        :return: integer cell coordinates of position
+        :rtype: tuple[int]
         """
-        return "%.3f;%.3f;%.3f" % (position[0], position[1], position[2])
+        prec = TerrainPntsTrans.PRECISION
+        return round(position[0] * prec), round(position[1] * prec), round(position[2] * prec)
 
     def __init__(self):
         """Creates class instance of terrain points transitional structure.
         """
 
         self.__storage = {}
-        """:type: dict[str, list[TerrainPoints.Entry]]"""
+        """:type: dict[tuple[int], list[TerrainPntsTrans.Entry]]"""
 
     def add(self, variant_index, node_index, position, normal):
         """Adds new terrain point to storage.
@@ -70,7 +76,7 @@ class TerrainPntsTrans:
         if normal:
             pass
 
-        key = TerrainPntsTrans.__stringfy_key__(position)
+        key = TerrainPntsTrans.__quantize_key__(position)
         if key not in self.__storage:
             self.__storage[key] = []
 
@@ -88,8 +94,37 @@ class TerrainPntsTrans:
         :rtype: list[TerrainPntsTrans.Entry]
         """
 
-        key = self.__stringfy_key__(position)
+        key = self.__quantize_key__(position)
         if key in self.__storage:
             return self.__storage[key]
         else:
             return []
+
+    def get_indices(self, positions):
+        """Get terrain points for multiple positions at once.
+
+        :param positions: positions for which terrain points shall be returned
+        :type positions: list[list[float]] | numpy.ndarray
+        :return: indices of given positions for each found (variant index, node index) pair
+        :rtype: dict[tuple[int, int], list[int]]
+        """
+
+        tp_indices = {}
+
+        if not self.__storage or len(positions) == 0:
+            return tp_indices
+
+        keys = numpy.round(numpy.asarray(positions, dtype=numpy.float64).reshape(-1, 3) * self.PRECISION)
+        for pos_i, key in enumerate(map(tuple, keys.astype(numpy.int64).tolist())):
+
+            if key not in self.__storage:
+                continue
+
+            for tp_entry in self.__storage[key]:
+                entry_key = (tp_entry.variant_i, tp_entry.node_i)
+                if entry_key not in tp_indices:
+                    tp_indices[entry_key] = [pos_i]
+                else:
+                    tp_indices[entry_key].append(pos_i)
+
+        return tp_indices
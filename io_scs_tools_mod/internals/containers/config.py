@@ -26,6 +26,7 @@ from hashlib import sha256
 from time import time
 from io_scs_tools_mod.consts import Icons as _ICONS_consts
 from io_scs_tools_mod.consts import Cache as _CACHE_consts
+from io_scs_tools_mod.utils import printout as _printout
 from io_scs_tools_mod.utils.printout import lprint
 from io_scs_tools_mod.utils import path as _path_utils
 from io_scs_tools_mod.utils import view3d as _view3d_utils
@@ -33,6 +34,7 @@ from io_scs_tools_mod.utils import get_scs_globals as _get_scs_globals
 from io_scs_tools_mod.utils import get_scs_inventories as _get_scs_inventories
 from io_scs_tools_mod.utils import load_scs_globals_from_blend as _load_scs_globals_from_blend
 from io_scs_tools_mod.utils.info import get_combined_ver_str
+from io_scs_tools_mod.utils.info import get_tools_version
 from io_scs_tools_mod.utils.property import get_default
 from io_scs_tools_mod.internals import shader_presets as _shader_presets
 from io_scs_tools_mod.internals.containers import pix as _pix
@@ -235,6 +237,190 @@ class _ContainersCache:
         return sii_container
 
 
+class _ShaderPresetsIndex:
+    """Class for caching compiled shader presets library using pickle module and temporary directory.
+
+    Once shader presets library is empty (user restarts blender, switches projects), this cache
+    recovers already compiled presets and flavors together with supported effects, instead of parsing
+    shader presets file and loading supported effects file again.
+
+    Index is keyed by content hash of shader presets file, Blender Tools version and
+    supported effects file last modified time. If stored key doesn't match anymore, index is rebuilt.
+    """
+
+    __tmp_dir = os.path.join(tempfile.gettempdir(), _CACHE_consts.dir_name)
+    """Temporary direcrtory to which we dump compiled shader presets index for later reuse."""
+
+    @staticmethod
+    def __index_path(path):
+        """Returns path of the index file for given shader presets file.
+
+        :param path: absolute path of shader presets file
+        :type path: str
+        :return: path of the index file inside temporary directory
+        :rtype: str
+        """
+        path_hash = sha256(_path_utils.full_norm(path).encode('utf-8')).hexdigest()
+        return os.path.join(_ShaderPresetsIndex.__tmp_dir, path_hash + ".shader_presets")
+
+    @staticmethod
+    def __supported_effects_path():
+        """Returns path of supported effects file shipped with Blender Tools.
+
+        :return: path of supported effects file
+        :rtype: str
+        """
+        return os.path.join(_path_utils.get_addon_installation_paths()[0], "supported_effects.bin")
+
+    @staticmethod
+    def __get_key(path):
+        """Returns validation key of the index for given shader presets file.
+
+        :param path: absolute path of shader presets file
+        :type path: str
+        :return: hash of shader presets file content, Blender Tools version and supported effects last modified time
+        :rtype: str
+        """
+        supported_effects_path = _ShaderPresetsIndex.__supported_effects_path()
+        if os.path.isfile(supported_effects_path):
+            supported_effects_mtime = str(os.path.getmtime(supported_effects_path))
+        else:
+            supported_effects_mtime = ""
+
+        key_hash = sha256()
+        with open(path, mode="rb") as file:
+            key_hash.update(file.read())
+        key_hash.update(get_tools_version().encode('utf-8'))
+        key_hash.update(supported_effects_mtime.encode('utf-8'))
+
+        return key_hash.hexdigest()
+
+    @staticmethod
+    def __load_supported_effects():
+        """Loads supported effects from dump file of python set or dictionary, where keys represent supported effects.
+
+        :return: set of supported effects; None if file is missing or can not be loaded
+        :rtype: frozenset[str] | None
+        """
+        supported_effects_path = _ShaderPresetsIndex.__supported_effects_path()
+        if not os.path.isfile(supported_effects_path):
+            lprint("W Supported effects file is missing! Make sure latest SCS Blender Tools Mod is installed.\n\t   "
+                   "Without supported effects file invalid combinations of shader and flavors can be created!",
+                   report_warnings=1)
+            return None
+
+        try:
+            with open(supported_effects_path, mode="rb") as file:
+                return frozenset(pickle.load(file))
+        except PermissionError:
+            lprint("W Can't load supported effects file (persmission denied), please ensure read/write permissions for:\n\t   %r\n\t   "
+                   "Without supported effects file invalid combinations of shader and flavors can be created!",
+                   (os.path.dirname(supported_effects_path),),
+                   report_warnings=1)
+            return None
+
+    @staticmethod
+    def __build(path):
+        """Builds shader presets index from given shader presets file.
+
+        :param path: absolute path of shader presets file
+        :type path: str
+        :return: supported effects and list of presets as (effect, name, section, flavors), where each flavor is
+                 list of variants as (type, suffix, flavor section); None if shader presets file can't be parsed
+        :rtype: tuple[frozenset[str] | None, list[tuple]] | None
+        """
+        presets_container = _pix.get_data_from_file(path, '    ')
+        if not presets_container:
+            return None
+
+        # sort sections to shaders and flavors
+        shaders = []
+        flavors = {}
+        for section in presets_container:
+            if section.type == "Shader":
+                shaders.append(section)
+            elif section.type == "Flavor":
+                flavors[section.get_prop_value("Type")] = section
+
+        presets = []
+        for shader in shaders:
+            shader_flavors = shader.get_prop_value("Flavors")
+
+            preset_flavors = []
+            if shader_flavors:
+
+                for flavor_types in shader_flavors:
+
+                    flavor_variants = []
+                    for flavor_type in flavor_types.split("|"):
+
+                        if flavor_type not in flavors:
+                            lprint("D Flavor used by shader preset, but not defined: %s", (flavor_type,))
+                            continue
+
+                        # there can be more variants eg. "BLEND_ADD|BLEND_OVER"
+                        flavor_variant_name = flavors[flavor_type].get_prop_value("Name")
+                        flavor_variants.append((flavor_type, flavor_variant_name, flavors[flavor_type]))
+
+                    preset_flavors.append(flavor_variants)
+
+            presets.append((shader.get_prop_value("Effect"), shader.get_prop_value("PresetName"), shader, preset_flavors))
+
+        return _ShaderPresetsIndex.__load_supported_effects(), presets
+
+    @staticmethod
+    def retrieve(path):
+        """Retrieve shader presets index for given shader presets file.
+
+        If index is not yet cached or it's key doesn't match anymore, index is rebuilt from shader presets file and cached.
+
+        :param path: absolute path of shader presets file
+        :type path: str
+        :return: supported effects and list of presets as (effect, name, section, flavors), where each flavor is
+                 list of variants as (type, suffix, flavor section); None if shader presets file can't be parsed
+        :rtype: tuple[frozenset[str] | None, list[tuple]] | None
+        """
+        key = _ShaderPresetsIndex.__get_key(path)
+        index_path = _ShaderPresetsIndex.__index_path(path)
+
+        if os.path.isfile(index_path):
+
+            # key is stored as separate first record, so index itself is unpickled only if key matches.
+            # NOTE: index contains classes of Blender Tools, so file written by other version or code layout
+            # can fail on unpickling with any kind of error, in that case index is simply rebuilt
+            try:
+                with open(index_path, mode="rb") as file:
+                    if pickle.load(file) == key:
+                        return pickle.load(file)
+            except Exception as e:
+                lprint("D Shader presets index can't be loaded (%s: %s): %r", (type(e).__name__, e, index_path))
+
+            lprint("D Shader presets index is outdated, rebuilding it: %r", (index_path,))
+
+        index = _ShaderPresetsIndex.__build(path)
+        if index is None:
+            return None
+
+        tmp_dir = _ShaderPresetsIndex.__tmp_dir
+
+        # check temp directory max size and do a cleanup if cache exceeded it
+        if _path_utils.get_tree_size(tmp_dir) >= _CACHE_consts.max_size:
+            _path_utils.rmtree(tmp_dir)
+
+        # ensure temp directory
+        os.makedirs(tmp_dir, exist_ok=True)
+
+        # dump the key it was built for and the index into temporary file first,
+        # so interrupted dump can't leave truncated index behind
+        tmp_index_path = index_path + ".tmp"
+        with open(tmp_index_path, mode="wb") as file:
+            pickle.dump(key, file)
+            pickle.dump(index, file)
+        os.replace(tmp_index_path, index_path)
+
+        return index
+
+
 class _ConfigSection:
     """Class implementing common functionalities of all config sections."""
 
@@ -480,6 +666,8 @@ class Export(_ConfigSection):
             "ExportPicFile": (int, get_default(scs_globals, 'export_pic_file'), 'export_pic_file'),
             "ExportPipFile": (int, get_default(scs_globals, 'export_pip_file'), 'export_pip_file'),
             "SignExport": (int, get_default(scs_globals, 'export_write_signature'), 'export_write_signature'),
+            "WriteIfChanged": (int, get_default(scs_globals, 'export_write_if_changed'), 'export_write_if_changed'),
+            "MergeEquivalentMaterials": (int, get_default(scs_globals, 'export_merge_equivalent_materials'), 'export_merge_equivalent_materials'),
         }
 
 
@@ -910,109 +1098,33 @@ def update_shader_presets_path(shader_presets_filepath, reload_only=False):
     _shader_presets.clear()
 
     # ADD DEFAULT PRESET ITEM "<none>" INTO INVENTORY
-    _shader_presets.add_section("<none>", "<none>", "", None)
+    _shader_presets.add_section("<none>", "<none>", None)
 
     if os.path.isfile(shader_presets_abs_path):
 
-        presets_container = _pix.get_data_from_file(shader_presets_abs_path, '    ')
-
-        # ADD ALL SHADER PRESET ITEMS FROM FILE INTO INVENTORY
-        if presets_container:
-
-            # load all supported effects from dump file of python set or dictionary, where keys represent supported effects
-            # If file is not found then generate all combinations as before.
-            supported_effects_dict = None
-            supported_effects_path = os.path.join(_path_utils.get_addon_installation_paths()[0], "supported_effects.bin")
-            if os.path.isfile(supported_effects_path):
-                try:
-                    supported_effects_dict = pickle.load(open(supported_effects_path, mode="rb"))
-                except PermissionError:
-                    lprint("W Can't load supported effects file (persmission denied), please ensure read/write permissions for:\n\t   %r\n\t   "
-                           "Without supported effects file invalid combinations of shader and flavors can be created!",
-                           (os.path.dirname(supported_effects_path),),
-                           report_warnings=1)
-            else:
-                lprint("W Supported effects file is missing! Make sure latest SCS Blender Tools Mod is installed.\n\t   "
-                       "Without supported effects file invalid combinations of shader and flavors can be created!",
-                       report_warnings=1)
-
-            # sort sections to shaders and flavors
-            shaders = []
-            flavors = {}
-            for section in presets_container:
-                if section.type == "Shader":
-                    shaders.append(section)
-                elif section.type == "Flavor":
-                    flavors[section.get_prop_value("Type")] = section
-
-            for shader in shaders:
-                unique_names = []
-                shader_flavors = shader.get_prop_value("Flavors")
-
-                # create new preset item
-                shader_preset_name = shader.get_prop_value("PresetName")
-                shader_preset_effect = shader.get_prop_value("Effect")
-                unique_names.append("")
-                _shader_presets.add_section(shader_preset_effect, shader_preset_name, "", shader)
-
-                if shader_flavors:
-
-                    for j, flavor_types in enumerate(shader_flavors):
-
-                        # create new flavor item
-                        _shader_presets.add_flavor(shader_preset_name)
-
-                        new_unique_names = []
-                        for i, flavor_type in enumerate(flavor_types.split("|")):
+        shader_presets_index = _ShaderPresetsIndex.retrieve(shader_presets_abs_path)
 
-                            if flavor_type not in flavors:
-                                lprint("D Flavor used by shader preset, but not defined: %s", (flavor_type,))
-                                continue
+        # ADD ALL SHADER PRESET ITEMS FROM INDEX INTO INVENTORY
+        if shader_presets_index:
 
-                            # create new flavor variant item (there can be more variants eg. "BLEND_ADD|BLEND_OVER")
-                            flavor_variant_name = flavors[flavor_type].get_prop_value("Name")
-                            _shader_presets.add_flavor_variant(shader_preset_name, flavor_type, flavor_variant_name)
+            supported_effects, presets = shader_presets_index
+            _shader_presets.set_supported_effects(supported_effects)
 
-                            # modify and save section as string into cache
-                            for unique_name in unique_names:
+            # add only pure presets and their flavors, combinations are resolved by library on first request
+            for shader_preset_effect, shader_preset_name, shader, shader_flavors in presets:
 
-                                new_unique_str = unique_name + "." + flavor_variant_name
-                                new_full_effect_name = shader_preset_effect + new_unique_str
-
-                                # check if this shader-flavor combination can exists, if not skip it
-                                if supported_effects_dict and new_full_effect_name not in supported_effects_dict:
-                                    lprint("S Marking none existing effect as dirty: %r", (new_full_effect_name,))
-                                    is_dirty = True
-                                else:
-                                    is_dirty = False
-
-                                section = _shader_presets.get_section(shader_preset_name, unique_name)
-
-                                for flavor_section in flavors[flavor_type].sections:
-
-                                    flavor_section_tag = flavor_section.get_prop_value("Tag")
-                                    # check if current flavor section already exists in section,
-                                    # then override props and sections directly otherwise add flavor section
-                                    for subsection in section.sections:
-
-                                        subsection_tag = subsection.get_prop_value("Tag")
-                                        if subsection_tag and subsection_tag == flavor_section_tag:
-
-                                            subsection.props = flavor_section.props
-                                            subsection.sections = flavor_section.sections
-                                            break
+                # create new preset item
+                _shader_presets.add_section(shader_preset_effect, shader_preset_name, shader)
 
-                                    else:
-                                        section.sections.append(flavor_section)
+                for flavor_variants in shader_flavors:
 
-                                new_unique_names.append(new_unique_str)
-                                assert section.set_prop_value("Effect", shader_preset_effect + new_unique_str)
-                                _shader_presets.add_section(shader_preset_effect, shader_preset_name, new_unique_str, section, is_dirty=is_dirty)
+                    # create new flavor item
+                    _shader_presets.add_flavor(shader_preset_name)
 
-                        unique_names.extend(new_unique_names)
+                    for flavor_type, flavor_variant_name, flavor_section in flavor_variants:
+                        _shader_presets.add_flavor_variant(shader_preset_name, flavor_type, flavor_variant_name, flavor_section)
 
-            # now as we built library it's time to clean it up of dirty items (eg. none existing effect combinations) and
-            # set path from which this library was initialized
+            # now as we built library it's time to set path from which this library was initialized
             _shader_presets.set_library_initialized(shader_presets_abs_path)
 
     if not reload_only:
@@ -1573,10 +1685,13 @@ def apply_settings(preload_from_blend=False):
     :param preload_from_blend: bool
     """
 
+    scs_globals = _get_scs_globals()
+
     if preload_from_blend:
         _load_scs_globals_from_blend()
 
-    scs_globals = _get_scs_globals()
+        # loading from blend sets dump level without triggering it's update function, so update printouts directly
+        _printout.set_dump_level(scs_globals.dump_level)
 
     # avoid recursion if another apply settings is running already
     if scs_globals.config_update_lock:
@@ -1598,4 +1713,7 @@ def apply_settings(preload_from_blend=False):
         # release lock as properties are applied
         release_config_lock(use_paths_init_callback=not bpy.app.background)
 
+    # make sure printouts are using applied dump level
+    _printout.set_dump_level(scs_globals.dump_level)
+
     return True
@@ -18,15 +18,93 @@
 
 # Copyright (C) 2013-2014: SCS Software
 
+import numpy
 import os
 import re
 from mathutils import Vector
+from queue import Queue
+from threading import Thread
+from time import perf_counter
 from io_scs_tools_mod.internals.containers.parsers import pix as _pix_parser
 from io_scs_tools_mod.internals.containers.writers import pix as _pix_writer
 from io_scs_tools_mod.internals.structure import SectionData as _SectionData
 from io_scs_tools_mod.utils import path as _path_utils
+from io_scs_tools_mod.utils import timing as _timing_utils
 from io_scs_tools_mod.utils.printout import lprint
 
+_BACKGROUND_WRITER_MAX_PENDING = 2
+"""Maximum number of containers waiting to be written by background writer, before main thread gets blocked."""
+
+
+class _BackgroundWriter:
+    """Writer serializing fully built containers into files on worker thread,
+    so main thread can continue gathering data for next file in the meantime.
+
+    Worker thread doesn't print anything, results are collected and reported on main thread upon finish.
+    """
+
+    def __init__(self, max_pending):
+        """Create and start background writer.
+
+        :param max_pending: maximum number of pending containers, adding more will block until one gets written
+        :type max_pending: int
+        """
+        self.__queue = Queue(maxsize=max_pending)
+        """Queue of pending write jobs, None marks the end of jobs."""
+        self.__results = []
+        """:type: list[tuple[str, float | None, float, BaseException | None]]"""
+        """Results of write jobs as tuples: (filepath, modification time before write, write duration, error)."""
+        self.__thread = Thread(target=self.__run, name="SCS PIX Writer", daemon=True)
+        self.__thread.start()
+
+    def __run(self):
+        """Worker thread loop writing queued containers until end of jobs is received."""
+        while True:
+            job = self.__queue.get()
+            if job is None:
+                break
+
+            container, filepath, ind, write_if_changed, old_mtime = job
+
+            start = perf_counter()
+            error = None
+            try:
+                _pix_writer.write_data(container, filepath, ind, False, False, write_if_changed=write_if_changed)
+            except Exception as e:
+                error = e
+
+            self.__results.append((filepath, old_mtime, perf_counter() - start, error))
+
+    def put(self, container, filepath, ind, write_if_changed):
+        """Queues container for writing into given filepath. Blocks if maximum of pending containers is reached.
+
+        :param container: fully built container, it shouldn't be changed afterwards
+        :type container: list[io_scs_tools_mod.internals.structure.SectionData]
+        :param filepath: path to file where container should be written
+        :type filepath: str
+        :param ind: indentation string
+        :type ind: str
+        :param write_if_changed: should file be replaced only when content changed
+        :type write_if_changed: bool
+        """
+        old_mtime = os.path.getmtime(filepath) if write_if_changed and os.path.isfile(filepath) else None
+        self.__queue.put((container, filepath, ind, write_if_changed, old_mtime))
+
+    def finish(self):
+        """Waits for all queued containers to be written and stops worker thread.
+
+        :return: results of write jobs as tuples: (filepath, modification time before write, write duration, error)
+        :rtype: list[tuple[str, float | None, float, BaseException | None]]
+        """
+        self.__queue.put(None)
+        self.__thread.join()
+        return self.__results
+
+
+_background_writer = None
+""":type: _BackgroundWriter | None"""
+"""Currently running background writer; None if files are written directly."""
+
 
 def fast_check_for_pia_skeleton(pia_filepath, skeleton):
     """Check for the skeleton record in PIA file without parsing the whole file.
@@ -104,37 +182,43 @@ def make_triangle_stream(stream_raw):
     :return:
     """
     stream = _SectionData("Triangles")
-    for item in stream_raw:
-        stream.data.append(item)
+    if isinstance(stream_raw, numpy.ndarray):  # rows of triangle array are written directly
+        stream.data = stream_raw
+    else:
+        for item in stream_raw:
+            stream.data.append(item)
     return stream
 
 
-def make_stream_section(data, data_tag, aliases):
+def make_stream_section(data, data_tag, aliases, data_format=None):
     """Takes data and their tag returns a stream section.
 
     :param data: Section data
-    :type data: list
+    :type data: list | numpy.ndarray
     :param data_tag: Tag (name) for the Section
     :type data_tag: str
     :param aliases: tuple of strings (aliases)
     :type aliases: tuple
+    :param data_format: format of the data (eg. "FLOAT3"); if not given it's determined from the first data item
+    :type data_format: str | None
     :return: 'Stream' Section data
     :rtype: SectionData
     """
     # print('data: %s type: %s' % (str(data[0]), str(type(data[0]))))
-    if type(data[0]) is Vector:
-        data_type = 'NIC'
-        if type(data[0][0]) is type(0.0):
-            data_type = 'FLOAT'
-        elif type(data[0][0]) is type(0):
-            data_type = 'INT'
-        data_format = str(data_type + str(len(data[0])))
-    elif data[0][0] == "__matrix__":
-        data_format = 'FLOAT4x4'
-    elif data[0][0] == "__time__":
-        data_format = 'FLOAT'
-    else:
-        data_format = 'UNKNOWN_FORMAT'
+    if data_format is None:
+        if type(data[0]) is Vector:
+            data_type = 'NIC'
+            if type(data[0][0]) is type(0.0):
+                data_type = 'FLOAT'
+            elif type(data[0][0]) is type(0):
+                data_type = 'INT'
+            data_format = str(data_type + str(len(data[0])))
+        elif data[0][0] == "__matrix__":
+            data_format = 'FLOAT4x4'
+        elif data[0][0] == "__time__":
+            data_format = 'FLOAT'
+        else:
+            data_format = 'UNKNOWN_FORMAT'
     # print(' format: %r' % format)
     stream_section = _SectionData("Stream")
     stream_section.props.append(("Format", data_format))
@@ -198,7 +282,8 @@ def get_data_from_file(filepath, ind, print_progress=False, print_info=False):
         return None
 
     # print('    filepath: "%s"\n' % filepath)
-    container, state = _pix_parser.read_data(filepath, ind, print_progress, print_info)
+    with _timing_utils.stage("parse"):
+        container, state = _pix_parser.read_data(filepath, ind, print_progress, print_info)
     if len(container) < 1:
         lprint('\nE File "%s" is empty!', (_path_utils.readable_norm(filepath),))
         return None
@@ -209,7 +294,69 @@ def get_data_from_file(filepath, ind, print_progress=False, print_info=False):
     return container
 
 
-def write_data_to_file(container, filepath, ind, print_progress=False, print_info=False):
+def begin_background_writing():
+    """Begins writing of files on background thread. Until "end_background_writing" is called,
+    "write_data_to_file" called with "background" argument only queues containers and returns immediately,
+    reporting of results is postponed.
+    """
+    global _background_writer
+
+    # finish any writer left over by interrupted export, so no file gets lost
+    if _background_writer is not None:
+        end_background_writing()
+
+    _background_writer = _BackgroundWriter(_BACKGROUND_WRITER_MAX_PENDING)
+
+
+def end_background_writing():
+    """Waits for all files queued since "begin_background_writing" to be written and reports results.
+
+    :return: True if all files were successfully written or there was no background writing; False otherwise
+    :rtype: bool
+    """
+    global _background_writer
+
+    if _background_writer is None:
+        return True
+
+    writer = _background_writer
+    _background_writer = None
+
+    with _timing_utils.stage("background write wait"):
+        results = writer.finish()
+
+    success = True
+    for filepath, old_mtime, duration, error in results:
+        _timing_utils.add_stage("file write", duration)
+        success &= __report_write_result__(filepath, old_mtime, error)
+
+    return success
+
+
+def __report_write_result__(filepath, old_mtime, error):
+    """Reports result of file write.
+
+    :param filepath: path of written file
+    :type filepath: str
+    :param old_mtime: modification time of the file before write; None if file didn't exist or is always replaced
+    :type old_mtime: float | None
+    :param error: error raised during write; None if write was successful
+    :type error: BaseException | None
+    :return: True if file was successfully written; False otherwise
+    :rtype: bool
+    """
+    if error is not None:
+        lprint("E Unable to export data into file:\n\t   %r\n\t   %s: %s", (filepath, type(error).__name__, error))
+        return False
+
+    if old_mtime is not None and os.path.isfile(filepath) and os.path.getmtime(filepath) == old_mtime:
+        lprint("I File %r unchanged, existing file kept!", (os.path.basename(filepath),))
+    else:
+        lprint("I File %r successfully written!", (os.path.basename(filepath),))
+    return True
+
+
+def write_data_to_file(container, filepath, ind, print_progress=False, print_info=False, background=False, write_if_changed=False):
     """Exports given container in given filepath.
 
     :param container:
@@ -222,7 +369,11 @@ def write_data_to_file(container, filepath, ind, print_progress=False, print_inf
     :type print_progress: bool
     :param print_info: should infos be printed
     :type print_info: bool
-    :return: True if export was successfull, otherwise False
+    :param background: should container be queued to background writer if background writing is in progress
+    :type background: bool
+    :param write_if_changed: should existing file be kept untouched if it's content is the same as written one
+    :type write_if_changed: bool
+    :return: True if export was successfull or container was queued for background writing, otherwise False
     :rtype: bool
     """
 
@@ -230,10 +381,18 @@ def write_data_to_file(container, filepath, ind, print_progress=False, print_inf
     # path will be properly readable even on windows. Without mixed back and forward slashes.
     filepath = _path_utils.readable_norm(filepath)
 
-    result = _pix_writer.write_data(container, filepath, ind, print_progress, print_info)
+    # with background writing requested and in progress just queue container, results are reported once writing ends.
+    # NOTE: progress can't be reported from worker thread, so it's skipped in that case
+    if background and _background_writer is not None and not print_info:
+        _background_writer.put(container, filepath, ind, write_if_changed)
+        return True
+
+    old_mtime = os.path.getmtime(filepath) if write_if_changed and os.path.isfile(filepath) else None
+
+    with _timing_utils.stage("file write"):
+        result = _pix_writer.write_data(container, filepath, ind, print_progress, print_info, write_if_changed=write_if_changed)
     if result != {'FINISHED'}:
         lprint("E Unable to export data into file:\n\t   %r\n\t   For details check printouts above.", (filepath,))
         return False
     else:
-        lprint("I File %r successfully written!", (os.path.basename(filepath),))
-        return True
+        return __report_write_result__(filepath, old_mtime, None)
@@ -18,6 +18,9 @@
 
 # Copyright (C) 2013-2022: SCS Software
 
+import os
+import shutil
+from hashlib import sha256
 from io_scs_tools_mod.utils.convert import float_to_hex_string, float_array_to_hex_string
 from io_scs_tools_mod.utils.printout import lprint
 
@@ -25,6 +28,8 @@ _LIST_TYPE = list
 _STR_TYPE = str
 _FLOAT_TYPE = float
 _INT_TYPE = int
+_TMP_FILE_SUFFIX = ".tmp"
+_DIGEST_CHUNK_SIZE = 1024 * 1024
 _STR_PROHIBITED_TYPES = {"FLOAT", "FLOAT2", "FLOAT3", "FLOAT4", "FLOAT5", "FLOAT6", "FLOAT7", "FLOAT8", "FLOAT9", "FLOAT4x4", "INT", "INT2", "STRING"}
 
 
@@ -46,7 +51,9 @@ def _format_bone(data_line, ind):
     formatted line of hexadecimal values in a string."""
     line_start = str(ind + (8 * " "))
     bone_name = data_line[1]
-    if data_line[2]:
+    if isinstance(data_line[2], _STR_TYPE):
+        bone_parent = data_line[2]
+    elif data_line[2]:
         bone_parent = str(data_line[2].name)
     else:
         bone_parent = ""
@@ -176,16 +183,15 @@ def _write_section(fw, section, ind, orig_ind, print_info):
     fw('%s}\n' % in_ind)
 
 
-def write_data(container, filepath, ind, print_progress, print_info):
-    """This function is called from outside of this script. It takes
-    data container, file path and string of indentation characters
-    and it saves all data to the file."""
-    # print_info = 0 ## Debug printouts
-    orig_ind = ind
+def _write_file(filepath, container, ind, print_progress, print_info, progress_filepath):
+    """Writes all sections of given container into the file."""
+    with open(filepath, mode="w", encoding="utf8", newline="\n") as file:
+        _write_container(file.write, container, progress_filepath, ind, print_progress, print_info)
+
 
-    # WRITE TO FILE
-    file = open(filepath, mode="w", encoding="utf8", newline="\n")
-    fw = file.write
+def _write_container(fw, container, filepath, ind, print_progress, print_info):
+    """Writes all sections of given container with given write function."""
+    orig_ind = ind
 
     sections_count = len(container)
     for section_i, section in enumerate(container):
@@ -203,6 +209,62 @@ def write_data(container, filepath, ind, print_progress, print_info):
         if print_progress:
             lprint("S Writting %s file - %i%% done ...", (filepath[-3:].upper(), (section_i + 1) / sections_count * 100), immediate_timeout=5)
     fw('\n')
-    file.close()
+
+
+def _get_file_digest(filepath):
+    """Calculates digest of the file content, reading it in chunks."""
+    digest = sha256()
+    with open(filepath, mode="rb") as file:
+        for chunk in iter(lambda: file.read(_DIGEST_CHUNK_SIZE), b""):
+            digest.update(chunk)
+    return digest.digest()
+
+
+def _is_same_content(filepath_a, filepath_b):
+    """Compares content of two files, first by their size and then by their digest."""
+    if not os.path.isfile(filepath_a) or not os.path.isfile(filepath_b):
+        return False
+
+    if os.path.getsize(filepath_a) != os.path.getsize(filepath_b):
+        return False
+
+    return _get_file_digest(filepath_a) == _get_file_digest(filepath_b)
+
+
+def write_data(container, filepath, ind, print_progress, print_info, write_if_changed=False):
+    """This function is called from outside of this script. It takes
+    data container, file path and string of indentation characters
+    and it saves all data to the file.
+
+    NOTE: without progress and info printouts function doesn't access Blender data,
+    so it can be safely called from worker thread.
+
+    If writing only changed files is requested, data are first written into temporary file
+    next to the given one, which then atomically replaces given file only if content differs.
+    This way unchanged files keep their modification time."""
+    # print_info = 0 ## Debug printouts
+
+    if not write_if_changed:
+        # WRITE TO FILE
+        _write_file(filepath, container, ind, print_progress, print_info, filepath)
+
+        return {'FINISHED'}
+
+    # WRITE TO TEMPORARY FILE
+    tmp_filepath = filepath + _TMP_FILE_SUFFIX
+    try:
+        _write_file(tmp_filepath, container, ind, print_progress, print_info, filepath)
+
+        if _is_same_content(tmp_filepath, filepath):
+            os.remove(tmp_filepath)
+        else:
+            # keep permission bits of the original file, as it's replaced by freshly created one
+            if os.path.isfile(filepath):
+                shutil.copymode(filepath, tmp_filepath)
+            os.replace(tmp_filepath, filepath)
+    except Exception:
+        if os.path.isfile(tmp_filepath):
+            os.remove(tmp_filepath)
+        raise
 
     return {'FINISHED'}
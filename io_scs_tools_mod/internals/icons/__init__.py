@@ -27,68 +27,51 @@ from io_scs_tools_mod.utils.printout import lprint
 PCOLLS = "custom_icons"
 PCOLLS_IDX_MAP = PCOLLS + "_index_map"
 PCOLLS_NAME_MAP = PCOLLS + "_name_map"
+THEME_DIRS = "theme_dirs"
 CURRENT_THEME = "theme"
 
 _cache = {
-    PCOLLS: {},  # multiple preview collections, one per theme
+    PCOLLS: {},  # multiple preview collections, one per loaded theme
     PCOLLS_IDX_MAP: {},  # map of theme indices to theme names
     PCOLLS_NAME_MAP: {},  # map of theme names to theme indices
+    THEME_DIRS: {},  # map of available theme names to their icons directories
     CURRENT_THEME: _ICON_consts.default_icon_theme  # default theme
 }
 
 
 def register():
     """Initialization function for getting hold of preview collection variable with already created custom icon objects.
+    Only icons of current theme are loaded, other themes are loaded on their first usage.
     """
 
     tools_paths = _path.get_addon_installation_paths()
     if len(tools_paths) <= 0:
         return
 
-    # load icon themes
+    # find icon themes
     icon_themes_dir = os.path.join(tools_paths[0], 'ui', 'icons')
     if not os.path.isdir(icon_themes_dir):
         return
 
     theme_idx = 0
-    for theme_name in os.listdir(icon_themes_dir):
+    for theme_name in sorted(os.listdir(icon_themes_dir)):
         icon_theme_dir = os.path.join(icon_themes_dir, theme_name)
 
         # ignore all none directory entries
         if not os.path.isdir(icon_theme_dir):
             continue
 
-        # create new preview only once.
-        # NOTE: We removed previews cleanup from code
-        # because it was crashing Blender when rapidly enabling/disabling BT addon.
-        # So instead of always creating new preview collection we rather reuse existing and
-        # only load icons again with force reload flag, to ensure icons are always reloaded when init is called.
-        if theme_name not in _cache[PCOLLS]:
-
-            pcoll = previews.new()
-            _cache[PCOLLS][theme_name] = pcoll
-            _cache[PCOLLS_NAME_MAP][theme_idx] = theme_name
-            _cache[PCOLLS_IDX_MAP][theme_name] = theme_idx
-            theme_idx += 1
-        else:
-
-            pcoll = _cache[PCOLLS][theme_name]
-            print("INFO\t- Icon collection is already in python memory, re-using it!")
-
-        for icon_type in _ICON_consts.Types.as_list():
-
-            # create path to current icon "ui/icons/<theme_name>/<icon_type>"
-            icon_path = os.path.join(icon_theme_dir, icon_type)
-            if os.path.isfile(icon_path):
-                if icon_type not in pcoll:
-                    pcoll.load(icon_type, icon_path, 'IMAGE', force_reload=True)
-            else:
-                print("WARNING\t- Icon %r is missing. Please try to install addon again!" % icon_type)
+        _cache[THEME_DIRS][theme_name] = icon_theme_dir
+        _cache[PCOLLS_NAME_MAP][theme_idx] = theme_name
+        _cache[PCOLLS_IDX_MAP][theme_name] = theme_idx
+        theme_idx += 1
 
     # if current theme doesn't exists, use first instead
-    if _cache[CURRENT_THEME] not in _cache[PCOLLS] and len(_cache[PCOLLS]) > 0:
+    if _cache[CURRENT_THEME] not in _cache[THEME_DIRS] and len(_cache[THEME_DIRS]) > 0:
         set_theme(get_theme_name(0))
         print("WARNING\t- Default icon theme doesn't exist, fallback to first available!")
+    elif _cache[CURRENT_THEME] in _cache[THEME_DIRS]:
+        __load_theme__(_cache[CURRENT_THEME])
 
 
 def unregister():
@@ -100,15 +83,49 @@ def unregister():
     _cache[PCOLLS].clear()
     _cache[PCOLLS_IDX_MAP].clear()
     _cache[PCOLLS_NAME_MAP].clear()
+    _cache[THEME_DIRS].clear()
+
+
+def __load_theme__(theme_name):
+    """Loads icons of given theme into its preview collection.
+
+    :param theme_name: name of the theme to load
+    :type theme_name: str
+    :return: True if theme is loaded; False if theme doesn't exist
+    :rtype: bool
+    """
+
+    if theme_name in _cache[PCOLLS]:
+        return True
+
+    if theme_name not in _cache[THEME_DIRS]:
+        return False
+
+    icon_theme_dir = _cache[THEME_DIRS][theme_name]
+
+    pcoll = previews.new()
+    _cache[PCOLLS][theme_name] = pcoll
+
+    for icon_type in _ICON_consts.Types.as_list():
+
+        # create path to current icon "ui/icons/<theme_name>/<icon_type>"
+        icon_path = os.path.join(icon_theme_dir, icon_type)
+        if os.path.isfile(icon_path):
+            pcoll.load(icon_type, icon_path, 'IMAGE', force_reload=True)
+        else:
+            print("WARNING\t- Icon %r is missing. Please try to install addon again!" % icon_type)
+
+    return True
 
 
 def set_theme(theme):
-    """Set current used icons theme
+    """Set current used icons theme. Icons of the theme are loaded if they weren't yet.
 
     :param theme: icons theme to use
     :type theme: str
     """
     _cache[CURRENT_THEME] = theme
+    __load_theme__(theme)
 
 
 def get_theme_name(idx):
@@ -145,21 +162,21 @@ def get_current_theme_idx():
 
 
 def get_loaded_themes():
-    """Gets list of loaded theme names.
+    """Gets list of available theme names. Icons of the theme are actually loaded on its first usage.
 
     :return: random ordered theme names
     :rtype: list[str]
     """
-    return list(_cache[PCOLLS].keys())
+    return list(_cache[THEME_DIRS].keys())
 
 
 def has_loaded_themes():
-    """Tells if there are any loaded themes available.
+    """Tells if there are any themes available.
 
-    :return: True if any themes are currently loaded, False otherwise
+    :return: True if any themes are currently available, False otherwise
     :rtype: bool
     """
-    return len(_cache[PCOLLS]) > 0
+    return len(_cache[THEME_DIRS]) > 0
 
 
 def get_icon(icon_type):
@@ -172,7 +189,7 @@ def get_icon(icon_type):
 
     current_theme = _cache[CURRENT_THEME]
 
-    if current_theme not in _cache[PCOLLS]:
+    if current_theme not in _cache[PCOLLS] and not __load_theme__(current_theme):
         lprint("E Icons not yet initialized, Blender Tools were not properply initialized!")
         return 0
 
@@ -29,6 +29,88 @@ _IGNORED_TEXTURE_PROPS = ("_settings", "_locked", "_map_type")
 _IGNORED_PROPS = ("mat_id", "enable_aliasing")
 
 
+class _MaterialEntrySchema:
+    """Schema of material "scs_props" property group, used when material entries are created or applied.
+    It's built from RNA definition of property group once, so entries are handled with simple lookups
+    instead of RNA reflection per each property of each material.
+    """
+
+    def __init__(self, props_rna):
+        """Create schema from RNA definition of material "scs_props" property group.
+
+        :param props_rna: RNA definition of material scs props property group
+        :type props_rna: bpy.types.Struct
+        """
+        self.serializable_keys = {}
+        """:type: dict[str, bool]"""
+        """Serializable property keys mapped to flag indicating if property is collection property."""
+        self.collection_entry_keys = {}
+        """:type: dict[str, tuple[str]]"""
+        """Collection property keys mapped to keys of properties inside of collection entry."""
+        self.ignored_keys = set()
+        """:type: set[str]"""
+        """Property keys which are never saved into look material entry."""
+        self.unsettable_keys = set()
+        """:type: set[str]"""
+        """Property keys which can be unset, when they are not present in look material entry."""
+
+        for prop in props_rna.properties:
+
+            key = prop.identifier
+            if key == "rna_type":
+                continue
+
+            is_ignored = (key.startswith("shader_texture_") and key.endswith(_IGNORED_TEXTURE_PROPS)) or key in _IGNORED_PROPS
+            is_collection = prop.type == "COLLECTION"
+
+            if is_ignored:
+                self.ignored_keys.add(key)
+            else:
+                self.serializable_keys[key] = is_collection
+
+                if is_collection:
+                    entry_keys = [entry_prop.identifier for entry_prop in prop.fixed_type.properties if entry_prop.identifier != "rna_type"]
+                    self.collection_entry_keys[key] = tuple(entry_keys)
+
+            if (key.startswith("shader_attribute") or key.startswith("shader_texture")) and not is_ignored:
+                self.unsettable_keys.add(key)
+
+
+_SCHEMA = None
+""":type: _MaterialEntrySchema | None"""
+"""Cached schema of material "scs_props", built upon registration of material properties."""
+
+
+def register_schema(props_cls):
+    """Builds and caches schema of material "scs_props" from given registered property group class.
+
+    :param props_cls: registered material scs props property group class
+    :type props_cls: type[bpy.types.PropertyGroup]
+    """
+    global _SCHEMA
+    _SCHEMA = _MaterialEntrySchema(props_cls.bl_rna)
+
+
+def unregister_schema():
+    """Drops cached schema of material "scs_props"."""
+    global _SCHEMA
+    _SCHEMA = None
+
+
+def __get_schema__(material):
+    """Gets schema of material "scs_props". If schema wasn't yet registered it's built from given material.
+
+    :param material: material which scs props RNA is used if schema is not yet built
+    :type material: bpy.types.Material
+    :return: schema of material scs props
+    :rtype: _MaterialEntrySchema
+    """
+    global _SCHEMA
+    if _SCHEMA is None:
+        _SCHEMA = _MaterialEntrySchema(material.scs_props.bl_rna)
+    return _SCHEMA
+
+
 def add_look(root_obj, look_id):
     """Creates and adds look with given ID to SCS root object.
     If look is not yet in dictionary it will be added otherwise nothing will be done.
@@ -111,18 +193,21 @@ def apply_active_look(root_obj, force_apply=False):
             lprint("D Can't properly apply look! Look entry with ID: %s is missing data for material: %r", (look_id_str, material.name))
             continue
 
+        schema = __get_schema__(material)
+
         mat_data = look_data[mat_id_str]
         for prop in mat_data:
-            lprint("S |- attr set: %r => %r", (prop, mat_data[prop]))
+            prop_value = mat_data[prop]
+            lprint("S |- attr set: %r => %r", (prop, prop_value))
 
             different = False  # apply value change and invoke update only if property is different
-            if isinstance(mat_data[prop], Iterable) and "CollectionProperty" in mat_data[prop]:
+            if prop in schema.collection_entry_keys and isinstance(prop_value, Iterable) and "CollectionProperty" in prop_value:
                 coll_property = getattr(material.scs_props, prop, None)
                 if coll_property:
                     different = True
                     last_entry = None
                     coll_property.clear()
-                    for entry in mat_data[prop]["entries"]:
+                    for entry in prop_value["entries"]:
                         new_entry = coll_property.add()
                         for key in entry:
                             new_entry[key] = entry[key]
@@ -135,9 +220,9 @@ def apply_active_look(root_obj, force_apply=False):
                     if update_func and different:
                         update_func(material)
             else:
-                different = (prop not in material.scs_props or material.scs_props[prop] != mat_data[prop])
+                different = (prop not in material.scs_props or material.scs_props[prop] != prop_value)
                 if different:
-                    material.scs_props[prop] = mat_data[prop]
+                    material.scs_props[prop] = prop_value
 
             update_func = getattr(material.scs_props, "update_" + prop, None)
             # invoke update function on property if exists
@@ -149,9 +234,7 @@ def apply_active_look(root_obj, force_apply=False):
 
         # unset any unused
         for prop in list(material.scs_props.keys()):
-            valid_prefix = (prop.startswith("shader_attribute") or prop.startswith("shader_texture"))
-            is_not_ignored = not ((prop.startswith("shader_texture") and prop.endswith(_IGNORED_TEXTURE_PROPS)) or prop in _IGNORED_PROPS)
-            if prop not in mat_data and valid_prefix and is_not_ignored:
+            if prop in schema.unsettable_keys and prop not in mat_data:
                 lprint("S |- attr unset: %r", (prop,))
                 material.scs_props.property_unset(prop)
 
@@ -268,45 +351,49 @@ def write_through(root_obj, material, prop):
     :return: number of overwritten looks; If something goes wrong -1 is returned
     :rtype: int
     """
+    return write_props_through(root_obj, material, (prop,))
+
+
+def write_props_through(root_obj, material, props=None):
+    """Writes given properties from material to all looks within this SCS game object in one pass.
+    Values of properties are read and serialized only once for all of the looks.
+
+    :param root_obj: scs root object from which looks data will be taken
+    :type root_obj: bpy.types.Object
+    :param material: material from which properties values should be taken
+    :type material: bpy.types.Material
+    :param props: property strings which should be written through; if None whole material entry is written through
+    :type props: collections.abc.Iterable[str] | None
+    :return: number of looks with at least one overwritten property; If something goes wrong -1 is returned
+    :rtype: int
+    """
     if not root_obj or not material:
         return -1
 
-    if _MAIN_DICT not in root_obj or not hasattr(material.scs_props, prop):
+    if _MAIN_DICT not in root_obj:
+        return -1
+
+    if props is None:
+        prop_values = __create_material_entry__(material)
+    else:
+        prop_values = __get_prop_values__(material, props)
+
+    if not prop_values:
         return -1
 
     written_looks_count = 0
 
     mat_id_str = str(material.scs_props.id)
-    for look_id in root_obj[_MAIN_DICT]:
-        curr_look = root_obj[_MAIN_DICT][look_id]
+    for look_id, curr_look in root_obj[_MAIN_DICT].items():
 
         if mat_id_str not in curr_look:
             lprint("D Look with ID: %s doesn't have entry for material %r in SCS Root %r,\n\t   " +
-                   "property %r won't be updated!",
-                   (look_id, material.name, root_obj.name, prop))
-            continue
-        elif prop not in curr_look[mat_id_str]:
-            lprint("D Look with ID: %s is not synced, property %r won't be updated!", (look_id, prop))
+                   "properties %r won't be updated!",
+                   (look_id, material.name, root_obj.name, list(prop_values.keys())))
             continue
 
-        curr_prop = getattr(material.scs_props, prop)
-        curr_prop_type = material.scs_props.bl_rna.properties[prop].bl_rna.identifier
-        if "CollectionProperty" in curr_prop_type:
-
-            coll_prop_entry = {"CollectionProperty": 1, "entries": []}
-
-            for coll_entry in curr_prop:
-                entry = {}
-                for coll_key in coll_entry.keys():
-                    entry[coll_key] = getattr(coll_entry, coll_key)
-
-                coll_prop_entry["entries"].append(entry)
-
-            curr_look[mat_id_str][prop] = coll_prop_entry
-        else:
-            curr_look[mat_id_str][prop] = curr_prop
-
-        written_looks_count += 1
+        if __write_prop_values__(curr_look[mat_id_str], prop_values, look_id) > 0:
+            written_looks_count += 1
 
     return written_looks_count
 
@@ -325,10 +412,36 @@ def write_prop_to_look(root_obj, look_id, material, prop):
     :return: True if property was written successfully; False otherwise
     :rtype: bool
     """
+    return write_props_to_look(root_obj, look_id, material, (prop,))
+
+
+def write_props_to_look(root_obj, look_id, material, props=None):
+    """Writes given properties from material to given look of given SCS game object.
+
+    :param root_obj: scs root object from which looks data will be taken
+    :type root_obj: bpy.types.Object
+    :param look_id: look id to which properties should be written
+    :type look_id: int
+    :param material: material from which properties values should be taken
+    :type material: bpy.types.Material
+    :param props: property strings which should be written; if None whole material entry is written
+    :type props: collections.abc.Iterable[str] | None
+    :return: True if all properties were written successfully; False if none of them was written
+    :rtype: bool
+    """
     if not root_obj or not material:
         return False
 
-    if _MAIN_DICT not in root_obj or not hasattr(material.scs_props, prop):
+    if _MAIN_DICT not in root_obj:
+        return False
+
+    if props is None:
+        prop_values = __create_material_entry__(material)
+    else:
+        props = tuple(props)
+        prop_values = __get_prop_values__(material, props)
+
+    if not prop_values or (props is not None and len(prop_values) != len(props)):
         return False
 
     mat_id_str = str(material.scs_props.id)
@@ -340,31 +453,18 @@ def write_prop_to_look(root_obj, look_id, material, prop):
     look_entry = root_obj[_MAIN_DICT][str(look_id)]
     if mat_id_str not in look_entry:
         lprint("D Look with ID: %s doesn't have entry for material %r in SCS Root %r,\n\t   " +
-               "property %r won't be updated!",
-               (look_id, material.name, root_obj.name, prop))
+               "properties %r won't be updated!",
+               (look_id, material.name, root_obj.name, list(prop_values.keys())))
         return False
 
-    if prop not in look_entry[mat_id_str]:
-        lprint("D Look with ID: %s is not synced, property %r won't be updated!", (look_id, prop))
+    # write all or nothing, so look doesn't end up partially modified if any property is missing in it
+    mat_entry = look_entry[mat_id_str]
+    missing_props = [prop for prop in prop_values if prop not in mat_entry]
+    if missing_props:
+        lprint("D Look with ID: %s is not synced, properties %r won't be updated!", (look_id, missing_props))
         return False
 
-    curr_prop = getattr(material.scs_props, prop)
-    curr_prop_type = material.scs_props.bl_rna.properties[prop].bl_rna.identifier
-    if "CollectionProperty" in curr_prop_type:
-
-        coll_prop_entry = {"CollectionProperty": 1, "entries": []}
-
-        for coll_entry in curr_prop:
-            entry = {}
-            for coll_key in coll_entry.keys():
-                entry[coll_key] = getattr(coll_entry, coll_key)
-
-            coll_prop_entry["entries"].append(entry)
-
-        look_entry[mat_id_str][prop] = coll_prop_entry
-    else:
-        look_entry[mat_id_str][prop] = curr_prop
-
+    __write_prop_values__(mat_entry, prop_values, look_id)
     return True
 
 
@@ -394,9 +494,10 @@ def add_materials(root_obj, mat_list):
         # add material to looks only if it doesn't yet exists in dictionary
         if new_mat_id_str not in existing_mats_ids:
 
-            # add new entry to all of the looks
-            for look_id in root_obj[_MAIN_DICT]:
-                root_obj[_MAIN_DICT][look_id][new_mat_id_str] = __create_material_entry__(new_mat)
+            # add new entry to all of the looks, entry is created only once as it's copied upon assignment anyway
+            new_mat_entry = __create_material_entry__(new_mat)
+            for look_data in root_obj[_MAIN_DICT].values():
+                look_data[new_mat_id_str] = new_mat_entry
 
             new_mats_added += 1
 
@@ -570,43 +671,111 @@ def __collect_materials__(root_obj):
     return collected_mats.values()
 
 
-def __create_material_entry__(material):
-    """Create material entry for looks dictionary from given material.
+def __get_prop_values__(material, props):
+    """Get values of given properties from material, as they are stored in looks.
+    Properties not existing on material are skipped.
 
-    :param material: material from which dictionary entry should be created
+    :param material: material from which properties values should be taken
     :type material: bpy.types.Material
-    :return: dictionary of all currently set "scs_props"
+    :param props: property strings for which values should be taken
+    :type props: collections.abc.Iterable[str]
+    :return: dictionary of properties values ready to be stored in look material entry
     :rtype: dict
     """
-    mat_entry = {}
-    for key in material.scs_props.keys():
+    scs_props = material.scs_props
+    schema = __get_schema__(material)
 
-        if (key.startswith("shader_texture_") and key.endswith(_IGNORED_TEXTURE_PROPS)) or key in _IGNORED_PROPS:
-            lprint("S Ignoring property in create material entry: %r", (key,))
+    prop_values = {}
+    for prop in props:
+
+        if not hasattr(scs_props, prop):
             continue
 
-        curr_prop = getattr(material.scs_props, key, "INVALID")
+        curr_prop = getattr(scs_props, prop)
+        if prop in schema.collection_entry_keys:
+            prop_values[prop] = __get_coll_prop_entry__(curr_prop, schema.collection_entry_keys[prop])
+        else:
+            prop_values[prop] = curr_prop
+
+    return prop_values
 
-        if curr_prop != "INVALID":
 
-            curr_prop_type = material.scs_props.bl_rna.properties[key].bl_rna.identifier
-            if "CollectionProperty" in curr_prop_type:
+def __get_coll_prop_entry__(coll_prop, entry_keys):
+    """Get collection property as it is stored in looks.
 
-                coll_prop_entry = {"CollectionProperty": 1, "entries": []}
+    :param coll_prop: collection property from material scs props
+    :type coll_prop: bpy.types.bpy_prop_collection
+    :param entry_keys: keys of properties inside of collection entry
+    :type entry_keys: tuple[str]
+    :return: dictionary with collection property marker and list of entries
+    :rtype: dict
+    """
+    coll_prop_entry = {"CollectionProperty": 1, "entries": []}
 
-                for coll_entry in curr_prop:
-                    entry = {}
-                    for coll_key in coll_entry.keys():
-                        entry[coll_key] = getattr(coll_entry, coll_key)
+    for coll_entry in coll_prop:
+        entry = {}
+        for coll_key in entry_keys:
+            if coll_key in coll_entry:
+                entry[coll_key] = getattr(coll_entry, coll_key)
 
-                    coll_prop_entry["entries"].append(entry)
+        coll_prop_entry["entries"].append(entry)
 
-                mat_entry[key] = coll_prop_entry
+    return coll_prop_entry
+
+
+def __write_prop_values__(mat_entry, prop_values, look_id):
+    """Writes given properties values to material entry of the look. Only properties already present in entry are written.
+
+    :param mat_entry: material entry of the look
+    :type mat_entry: idprop.types.IDPropertyGroup
+    :param prop_values: properties values ready to be stored in look
+    :type prop_values: dict
+    :param look_id: look id of given material entry, used for printouts
+    :type look_id: str | int
+    :return: number of written properties
+    :rtype: int
+    """
+    written_props_count = 0
+    for prop, value in prop_values.items():
+
+        if prop not in mat_entry:
+            lprint("D Look with ID: %s is not synced, property %r won't be updated!", (look_id, prop))
+            continue
+
+        mat_entry[prop] = value
+        written_props_count += 1
+
+    return written_props_count
+
+
+def __create_material_entry__(material):
+    """Create material entry for looks dictionary from given material.
+
+    :param material: material from which dictionary entry should be created
+    :type material: bpy.types.Material
+    :return: dictionary of all currently set "scs_props"
+    :rtype: dict
+    """
+    scs_props = material.scs_props
+    schema = __get_schema__(material)
+    serializable_keys = schema.serializable_keys
+
+    mat_entry = {}
+    for key in scs_props.keys():
+
+        is_collection = serializable_keys.get(key)
+
+        if is_collection is None:
+            if key in schema.ignored_keys:
+                lprint("S Ignoring property in create material entry: %r", (key,))
             else:
-                mat_entry[key] = curr_prop
+                lprint("D Create material entry requested invalid property: %r", (key,))
+            continue
 
+        if is_collection:
+            mat_entry[key] = __get_coll_prop_entry__(getattr(scs_props, key), schema.collection_entry_keys[key])
         else:
-            lprint("D Create material entry requested invalid property: %r", (key,))
+            mat_entry[key] = getattr(scs_props, key)
 
     return mat_entry
 
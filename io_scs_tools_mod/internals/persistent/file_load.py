@@ -24,6 +24,7 @@ from io_scs_tools_mod.consts import SCSLigthing as _LIGHTING_consts
 from io_scs_tools_mod.internals import looks as _looks
 from io_scs_tools_mod.internals import preview_models as _preview_models
 from io_scs_tools_mod.internals import shader_presets as _shader_presets
+from io_scs_tools_mod.internals.persistent import loop_check as _persistent_loop
 from io_scs_tools_mod.utils import material as _material_utils
 from io_scs_tools_mod.utils import object as _object_utils
 from io_scs_tools_mod.utils import info as _info_utils
@@ -35,6 +36,9 @@ from io_scs_tools_mod.utils import get_scs_globals as _get_scs_globals
 def post_load(scene):
     from io_scs_tools_mod.internals.containers.config import AsyncPathsInit
 
+    # newly loaded blend file has completely different objects, so children index has to be rebuilt
+    _persistent_loop._ChildrenIndex.invalidate()
+
     # get Blender Tools version from last blend file load
     last_load_bt_ver = _get_scs_globals().last_load_bt_version
 
@@ -92,6 +96,7 @@ def apply_fixes_for_0_6():
         if material.scs_props.mat_effect_name == "":
             continue
 
+        fixed_textures = []
         for tex_type in material.scs_props.get_texture_types():
 
             texture_attr_str = "shader_texture_" + tex_type
@@ -122,19 +127,23 @@ def apply_fixes_for_0_6():
                         if not is_truckpaint:
                             material.scs_props[texture_attr_str + "_locked"] = False
 
-                    # acquire roots on demand only once
-                    scs_roots = _object_utils.gather_scs_roots(bpy.data.objects) if not scs_roots else scs_roots
-
-                    # propagate reflection texture change on all of the looks.
-                    # NOTE: We can afford write through because old BT had all reflection textures locked
-                    # meaning user had to use same texture on all looks
-                    # NOTE#2: Printouts like:
-                    # "Look with ID: X doesn't have entry for material 'X' in SCS Root 'X',
-                    #  property 'shader_texture_reflection' won't be updated!"
-                    # are expected here, because we don't use any safety check,
-                    # if material is used on the mesh objects inside scs root
-                    for scs_root in scs_roots:
-                        _looks.write_through(scs_root, material, texture_attr_str)
+                    fixed_textures.append(texture_attr_str)
+
+        if fixed_textures:
+
+            # acquire roots on demand only once
+            scs_roots = _object_utils.gather_scs_roots(bpy.data.objects) if not scs_roots else scs_roots
+
+            # propagate reflection texture changes on all of the looks at once.
+            # NOTE: We can afford write through because old BT had all reflection textures locked
+            # meaning user had to use same texture on all looks
+            # NOTE#2: Printouts like:
+            # "Look with ID: X doesn't have entry for material 'X' in SCS Root 'X',
+            #  properties ['shader_texture_reflection'] won't be updated!"
+            # are expected here, because we don't use any safety check,
+            # if material is used on the mesh objects inside scs root
+            for scs_root in scs_roots:
+                _looks.write_props_through(scs_root, material, fixed_textures)
 
         # ignore already properly set materials
         if _shader_presets.has_preset(material.scs_props.active_shader_preset_name):
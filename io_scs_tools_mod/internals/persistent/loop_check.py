@@ -43,6 +43,8 @@ class _Timer:
     """Marking scene update iterations during stalling."""
     collections_updated = 0
     """Margin collection update iterations during stalling."""
+    updated_objects = set()
+    """Names of updated objects during stalling."""
 
     @staticmethod
     def can_execute():
@@ -71,6 +73,10 @@ class _Timer:
         if depsgraph.id_type_updated('OBJECT'):
             _Timer.updated += 1
 
+            for update in depsgraph.updates:
+                if isinstance(update.id, bpy.types.Object):
+                    _Timer.updated_objects.add(update.id.name)
+
         if depsgraph.id_type_updated('SCENE'):
             _Timer.scene_updated += 1
 
@@ -94,6 +100,146 @@ class _Timer:
 
         return is_updated, is_data_updated, is_scene_updated, is_collections_updated
 
+    @staticmethod
+    def get_and_reset_updated_objects():
+        """Gets and resets names of updated objects.
+
+        :return: names of objects updated since last reset
+        :rtype: set[str]
+        """
+
+        updated_objects = _Timer.updated_objects
+        _Timer.updated_objects = set()
+
+        return updated_objects
+
+
+class _ChildrenIndex:
+    """Reverse index of SCS parent identities to names of objects having that parent identity.
+    It's used upon objects delete to visit only children of removed objects instead of whole scene.
+    Index is rebuilt whenever objects are added to the scene or scene is switched, as parent identities
+    might be set also outside of the persistent loop check.
+    """
+
+    _children = {}
+    """Dictionary of parent identities and set of their children names (entry looks like: (parent_name: {child_name, ...}))."""
+    _num_objects = -1
+    """Number of scene objects at the time of last validation; -1 if index has to be rebuilt."""
+    _scene_pointer = 0
+    """Pointer of the scene for which index was built."""
+
+    @staticmethod
+    def invalidate():
+        """Invalidates index, so it will be rebuilt upon next validation."""
+        _ChildrenIndex._num_objects = -1
+
+    @staticmethod
+    def is_valid(scene):
+        """Tells if index was built for given scene and wasn't invalidated since.
+
+        :param scene: scene for which index should be valid
+        :type scene: bpy.types.Scene
+        :return: True if index is valid for given scene; False otherwise
+        :rtype: bool
+        """
+        return _ChildrenIndex._num_objects != -1 and _ChildrenIndex._scene_pointer == scene.as_pointer()
+
+    @staticmethod
+    def validate(scene):
+        """Validates index against given scene. Index is rebuilt if scene changed or any objects were added to it.
+
+        :param scene: scene for which index should be valid
+        :type scene: bpy.types.Scene
+        """
+        num_objects = len(scene.objects)
+        if num_objects <= _ChildrenIndex._num_objects and _ChildrenIndex._scene_pointer == scene.as_pointer():
+            _ChildrenIndex._num_objects = num_objects
+            return
+
+        children = {}
+        for obj in scene.objects:
+            parent_identity = obj.scs_props.parent_identity
+            if parent_identity != "":
+                if parent_identity not in children:
+                    children[parent_identity] = set()
+                children[parent_identity].add(obj.name)
+
+        _ChildrenIndex._children = children
+        _ChildrenIndex._num_objects = num_objects
+        _ChildrenIndex._scene_pointer = scene.as_pointer()
+
+    @staticmethod
+    def set_parent(obj, parent_name):
+        """Sets parent identity of given object and updates index accordingly.
+
+        :param obj: object which parent identity should be set
+        :type obj: bpy.types.Object
+        :param parent_name: name of new parent; empty string to clear parent identity
+        :type parent_name: str
+        """
+        children = _ChildrenIndex._children
+
+        old_parent_name = obj.scs_props.parent_identity
+        if old_parent_name in children:
+            children[old_parent_name].discard(obj.name)
+            if not children[old_parent_name]:
+                del children[old_parent_name]
+
+        obj.scs_props.parent_identity = parent_name
+
+        if parent_name != "":
+            if parent_name not in children:
+                children[parent_name] = set()
+            children[parent_name].add(obj.name)
+
+    @staticmethod
+    def pop_deleted(scene):
+        """Removes deleted objects from index and collects objects affected by delete.
+        NOTE: if index isn't valid, deleted objects are already gone from the scene and can't be indexed anymore,
+        so whole scene is scanned instead and all scene objects are reported as possible ex parents.
+        Index is then rebuilt upon next validation.
+
+        :param scene: scene from which objects were deleted
+        :type scene: bpy.types.Scene
+        :return: tuple of objects which parent was deleted and existing parents of deleted objects
+        :rtype: tuple[list[bpy.types.Object], list[bpy.types.Object]]
+        """
+        if not _ChildrenIndex.is_valid(scene):
+
+            _ChildrenIndex.invalidate()
+
+            orphans = []
+            for obj in scene.objects:
+                if obj.scs_props.parent_identity != "" and obj.scs_props.parent_identity not in bpy.data.objects:
+                    orphans.append(obj)
+
+            return orphans, list(scene.objects)
+
+        children = _ChildrenIndex._children
+        objects = bpy.data.objects
+
+        orphans = []
+        parents = []
+        for parent_name in list(children):
+
+            child_names = children[parent_name]
+            deleted_child_names = [child_name for child_name in child_names if child_name not in objects]
+            child_names.difference_update(deleted_child_names)
+
+            parent = objects.get(parent_name)
+            if parent is None:
+                for child_name in child_names:
+                    child = objects[child_name]
+                    if child.scs_props.parent_identity == parent_name:
+                        orphans.append(child)
+            elif deleted_child_names:
+                parents.append(parent)
+
+            if parent is None or not child_names:
+                del children[parent_name]
+
+        return orphans, parents
+
 
 @persistent
 def object_data_check(scene):
@@ -118,10 +264,19 @@ def object_data_check(scene):
 
     # GET UPDATE STATES
     objs_updated, meshes_updated, scenes_updated, collections_updated = _Timer.get_and_reset_updated_states()
+    updated_objs_names = _Timer.get_and_reset_updated_objects()
+
+    # MAKE SURE CHILDREN INDEX IS VALID FOR ANY OBJECTS ADDED SINCE LAST CHECK
+    if len(scene.objects) >= scene.scs_cached_num_objects:
+        _ChildrenIndex.validate(scene)
 
     # PREVIEW MODELS CHECKS
-    if objs_updated or scenes_updated or collections_updated:
+    # NOTE: scene and collection updates can change collections or hide state of any locator,
+    # otherwise only updated objects have to be synced
+    if scenes_updated or collections_updated:
         _preview_models.fix_visibilites()
+    elif objs_updated:
+        _preview_models.fix_visibilites(updated_objs_names)
 
     # NEW/COPY
     if len(scene.objects) > scene.scs_cached_num_objects:
@@ -162,13 +317,13 @@ def object_data_check(scene):
 
         scene.scs_cached_num_objects = len(scene.objects)
 
-        unparented_objects = []
-        for obj in scene.objects:
+        # only children and parents of deleted objects are affected, so visit only them
+        unparented_objects, ex_parents = _ChildrenIndex.pop_deleted(scene)
 
-            if obj.scs_props.parent_identity != "" and obj.scs_props.parent_identity not in bpy.data.objects:
-                obj.scs_props.parent_identity = ""
-                unparented_objects.append(obj)
+        for obj in unparented_objects:
+            obj.scs_props.parent_identity = ""
 
+        for obj in ex_parents:
             obj.scs_cached_num_children = len(obj.children)
 
         __objects_delete__(unparented_objects)
@@ -186,6 +341,9 @@ def object_data_check(scene):
             old_name = active_obj_identity
             new_name = active_obj.name
 
+            # renaming changes both parent identities and children names, so let index be rebuilt
+            _ChildrenIndex.invalidate()
+
             active_obj.scs_props.object_identity = active_obj.name
             _fix_children(active_obj)
 
@@ -213,7 +371,7 @@ def object_data_check(scene):
                 if obj != active_obj:
 
                     _fix_ex_parent(obj)
-                    obj.scs_props.parent_identity = active_obj.name
+                    _ChildrenIndex.set_parent(obj, active_obj.name)
                     obj.scs_cached_num_children = len(obj.children)
 
             __objects_reparent__(active_obj, selected_objs)
@@ -224,7 +382,7 @@ def object_data_check(scene):
         if active_obj.parent and active_obj.parent.name != active_obj.scs_props.parent_identity:
 
             _fix_ex_parent(active_obj)
-            active_obj.scs_props.parent_identity = active_obj.parent.name
+            _ChildrenIndex.set_parent(active_obj, active_obj.parent.name)
 
             __objects_reparent__(active_obj.parent, [active_obj])
 
@@ -235,7 +393,7 @@ def object_data_check(scene):
         if not active_obj.select_get() and not active_obj.parent and active_obj.scs_props.parent_identity != "":
 
             _fix_ex_parent(active_obj)
-            active_obj.scs_props.parent_identity = ""
+            _ChildrenIndex.set_parent(active_obj, "")
 
             lprint("D ---> UNPARENT active object in panel")
             return
@@ -246,7 +404,7 @@ def object_data_check(scene):
             for obj in selected_objs:
 
                 _fix_ex_parent(obj)
-                obj.scs_props.parent_identity = ""
+                _ChildrenIndex.set_parent(obj, "")
 
             lprint("D ---> UNPARENT selected objects in 3D view: %s", (len(selected_objs),))
             return
@@ -20,22 +20,23 @@
 
 import bpy
 import os
-import bmesh
 from io_scs_tools_mod.internals.preview_models.cache import PrevModelsCache
+from io_scs_tools_mod.internals.preview_models.cache import PrevModelsMeshes
 from io_scs_tools_mod.consts import Material as _MAT_consts
 from io_scs_tools_mod.consts import Colors as _COL_consts
-from io_scs_tools_mod.imp import pim as _pim_import
 from io_scs_tools_mod.utils import path as _path_utils
 from io_scs_tools_mod.utils.printout import lprint
 from io_scs_tools_mod.utils import get_scs_globals as _get_scs_globals
 
 _cache = PrevModelsCache()
+_meshes = PrevModelsMeshes()
 
 
 def init():
     """Initialize preview models system by initalizing cache and directly updating all preview models in blend file.
     """
     _cache.init()
+    _meshes.clear()
 
     update()
 
@@ -112,7 +113,7 @@ def load(locator, deep_reload=False):
 
     :param locator: locator object to which preview model should be set
     :type locator: bpy.types.Object
-    :param deep_reload: should model be reloaded completely? Use in case model mesh should be freshly loaded from disc
+    :param deep_reload: should model be reloaded from disc? Mesh is reloaded only if PIM file was modified since it was loaded
     :type deep_reload: bool
     :return: True if preview model was set; False otherwise
     :rtype: bool
@@ -140,21 +141,34 @@ def load(locator, deep_reload=False):
 
     if load_model:
         prem_name = str("prem_" + locator.name)
-        old_mesh = _get_model_mesh(locator)
-        new_mesh = None
+        mtime = os.path.getmtime(abs_filepath)
+        loaded_mtime, mesh = _get_model_mesh(locator, abs_filepath)
+
+        # we need to load preview model, if mesh is not found or deep reload is requested and file has changed since
+        if not mesh or (deep_reload and loaded_mtime != mtime):
+
+            if mesh:  # reuse existing mesh, so all the locators with same preview model get reloaded mesh
+                mesh.clear_geometry()
+                is_new_mesh = False
+            else:
+                mesh = bpy.data.meshes.new(os.path.splitext(os.path.basename(abs_filepath))[0])
+                is_new_mesh = True
 
-        # we need to load preview model, if old mesh is not found or deep reload is requested
-        if not old_mesh or deep_reload:
             scs_globals = _get_scs_globals()
 
+            from io_scs_tools_mod.imp import pim as _pim_import
+
             scs_globals.import_in_progress = True
-            obj = _pim_import.load_pim_file(bpy.context, abs_filepath, preview_model=True)
+            is_loaded = _pim_import.load_preview_mesh(abs_filepath, mesh)
             scs_globals.import_in_progress = False
 
             # in case used preview model doesn't have any mesh, abort loading, report error and reset path
             # Path has to be reset to prevent loading preview model over and over again
             # from possible callbacks trying to fix not present preview model
-            if not obj:
+            if not is_loaded:
+                if is_new_mesh:
+                    bpy.data.meshes.remove(mesh)
+
                 message = "Selected PIM model doesn't have any mesh inside, so it can not be used as a preview model."
                 bpy.ops.wm.scs_tools_show_message_in_popup('INVOKE_DEFAULT',
                                                            is_modal=True, title="Preview Model Load Error!", message=message,
@@ -164,41 +178,22 @@ def load(locator, deep_reload=False):
                 locator.scs_props.locator_preview_model_path = ""
                 return False
 
-            # got the new mesh!
-            new_mesh = obj.data
-
             # set preview model path to mesh, so it can be reused next time user requests same preview model
-            new_mesh.scs_props.locator_preview_model_path = locator.scs_props.locator_preview_model_path
-
-            # now remove imported object, as we need only mesh
-            bpy.data.objects.remove(obj, do_unlink=True)
-
-        # if new mesh was created, make sure to copy it over to old one,
-        # so any locator with same preview model path, will also get reloaded mesh.
-        if new_mesh and old_mesh:
-
-            # use bmesh module to copy data from mesh to mesh
-            bm = bmesh.new()
-            bm.from_mesh(new_mesh)
-            bm.to_mesh(old_mesh)
-            bm.free()
+            mesh.scs_props.locator_preview_model_path = locator.scs_props.locator_preview_model_path
 
-            # once copied new mesh can be removed
-            bpy.data.meshes.remove(new_mesh)
-        elif not old_mesh:  # there is no old mesh yet, thus just link new one to old
-            old_mesh = new_mesh
+            _meshes.set_mesh(abs_filepath, mtime, mesh)
 
         # (re)assign material to mesh
-        old_mesh.materials.clear()
-        old_mesh.materials.append(_get_material())
+        mesh.materials.clear()
+        mesh.materials.append(_get_material())
 
         # recover preview model object if exists, otherwise create new
         prev_model_name = _cache.get_entry(locator.name)
         if prev_model_name and prev_model_name in bpy.data.objects:
             prev_model = bpy.data.objects[prev_model_name]
-            prev_model.data = old_mesh
+            prev_model.data = mesh
         else:
-            prev_model = bpy.data.objects.new(name=prem_name, object_data=old_mesh)
+            prev_model = bpy.data.objects.new(name=prem_name, object_data=mesh)
 
         # finally link preview model back to locator
         link(locator, prev_model)
@@ -223,11 +218,26 @@ def unload(locator):
     locator.scs_props.locator_preview_model_present = False
 
 
-def fix_visibilites():
-    """Fix preview model visibilites and collection assignemenet over all visible objects."""
+def fix_visibilites(locator_names=None):
+    """Fix preview model visibilites and collection assignemenet over visible locators with preview models.
+    Only locators with cached preview model are checked, as others don't need any syncing.
 
-    for obj in bpy.context.view_layer.objects:
-        fix_visibility(obj)
+    :param locator_names: names of updated objects which should be checked; if None all cached locators are checked
+    :type locator_names: collections.abc.Iterable[str] | None
+    """
+
+    if locator_names is None:
+        locator_names = _cache.get_locators()
+
+    view_layer_objects = bpy.context.view_layer.objects
+    for locator_name in locator_names:
+
+        if locator_name not in _cache:
+            continue
+
+        locator = view_layer_objects.get(locator_name)
+        if locator:
+            fix_visibility(locator)
 
 
 def fix_visibility(locator):
@@ -313,17 +323,27 @@ def update(force=False):
             unload(obj)
 
 
-def _get_model_mesh(locator):
-    """Creates and returns new object if mesh already exists in Blender data block
+def _get_model_mesh(locator, abs_filepath):
+    """Gets preview model mesh for given locator if it already exists in Blender data block.
 
-    :return: mesh if exists; None otherwise
-    :rtype: None | bpy.types.Mesh
+    :param locator: locator object for which preview model mesh should be found
+    :type locator: bpy.types.Object
+    :param abs_filepath: absolute path of locator preview model PIM file
+    :type abs_filepath: str
+    :return: modification time of PIM file from which mesh was loaded (None if unknown) and mesh if exists; (None, None) otherwise
+    :rtype: tuple[float | None, bpy.types.Mesh | None]
     """
+    mtime, mesh = _meshes.get_mesh(abs_filepath, locator.scs_props.locator_preview_model_path)
+    if mesh:
+        return mtime, mesh
+
+    # mesh could be loaded from blend file or renamed, thus search for it and store it with unknown modification time
     for mesh in bpy.data.meshes:
         if mesh.scs_props.locator_preview_model_path == locator.scs_props.locator_preview_model_path:
-            return mesh
+            _meshes.set_mesh(abs_filepath, None, mesh)
+            return None, mesh
 
-    return None
+    return None, None
 
 
 def _get_material(reload=False):
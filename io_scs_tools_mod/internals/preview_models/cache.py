@@ -55,6 +55,15 @@ class PrevModelsCache:
         else:
             return None
 
+    def get_locators(self):
+        """Gets names of all locators with cached preview model.
+
+        :return: names of locators
+        :rtype: list[str]
+        """
+
+        return list(self._prev_models.keys())
+
     def init(self):
         """Initilize preview models cache to be able to control visibility layers for all the locators with preview models
         """
@@ -147,3 +156,54 @@ class PrevModelsCache:
             del self._prev_models[key_to_delete]
 
 
+class PrevModelsMeshes:
+    """Store of preview models meshes keyed by absolute path of PIM file and it's modification time.
+    Every PIM file is loaded into one mesh, which is then shared by all locators using it.
+    """
+
+    _meshes = {}
+    """Dictonary holding modification time and mesh name per absolute PIM filepath (entry looks like: (abs_filepath: (mtime, mesh_name)))
+    """
+
+    def clear(self):
+        """Clears all stored meshes. Should be called whenever blend file changes, as stored mesh names are not valid anymore.
+        """
+
+        self._meshes.clear()
+
+    def get_mesh(self, abs_filepath, preview_model_path):
+        """Gets preview model mesh stored for given PIM file.
+        Mesh is returned only if it still belongs to given preview model path, as stored mesh could be renamed
+        and it's name could now be used by completely different mesh.
+
+        :param abs_filepath: absolute path of PIM file
+        :type abs_filepath: str
+        :param preview_model_path: preview model path of the locator, as it's stored in mesh
+        :type preview_model_path: str
+        :return: modification time of PIM file at the time of loading and mesh; (None, None) if not stored or mesh doesn't exist anymore
+        :rtype: tuple[float | None, bpy.types.Mesh | None]
+        """
+
+        if abs_filepath in self._meshes:
+            mtime, mesh_name = self._meshes[abs_filepath]
+            mesh = bpy.data.meshes.get(mesh_name)
+            if mesh and mesh.scs_props.locator_preview_model_path == preview_model_path:
+                return mtime, mesh
+
+            del self._meshes[abs_filepath]
+
+        return None, None
+
+    def set_mesh(self, abs_filepath, mtime, mesh):
+        """Stores preview model mesh for given PIM file.
+
+        :param abs_filepath: absolute path of PIM file
+        :type abs_filepath: str
+        :param mtime: modification time of PIM file from which mesh was loaded; None if unknown
+        :type mtime: float | None
+        :param mesh: preview model mesh
+        :type mesh: bpy.types.Mesh
+        """
+
+        lprint("D Storing preview model mesh %r for %r", (mesh.name, abs_filepath))
+        self._meshes[abs_filepath] = (mtime, mesh.name)
@@ -62,38 +62,42 @@ def clear():
     __indices_to_names_map.clear()
 
 
-def add_section(base_effect, preset_name, flavors_str, section, is_dirty=False):
-    """Adds section for given preset name and it's effect to the library.
+def set_supported_effects(supported_effects):
+    """Sets supported effects used for validation of shader preset and flavors combinations.
+
+    :param supported_effects: collection of supported full effect names; if None or empty all combinations are valid
+    :type supported_effects: collections.abc.Container | None
+    """
+    __cache.set_supported_effects(supported_effects)
+
+
+def add_section(base_effect, preset_name, section):
+    """Adds pure preset section for given preset name and it's effect to the library.
+
+    Sections for flavor combinations are not added, they are resolved from added flavors on first request.
 
     :param base_effect: effect string of current preset without any flavors
     :type base_effect: str
     :param preset_name: name of the shader preset
     :type preset_name: str
-    :param flavors_str: flavors part of effect name
-    :type flavors_str: str
     :param section: Shader section that should be stored
-    :type section: io_scs_tools_mod.internals.structure.SectionData
-    :param is_dirty: mark this section as dirty, set to true when inserting section only for time beeing of cache creation
-    :type is_dirty: bool
+    :type section: io_scs_tools_mod.internals.structure.SectionData | None
     """
 
-    # save only pure preset sections into mapping system
-    if flavors_str == "":
+    shader_index = len(__names_to_indices_map) + 1
 
-        shader_index = len(__names_to_indices_map) + 1
-
-        # as there can be more presets with same base effect we have to store indices in list
-        if base_effect not in __effects_to_indices_map:
-            __effects_to_indices_map[base_effect] = []
+    # as there can be more presets with same base effect we have to store indices in list
+    if base_effect not in __effects_to_indices_map:
+        __effects_to_indices_map[base_effect] = []
 
-        __effects_to_indices_map[base_effect].append(shader_index)
+    __effects_to_indices_map[base_effect].append(shader_index)
 
-        __names_to_indices_map[preset_name] = shader_index
-        __indices_to_names_map[shader_index] = preset_name
+    __names_to_indices_map[preset_name] = shader_index
+    __indices_to_names_map[shader_index] = preset_name
 
-        __ui_inventory[preset_name] = UIShaderPresetItem(base_effect, preset_name)
+    __ui_inventory[preset_name] = UIShaderPresetItem(base_effect, preset_name)
 
-    __cache.add_section(__names_to_indices_map[preset_name], flavors_str, section, is_dirty=is_dirty)
+    __cache.add_preset(shader_index, base_effect, section)
 
 
 def get_section(preset_name, flavors_str=""):
@@ -103,8 +107,8 @@ def get_section(preset_name, flavors_str=""):
     :type preset_name: str
     :param flavors_str: flavors part of effect name
     :type flavors_str: str
-    :return: stored section data for given inventory item and flavor string
-    :rtype: io_scs_tools_mod.internals.structure.SectionData
+    :return: stored section data for given inventory item and flavor string; None if combination doesn't exist
+    :rtype: io_scs_tools_mod.internals.structure.SectionData | None
     """
     return __cache.get_section(__names_to_indices_map[preset_name], flavors_str=flavors_str)
 
@@ -243,9 +247,10 @@ def add_flavor(preset_name):
     assert preset_name in __ui_inventory
 
     __ui_inventory[preset_name].append_flavor()
+    __cache.add_flavor(__names_to_indices_map[preset_name])
 
 
-def add_flavor_variant(preset_name, flavor_variant_type, flavor_variant_effect_suffix):
+def add_flavor_variant(preset_name, flavor_variant_type, flavor_variant_effect_suffix, flavor_section):
     """Adds new variant of the flavor to the last added flavor inside UI shader preset object with given name.
 
     :param preset_name: name of the preset, where flavor variant should be added
@@ -254,7 +259,10 @@ def add_flavor_variant(preset_name, flavor_variant_type, flavor_variant_effect_s
     :type flavor_variant_type: str
     :param flavor_variant_effect_suffix: effect suffix of this flavor variant
     :type flavor_variant_effect_suffix: str
+    :param flavor_section: Flavor section which sections are applied to preset section when this variant is used
+    :type flavor_section: io_scs_tools_mod.internals.structure.SectionData
     """
     assert preset_name in __ui_inventory
 
     __ui_inventory[preset_name].append_flavor_variant(flavor_variant_type, flavor_variant_effect_suffix)
+    __cache.add_flavor_variant(__names_to_indices_map[preset_name], flavor_variant_effect_suffix, flavor_section)
@@ -19,7 +19,7 @@
 # Copyright (C) 2017: SCS Software
 
 
-import pickle
+from copy import deepcopy
 from os.path import getmtime, isfile
 
 
@@ -29,13 +29,14 @@ class ShaderPresetsCache:
         """
         self.__initialized_path = (None, None)
         """Storing last initialized shader presets file path, to avoid multiple initializing of same path."""
+        self.__presets = {}
+        """Storing base effect, pure preset section and flavors with their sections for each shader preset."""
+        self.__supported_effects = None
+        """Storing supported effects, used to validate flavor combinations. If None all combinations are valid."""
         self.__cache = {}
-        """Storing all combinations of shader presets and it's flavors."""
-        self.__dirty_items = []
-        """Storing dirty combinations of shader presets and it's flavors that can be cleared with cleanup function.
-           Used for temporarly save sections even the ones that are not supported by the game,
-           just to be able to create further flavor combinations.
-        """
+        """Storing already resolved combinations of shader presets and it's flavors."""
+        self.__unsupported = set()
+        """Storing already resolved combinations of shader presets and it's flavors that are not supported."""
 
     def clear(self):
         """Clears shader presets cache.
@@ -44,48 +45,60 @@ class ShaderPresetsCache:
         for key1 in self.__cache:
             self.__cache[key1].clear()
 
+        self.__presets.clear()
+        self.__supported_effects = None
         self.__cache.clear()
-        self.__dirty_items.clear()
+        self.__unsupported.clear()
         self.__initialized_path = (None, None)
 
-    def cleanup(self):
-        """Cleanup dirty sections from cache.
-    
-        Any sections added with dirty flag, will now be removed from cache. Additional dirty items list is also cleared,
-        so if this function is called two times in a row, second time will be for nothing.
+    def set_supported_effects(self, supported_effects):
+        """Sets supported effects against which flavor combinations are validated once resolved.
+
+        :param supported_effects: collection of supported full effect names; if None or empty all combinations are valid
+        :type supported_effects: collections.abc.Container | None
         """
+        self.__supported_effects = supported_effects
 
-        for i, flavor_str in self.__dirty_items:
-            del self.__cache[i][flavor_str]
+    def add_preset(self, preset_idx, base_effect, section):
+        """Adds pure section of shader presets item to the cache.
+
+        :param preset_idx: index of shader presets item
+        :type preset_idx: int
+        :param base_effect: effect string of shader preset without any flavors
+        :type base_effect: str
+        :param section: Shader section that should be stored
+        :type section: io_scs_tools_mod.internals.structure.SectionData | None
+        """
+        self.__presets[preset_idx] = (base_effect, section, [])
 
-            if len(self.__cache[i].keys()) == 0:
-                del self.__cache[i]
+    def add_flavor(self, preset_idx):
+        """Adds new flavor entry to the shader presets item with given index.
 
-        self.__dirty_items.clear()
+        NOTE: There is no safety check if preset for given index exists.
 
-    def add_section(self, preset_idx, flavors_str, section, is_dirty=False):
-        """Adds section for current shader presets inventory item to the cache.
-    
-        :param preset_idx: index of shader presets item for which should contain section with given flavors combination
+        :param preset_idx: index of shader presets item
         :type preset_idx: int
-        :param flavors_str: flavors part of effect name
-        :type flavors_str: str
-        :param section: Shader section that should be stored
-        :type section: io_scs_tools_mod.internals.structure.SectionData
-        :param is_dirty: mark this section as dirty, set to true when inserting section only for time beeing of cache creation
-        :type is_dirty: bool
         """
+        self.__presets[preset_idx][2].append([])
 
-        if preset_idx not in self.__cache:
-            self.__cache[preset_idx] = {}
+    def add_flavor_variant(self, preset_idx, variant_suffix, flavor_section):
+        """Adds variant to lastly added flavor of the shader presets item with given index.
 
-        self.__cache[preset_idx][flavors_str] = pickle.dumps(section)
+        NOTE: This should be always called after "add_flavor", otherwise it will result in error.
 
-        if is_dirty:
-            self.__dirty_items.append((preset_idx, flavors_str))
+        :param preset_idx: index of shader presets item
+        :type preset_idx: int
+        :param variant_suffix: suffix of flavor variant inside effect name
+        :type variant_suffix: str
+        :param flavor_section: Flavor section which sections are merged into preset section
+        :type flavor_section: io_scs_tools_mod.internals.structure.SectionData
+        """
+        self.__presets[preset_idx][2][-1].append((variant_suffix, flavor_section))
 
     def has_section(self, preset_idx, flavors_str):
         """Is shader data section for given inventory item and flavor string existing in shader presets cache?
+
+        Flavor combinations are resolved on first request and remembered afterwards.
     
         :param preset_idx: index of shader presets item for which should contain section with given flavors combination
         :type preset_idx: int
@@ -94,36 +107,120 @@ class ShaderPresetsCache:
         :return: True if section exists; otherwise False
         :rtype: bool
         """
-        return (
-            preset_idx in self.__cache and
-            flavors_str in self.__cache[preset_idx]
-        )
+        if preset_idx in self.__cache and flavors_str in self.__cache[preset_idx]:
+            return True
+
+        if (preset_idx, flavors_str) in self.__unsupported or preset_idx not in self.__presets:
+            return False
+
+        base_effect, section, flavors = self.__presets[preset_idx]
+
+        flavor_sections = self.__match_flavors(flavors, flavors_str, 0)
+        if flavor_sections is None or (flavors_str != "" and
+                                       self.__supported_effects and
+                                       base_effect + flavors_str not in self.__supported_effects):
+            self.__unsupported.add((preset_idx, flavors_str))
+            return False
+
+        if flavor_sections:
+            section = self.__combine_sections(section, flavor_sections, base_effect + flavors_str)
+
+        if preset_idx not in self.__cache:
+            self.__cache[preset_idx] = {}
+
+        self.__cache[preset_idx][flavors_str] = section
+        return True
 
     def get_section(self, preset_idx, flavors_str=""):
         """Get section from shader presets cache for given inventory item and flavor string
 
-        NOTE: There is no safety check if preset for given index exists.
-              So for safety use "has_section" before using this method.
+        NOTE: Returned section is shared between all callers, so it must not be modified.
     
         :param preset_idx: index of shader presets item for which should contain section with given flavors combination
         :type preset_idx: int
         :param flavors_str: flavors part of effect name
         :type flavors_str: str
-        :return: stored section data for given inventory item and flavor string
+        :return: stored section data for given inventory item and flavor string; None if combination doesn't exist
+        :rtype: io_scs_tools_mod.internals.structure.SectionData | None
+        """
+        if not self.has_section(preset_idx, flavors_str):
+            return None
+
+        return self.__cache[preset_idx][flavors_str]
+
+    @staticmethod
+    def __match_flavors(flavors, flavors_str, start_i):
+        """Matches flavors string against flavors of the preset, starting at given flavor index.
+
+        :param flavors: flavors of the preset, each being a list of variant suffix and flavor section tuples
+        :type flavors: list[list[tuple[str, io_scs_tools_mod.internals.structure.SectionData]]]
+        :param flavors_str: remaining flavors part of effect name
+        :type flavors_str: str
+        :param start_i: index of first flavor that can still be used
+        :type start_i: int
+        :return: flavor sections in order of appearance in flavors string; None if flavors string can not be matched
+        :rtype: list[io_scs_tools_mod.internals.structure.SectionData] | None
+        """
+        if flavors_str == "":
+            return []
+
+        for i in range(start_i, len(flavors)):
+            for variant_suffix, flavor_section in flavors[i]:
+
+                variant_str = "." + variant_suffix
+                if not flavors_str.startswith(variant_str):
+                    continue
+
+                flavor_sections = ShaderPresetsCache.__match_flavors(flavors, flavors_str[len(variant_str):], i + 1)
+                if flavor_sections is not None:
+                    return [flavor_section] + flavor_sections
+
+        return None
+
+    @staticmethod
+    def __combine_sections(preset_section, flavor_sections, effect):
+        """Creates new section by applying given flavor sections on top of the preset section.
+
+        :param preset_section: pure preset section
+        :type preset_section: io_scs_tools_mod.internals.structure.SectionData
+        :param flavor_sections: flavor sections to apply in given order
+        :type flavor_sections: list[io_scs_tools_mod.internals.structure.SectionData]
+        :param effect: full effect name of the combination
+        :type effect: str
+        :return: new section with applied flavors
         :rtype: io_scs_tools_mod.internals.structure.SectionData
         """
-        return pickle.loads(self.__cache[preset_idx][flavors_str])
+        section = deepcopy(preset_section)
+
+        for flavor_section in flavor_sections:
+            for flavor_subsection in flavor_section.sections:
+
+                flavor_subsection_tag = flavor_subsection.get_prop_value("Tag")
+                # check if current flavor section already exists in section,
+                # then override props and sections directly otherwise add flavor section
+                for subsection in section.sections:
+
+                    subsection_tag = subsection.get_prop_value("Tag")
+                    if subsection_tag and subsection_tag == flavor_subsection_tag:
+
+                        subsection.props = deepcopy(flavor_subsection.props)
+                        subsection.sections = deepcopy(flavor_subsection.sections)
+                        break
+
+                else:
+                    section.sections.append(deepcopy(flavor_subsection))
+
+        assert section.set_prop_value("Effect", effect)
+        return section
 
     def set_initialized(self, path):
-        """Cleanup dirty entries and set shader presets cache as initialized for given path.
-        Should be called once all possible sections were added to cache for given path.
+        """Set shader presets cache as initialized for given path.
+        Should be called once all presets and their flavors were added to cache for given path.
     
         :param path: path for which this cache was built
         :type path: str
         """
 
-        self.cleanup()
-
         self.__initialized_path = (path, getmtime(path))
 
     def is_initialized(self, path):
@@ -19,7 +19,6 @@
 # Copyright (C) 2019-2021: SCS Software
 
 import bpy
-from io_scs_tools_mod import exp as _export
 from io_scs_tools_mod.utils import object as _object_utils
 from io_scs_tools_mod.utils import get_scs_globals as _get_scs_globals
 from io_scs_tools_mod.utils.printout import lprint
@@ -180,6 +179,9 @@ class SCSExportHelper:
         if _get_scs_globals().export_output_type == "EF":
             ef_name_suffix = ".ef"
 
+        # exporters are imported on first export only, to keep add-on enabling fast
+        from io_scs_tools_mod import exp as _export
+
         try:
             result = _export.batch_export(self, init_obj_list, name_suffix=ef_name_suffix, menu_filepath=menu_filepath)
         except Exception as e:
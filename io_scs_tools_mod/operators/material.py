@@ -23,7 +23,6 @@ import os
 import re
 from bpy.props import StringProperty, BoolProperty, EnumProperty, IntProperty
 from io_scs_tools_mod.consts import Material as _MAT_consts
-from io_scs_tools_mod.exp import tobj as _tobj_exp
 from io_scs_tools_mod.internals import looks as _looks
 from io_scs_tools_mod.utils import convert as _convert_utils
 from io_scs_tools_mod.utils import get_scs_globals as _get_scs_globals
@@ -675,7 +674,7 @@ class Looks:
                 altered_looks = 0
                 altered_scs_roots = 0
                 for scs_root in scs_roots:
-                    res = _looks.write_through(scs_root, material, self.property_str)
+                    res = _looks.write_props_through(scs_root, material, (self.property_str,))
 
                     # only log altered looks if write trought succeded
                     if res > 0:
@@ -714,7 +713,7 @@ class Looks:
                             look_id = look.id
                             break
 
-                    if _looks.write_prop_to_look(scs_root, look_id, material, self.property_str):
+                    if _looks.write_props_to_look(scs_root, look_id, material, (self.property_str,)):
                         altered_looks += 1
 
                 if len(scs_roots) - 1 != altered_looks:
@@ -776,6 +775,8 @@ class Tobj:
 
                     if tex_filepath and (tex_filepath.endswith(".tga") or tex_filepath.endswith(".png")):
 
+                        from io_scs_tools_mod.exp import tobj as _tobj_exp
+
                         if _tobj_exp.export(tex_filepath[:-4] + ".tobj", os.path.basename(tex_filepath), set()):
 
                             _material_utils.reload_tobj_settings(material, self.texture_type)
@@ -376,8 +376,8 @@ class VertexColorTools:
         """Storing mode of currently active object, to be able to abort operator if user jumps out of vertex mode."""
         __vcolors_buffer_arrays = []
         """Used for storing vertex color layers data when rebaking. Should be array of 4 numpy ndarrays as we are rebaking from 4 layers."""
-        __old_vcolors_array_hash = None
-        """Storing hash value of active vertex color array values. Used to identify weather rebake should happen or not."""
+        __vcolors_rebake_state = {}
+        """Storing cached vertex color layers data from previous rebake. Used to identify which loops have to be rebaked."""
 
         def __get_active_object__(self):
             """Returns operator cached active object.
@@ -437,7 +437,7 @@ class VertexColorTools:
                 numpy.array([0.0] * (len(mesh.loops) * 4))
             ]
 
-            self.__old_vcolors_array_hash = None
+            self.__vcolors_rebake_state = {}
 
             return {'RUNNING_MODAL'}
 
@@ -512,14 +512,13 @@ class VertexColorTools:
             if event.type == "TIMER":
 
                 start_time = time()
-                new_hash = _mesh_utils.vcoloring_rebake(active_obj.data, self.__vcolors_buffer_arrays, self.__old_vcolors_array_hash)
-                if new_hash is None:  # sth went really wrong, no sufficient data
+                rebaked_loops = _mesh_utils.vcoloring_rebake_dirty(active_obj.data, self.__vcolors_buffer_arrays, self.__vcolors_rebake_state)
+                if rebaked_loops < 0:  # sth went really wrong, no sufficient data
                     lprint("E VColoring rebake failed! Contact the developer...")
-                elif new_hash != self.__old_vcolors_array_hash:  # rebake happened
-                    self.__old_vcolors_array_hash = new_hash
+                elif rebaked_loops > 0:  # rebake happened
                     _view3d_utils.tag_redraw_all_view3d()  # trigger view update to see rebaked colors
 
-                    lprint("D VColoring real-time rebake took: %.4fs" % (time() - start_time))
+                    lprint("D VColoring real-time rebake of %s loops took: %.4fs" % (rebaked_loops, time() - start_time))
                 else:  # checked active vertex color layer, but nothing had to be recalculated
                     lprint("D VColoring checkup took: %.4fs" % (time() - start_time))
 
@@ -568,7 +567,8 @@ class VertexColorTools:
 
             # one last time rebake
             start_time = time()
-            new_hash = _mesh_utils.vcoloring_rebake(active_obj.data, self.__vcolors_buffer_arrays, self.__old_vcolors_array_hash)
+            # NOTE: do full rebake, as undo while painting might have also changed layers which are not active anymore
+            new_hash = _mesh_utils.vcoloring_rebake(active_obj.data, self.__vcolors_buffer_arrays, None)
 
             if new_hash is None:
                 lprint("E VColoring rebake failed! Contact the developer...")
@@ -582,7 +582,7 @@ class VertexColorTools:
             self.__timer = None
             self.__active_object_name = None
             self.__active_object_mode = None
-            self.__old_vcolors_array_hash = None
+            self.__vcolors_rebake_state = {}
             self.__vcolors_buffer_arrays = []
 
             VertexColorTools.SCS_TOOLS_OT_StartVColoring.__static_is_active = False
@@ -32,7 +32,6 @@ from bl_operators.presets import AddPresetBase
 from io_scs_tools_mod.consts import ConvHlpr as _CONV_HLPR_consts
 from io_scs_tools_mod.consts import Operators as _OP_consts
 from io_scs_tools_mod.consts import PaintjobTools as _PT_consts
-from io_scs_tools_mod.imp import pix as _pix_import
 from io_scs_tools_mod.internals.structure import UnitData as _UnitData
 from io_scs_tools_mod.internals.containers import pix as _pix_container
 from io_scs_tools_mod.internals.containers import sii as _sii_container
@@ -42,11 +41,10 @@ from io_scs_tools_mod.utils import name as _name_utils
 from io_scs_tools_mod.utils import object as _object_utils
 from io_scs_tools_mod.utils import path as _path_utils
 from io_scs_tools_mod.utils import get_scs_globals as _get_scs_globals
+from io_scs_tools_mod.utils import printout as _printout
 from io_scs_tools_mod.utils.printout import lprint
 from io_scs_tools_mod.utils.property import get_default as _get_default
 from io_scs_tools_mod.utils.property import get_filebrowser_display_type
-from io_scs_tools_mod import exp as _export
-from io_scs_tools_mod import imp as _import
 
 
 class Import:
@@ -83,7 +81,9 @@ class Import:
             armature = context.active_object
             root_object = _object_utils.get_scs_root(armature)
 
-            imported_count = _import.pia.load(root_object, pia_files, armature)
+            from io_scs_tools_mod.imp import pia as _pia_import
+
+            imported_count = _pia_import.load(root_object, pia_files, armature)
 
             # report warnings and errors if actually imported count differs from number of pia files
             if imported_count != len(pia_files):
@@ -249,7 +249,9 @@ class Export:
                 if _get_scs_globals().export_output_type == "EF":
                     ef_name_suffix = ".ef"
 
-                _export.pia.export(scs_root_obj, armature, anim, self.directory, ef_name_suffix, skeleton_filepath)
+                from io_scs_tools_mod.exp import pia as _pia_export
+
+                _pia_export.export(scs_root_obj, armature, anim, self.directory, ef_name_suffix, skeleton_filepath)
 
             lprint("", report_errors=1, report_warnings=1)
             return {'FINISHED'}
@@ -1478,6 +1480,8 @@ class PaintjobTools:
             _get_scs_globals()["scs_project_path"] = project_path
 
             # import model
+            from io_scs_tools_mod.imp import pix as _pix_import
+
             _get_scs_globals().import_in_progress = True
             _pix_import.load(context, model_path, suppress_reports=True)
             _get_scs_globals().import_in_progress = False
@@ -2801,6 +2805,7 @@ class PaintjobTools:
             # change dump level internally as we want this operator to report everything
             if int(_get_scs_globals().dump_level) < 4:
                 _get_scs_globals()["dump_level"] = 4
+                _printout.set_dump_level(4)
 
             lprint(prefix + message, report_errors=do_report, report_warnings=do_report)
 
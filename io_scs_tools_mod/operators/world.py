@@ -21,9 +21,6 @@
 import bpy
 from math import pi
 from bpy.props import IntProperty
-from io_scs_tools_mod.internals.shaders.eut2.std_node_groups import add_env_ng as _add_env_ng
-from io_scs_tools_mod.internals.shaders.eut2.std_node_groups import compose_lighting_ng as _compose_lighting_ng
-from io_scs_tools_mod.internals.shaders.eut2.std_node_groups import lighting_evaluator_ng as _lighting_evaluator_ng
 from io_scs_tools_mod.consts import SCSLigthing as _LIGHTING_consts
 from io_scs_tools_mod.utils import get_scs_globals as _get_scs_globals
 from io_scs_tools_mod.utils import get_scs_inventories as _get_scs_inventories
@@ -102,6 +99,10 @@ class SCS_TOOLS_OT_SetupLighting(bpy.types.Operator):
         lamp_obj.rotation_euler = directed_lamps_rotation
 
         # 3. set ambient, diffuse and specular environment values
+        from io_scs_tools_mod.internals.shaders.eut2.std_node_groups import add_env_ng as _add_env_ng
+        from io_scs_tools_mod.internals.shaders.eut2.std_node_groups import compose_lighting_ng as _compose_lighting_ng
+        from io_scs_tools_mod.internals.shaders.eut2.std_node_groups import lighting_evaluator_ng as _lighting_evaluator_ng
+
         _lighting_evaluator_ng.set_ambient_light(sun_profile_item.ambient)
         _lighting_evaluator_ng.set_diffuse_light(sun_profile_item.diffuse)
         _lighting_evaluator_ng.set_specular_light(sun_profile_item.specular)
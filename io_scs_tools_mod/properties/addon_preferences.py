@@ -37,6 +37,7 @@ from io_scs_tools_mod.properties.dynamic import DynamicProps as _DynamicProps
 from io_scs_tools_mod.utils import material as _material_utils
 from io_scs_tools_mod.utils import path as _path_utils
 from io_scs_tools_mod.utils import view3d as _view3d_utils
+from io_scs_tools_mod.utils import printout as _printout
 from io_scs_tools_mod.utils import get_scs_inventories as _get_scs_inventories
 
 
@@ -962,6 +963,14 @@ class SCSGlobals(bpy.types.PropertyGroup):
         _config_container.update_item_in_file('Export.SignExport', int(self.export_write_signature))
         return None
 
+    def export_write_if_changed_update(self, context):
+        _config_container.update_item_in_file('Export.WriteIfChanged', int(self.export_write_if_changed))
+        return None
+
+    def export_merge_equivalent_materials_update(self, context):
+        _config_container.update_item_in_file('Export.MergeEquivalentMaterials', int(self.export_merge_equivalent_materials))
+        return None
+
     # IMPORT OPTIONS
     import_scale: FloatProperty(
         name="Scale",
@@ -1191,9 +1200,22 @@ class SCSGlobals(bpy.types.PropertyGroup):
         default=False,
         update=export_write_signature_update,
     )
+    export_write_if_changed: BoolProperty(
+        name="Write Only Changed Files",
+        description="Replace exported files only if their content changed, so unchanged files keep their modification time",
+        default=False,
+        update=export_write_if_changed_update,
+    )
+    export_merge_equivalent_materials: BoolProperty(
+        name="Merge Equivalent Materials",
+        description="Export materials with equal effect, attributes and textures in all looks as one material",
+        default=False,
+        update=export_merge_equivalent_materials_update,
+    )
 
     # COMMON SETTINGS - SAVED IN CONFIG
     def dump_level_update(self, context):
+        _printout.set_dump_level(self.dump_level)
         _config_container.update_item_in_file('Header.DumpLevel', self.dump_level)
         return None
 
@@ -29,7 +29,6 @@ from bpy.props import (BoolProperty,
 import os
 import re
 from io_scs_tools_mod.consts import Material as _MAT_consts
-from io_scs_tools_mod.exp import tobj as _tobj_exp
 from io_scs_tools_mod.internals import looks as _looks
 from io_scs_tools_mod.internals import inventory as _inventory
 from io_scs_tools_mod.internals.shaders import shader as _shader
@@ -131,6 +130,8 @@ def __update_shader_texture_tobj_file__(self, context, tex_type):
         else:
             texture_name = os.path.basename(texture_raw_path)
 
+        from io_scs_tools_mod.exp import tobj as _tobj_exp
+
         # update last tobj load time if export was successful otherwise report saving problems
         if _tobj_exp.export(tobj_file, texture_name, texture_settings):
             self[shader_texture_str + "_tobj_load_time"] = str(os.path.getmtime(tobj_file))
@@ -1811,7 +1812,11 @@ def register():
     for cls in classes:
         bpy.utils.register_class(cls)
 
+    _looks.register_schema(MaterialSCSTools)
+
 
 def unregister():
+    _looks.unregister_schema()
+
     for cls in classes:
         bpy.utils.unregister_class(cls)
@@ -141,6 +141,8 @@ def draw_export_panel(layout, ignore_extra_boxes=False):
     box2.use_property_split = True
     box2.use_property_decorate = False
     box2.prop(_get_scs_globals(), 'export_output_type')
+    box2.prop(_get_scs_globals(), 'export_write_if_changed')
+    box2.prop(_get_scs_globals(), 'export_merge_equivalent_materials')
     '''
     col = box2.column()
     col.prop(_get_scs_globals(), 'export_pim_file', text="Export Model (PIM)", toggle=True)
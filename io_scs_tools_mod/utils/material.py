@@ -24,7 +24,6 @@ import os
 import tempfile
 from math import pi
 from io_scs_tools_mod.consts import Material as _MAT_consts
-from io_scs_tools_mod.imp import tobj as _tobj_imp
 from io_scs_tools_mod.internals import inventory as _invetory
 from io_scs_tools_mod.internals import shader_presets as _shader_presets
 from io_scs_tools_mod.internals.shaders import shader as _shader
@@ -672,6 +671,8 @@ def set_shader_data_to_material(material, section, is_import=False, override_bac
 
         # now try to retrive settings for the textures from TOBJ
         if tex_type in created_textures and created_textures[tex_type]:
+            from io_scs_tools_mod.imp import tobj as _tobj_imp
+
             final_tex_str = getattr(material.scs_props, "shader_texture_" + tex_type, "")
             tobj_abs_path = _path.get_tobj_path_from_shader_texture(final_tex_str)
             settings, map_type = _tobj_imp.get_settings_and_type(tobj_abs_path)
@@ -713,6 +714,8 @@ def reload_tobj_settings(material, tex_type):
     tobj_file = _path.get_tobj_path_from_shader_texture(shader_texture_filepath)
     if tobj_file:
 
+        from io_scs_tools_mod.imp import tobj as _tobj_imp
+
         settings, map_type = _tobj_imp.get_settings_and_type(tobj_file)
 
         # intentionally set ID property directly to avoid update function invoke
@@ -20,6 +20,7 @@
 
 import bpy
 import bmesh
+import numpy
 from collections import deque
 from io_scs_tools_mod.consts import Mesh as _MESH_consts
 from io_scs_tools_mod.consts import VertexColorTools as _VCT_consts
@@ -28,7 +29,23 @@ from io_scs_tools_mod.utils import convert as _convert
 
 
 def make_points_to_weld_list(mesh_vertices, mesh_normals, mesh_rgb, mesh_rgba, equal_decimals_count):
-    """Makes a map of duplicated vertices indices into it's original counter part."""
+    """Makes a map of duplicated vertices indices into it's original counter part.
+    Position, normal and vertex color of each vertex are quantized to given decimals count and
+    vertices with equal quantized values are grouped, first vertex in the group is the original one.
+
+    :param mesh_vertices: vertices positions
+    :type mesh_vertices: list[list[float]]
+    :param mesh_normals: vertices normals
+    :type mesh_normals: list[list[float]]
+    :param mesh_rgb: RGB vertex color layers data
+    :type mesh_rgb: dict[str, list[list[float]]]
+    :param mesh_rgba: RGBA vertex color layers data
+    :type mesh_rgba: dict[str, list[list[float]]]
+    :param equal_decimals_count: number of decimals on which values has to be equal to be welded
+    :type equal_decimals_count: int
+    :return: for each vertex index it holds index of it's original vertex (index itself for not welded vertices)
+    :rtype: numpy.ndarray
+    """
 
     # take first present vertex color data
     if mesh_rgb:
@@ -38,34 +55,205 @@ def make_points_to_weld_list(mesh_vertices, mesh_normals, mesh_rgb, mesh_rgba, e
     else:
         mesh_final_rgba = {}
 
-    posnorm_dict_tmp = {}
+    verts_count = len(mesh_vertices)
+    columns = [
+        numpy.asarray(mesh_vertices, dtype=numpy.float64).reshape(verts_count, -1),
+        numpy.asarray(mesh_normals, dtype=numpy.float64).reshape(verts_count, -1)
+    ]
+
+    # also include vertex colors in key if present
+    for vc_layer_name in mesh_final_rgba:
+        columns.append(numpy.asarray(mesh_final_rgba[vc_layer_name], dtype=numpy.float64).reshape(verts_count, -1))
+
     perc = 10 ** equal_decimals_count  # represent precision for duplicates
-    for val_i, val in enumerate(mesh_vertices):
+    keys = numpy.trunc(numpy.hstack(columns) * perc).astype(numpy.int64)
+
+    # first index in the group is original, rest are duplicates
+    _, first_i, group_i = numpy.unique(keys, axis=0, return_index=True, return_inverse=True)
+
+    return first_i[group_i.ravel()]
+
+
+def __get_cyclic_keys(faces):
+    """Rotates vertex indices of each triangle so that the smallest index is the first one.
+    This way triangles with the same winding give the same key no matter on which vertex they start.
+
+    :param faces: triangles as vertex indices
+    :type faces: numpy.ndarray
+    :return: rotated triangles
+    :rtype: numpy.ndarray
+    """
+    shift = numpy.argmin(faces, axis=1)
+    cols = (shift[:, None] + numpy.arange(3)) % 3
+    return numpy.take_along_axis(faces, cols, axis=1)
+
+
+def get_faces_split(faces, verts_map):
+    """Vectorized search of triangles which can be created in the mesh and back triangles.
+    Triangle can't be created if it uses the same vertex multiple times after welding,
+    or if triangle with the same vertices was already created before it.
+    Such duplicated triangle is considered a back triangle when reversed it matches
+    already created triangle, each created triangle can have only one back triangle.
+
+    :param faces: triangles as original vertex indices
+    :type faces: list[list[int]] | numpy.ndarray
+    :param verts_map: welding map, for each vertex index holding index of it's original vertex
+    :type verts_map: numpy.ndarray
+    :return: indices of triangles to be created and indices of back triangles
+    :rtype: tuple[numpy.ndarray, numpy.ndarray]
+    """
+    faces = numpy.asarray(faces, dtype=numpy.int64).reshape(-1, 3)
+    welded = verts_map[faces]
+
+    valid = (welded[:, 0] != welded[:, 1]) & (welded[:, 1] != welded[:, 2]) & (welded[:, 0] != welded[:, 2])
+    valid_i = numpy.flatnonzero(valid)
+    if len(valid_i) == 0:
+        return valid_i, valid_i
+
+    # from triangles using the same vertices only first one can be created
+    _, first_i = numpy.unique(numpy.sort(welded[valid_i], axis=1), axis=0, return_index=True)
+    created = numpy.zeros(len(faces), dtype=bool)
+    created[valid_i[first_i]] = True
+
+    new_faces_i = numpy.flatnonzero(created)
+    rejected_i = numpy.flatnonzero(valid & ~created)
+
+    if len(rejected_i) > 0:
+        lprint("D Found %i triangle(s) with already used vertex indices.", (len(rejected_i),))
+    else:
+        return new_faces_i, rejected_i
+
+    # label created and reversed rejected triangles, so matching can be done on flat arrays
+    created_keys = __get_cyclic_keys(faces[new_faces_i])
+    reversed_keys = __get_cyclic_keys(faces[rejected_i][:, ::-1])
+    _, labels = numpy.unique(numpy.concatenate((created_keys, reversed_keys)), axis=0, return_inverse=True)
+    labels = labels.ravel()
+    created_labels = labels[:len(created_keys)]
+    reversed_labels = labels[len(created_keys):]
+
+    is_back = numpy.isin(reversed_labels, created_labels)
+    _, first_i = numpy.unique(reversed_labels[is_back], return_index=True)
+    back_faces_i = numpy.sort(rejected_i[is_back][first_i])
+
+    return new_faces_i, back_faces_i
+
+
+def mesh_make_geometry(mesh, vertices, faces, back_faces, verts_map):
+    """Creates vertices, loops and polygons of the given empty mesh directly from arrays.
+    Welded vertices are not created at all and back faces get their own copies of the vertices they use.
+
+    :param mesh: empty mesh in which geometry should be created
+    :type mesh: bpy.types.Mesh
+    :param vertices: vertices positions already in Blender space
+    :type vertices: numpy.ndarray
+    :param faces: triangles as original vertex indices
+    :type faces: numpy.ndarray
+    :param back_faces: back triangles as original vertex indices
+    :type back_faces: numpy.ndarray
+    :param verts_map: welding map, for each vertex index holding index of it's original vertex
+    :type verts_map: numpy.ndarray
+    :return: original vertex index of each created vertex and original vertex index of each created loop
+    :rtype: tuple[numpy.ndarray, numpy.ndarray]
+    """
+    verts_count = len(verts_map)
+    faces = numpy.asarray(faces, dtype=numpy.int64).reshape(-1, 3)
+    back_faces = numpy.asarray(back_faces, dtype=numpy.int64).reshape(-1, 3)
+
+    # vertices welded into another one are left out
+    kept_verts = numpy.flatnonzero(verts_map == numpy.arange(verts_count))
+    new_indices = numpy.full(verts_count, -1, dtype=numpy.int64)
+    new_indices[kept_verts] = numpy.arange(len(kept_verts))
+    loops = new_indices[verts_map[faces]].ravel()
 
-        key = (str(int(val[0] * perc)) + str(int(val[1] * perc)) + str(int(val[2] * perc)) +
-               str(int(mesh_normals[val_i][0] * perc)) + str(int(mesh_normals[val_i][1] * perc)) + str(int(mesh_normals[val_i][2] * perc)))
+    # back faces are using their own copies of the vertices
+    back_verts = numpy.unique(verts_map[back_faces])
+    new_indices[:] = -1
+    new_indices[back_verts] = len(kept_verts) + numpy.arange(len(back_verts))
+    back_loops = new_indices[verts_map[back_faces]].ravel()
 
-        # also include vertex colors in key if present
-        for vc_layer_name in mesh_final_rgba:
-            for col_channel in mesh_final_rgba[vc_layer_name][val_i]:
-                key += str(int(col_channel * perc))
+    verts_src = numpy.concatenate((kept_verts, back_verts))
+    loops_src = numpy.concatenate((faces.ravel(), back_faces.ravel()))
+    loops = numpy.concatenate((loops, back_loops)).astype(numpy.int32)
 
-        if key not in posnorm_dict_tmp:
-            posnorm_dict_tmp[key] = [val_i]
-        else:
-            posnorm_dict_tmp[key].append(val_i)
+    mesh.vertices.add(len(verts_src))
+    mesh.vertices.foreach_set("co", numpy.ascontiguousarray(vertices[verts_src], dtype=numpy.float32).ravel())
 
-    # create map for quick access to original vertex index via double vertex indices: (key: double vert index; value: original vert index)
-    verts_map = {}
-    for indices in posnorm_dict_tmp.values():
-        # ignore entry if only one vertex was added to it (means there was no duplicates for it)
-        if len(indices) <= 1:
-            continue
+    mesh.loops.add(len(loops))
+    mesh.loops.foreach_set("vertex_index", loops)
+
+    mesh.polygons.add(len(loops) // 3)
+    mesh.polygons.foreach_set("loop_start", numpy.arange(0, len(loops), 3, dtype=numpy.int32))
+
+    mesh.update(calc_edges=True)
+
+    return verts_src, loops_src
+
+
+def get_created_vertices(verts_src, src_indices):
+    """Finds all created vertices for given original vertex indices.
+    One original vertex can result in multiple created ones, as back faces are having their own copies.
+
+    :param verts_src: original vertex index of each created vertex, as returned by mesh_make_geometry
+    :type verts_src: numpy.ndarray
+    :param src_indices: original vertex indices to search for
+    :type src_indices: numpy.ndarray
+    :return: position in given src_indices and created vertex index for each found vertex
+    :rtype: tuple[numpy.ndarray, numpy.ndarray]
+    """
+    sorted_i = numpy.argsort(verts_src, kind="stable")
+    sorted_src = verts_src[sorted_i]
+
+    starts = numpy.searchsorted(sorted_src, src_indices, side="left")
+    counts = numpy.searchsorted(sorted_src, src_indices, side="right") - starts
+
+    entries = numpy.repeat(numpy.arange(len(src_indices)), counts)
+    offsets = numpy.arange(len(entries)) - numpy.repeat(numpy.cumsum(counts) - counts, counts)
+
+    return entries, sorted_i[numpy.repeat(starts, counts) + offsets]
+
+
+def mesh_make_uv_layer(mesh, uv_layer_name, uv_layer_data, loops_src):
+    """Add UV Layer to the mesh, UVs are converted from SCS UV space.
+
+    :param mesh: mesh to add UV Layer to
+    :type mesh: bpy.types.Mesh
+    :param uv_layer_name: Name for the layer
+    :type uv_layer_name: str
+    :param uv_layer_data: UV Layer data per vertex
+    :type uv_layer_data: list | numpy.ndarray
+    :param loops_src: original vertex index of each loop in the mesh
+    :type loops_src: numpy.ndarray
+    """
+    uvs = numpy.asarray(uv_layer_data, dtype=numpy.float32).reshape(-1, 2)[loops_src]
+    uvs[:, 1] = 1.0 - uvs[:, 1]
+
+    uv_lay = mesh.uv_layers.new(name=uv_layer_name)
+    uv_lay.data.foreach_set("uv", uvs.ravel())
+
+
+def mesh_make_vc_layer(mesh, vc_layer_name, vc_layer_data, loops_src):
+    """Add Vertex Color Layer to the mesh. If data has alpha channel, additional alpha layer is created.
+
+    :param mesh: mesh to add Vertex Color Layer to
+    :type mesh: bpy.types.Mesh
+    :param vc_layer_name: Name for the layer
+    :type vc_layer_name: str
+    :param vc_layer_data: Vertex Color Layer data per vertex, with 3 or 4 channels
+    :type vc_layer_data: numpy.ndarray
+    :param loops_src: original vertex index of each loop in the mesh
+    :type loops_src: numpy.ndarray
+    """
+    vcols = vc_layer_data[loops_src] / 2
+    loop_cols = numpy.ones((len(loops_src), 4), dtype=numpy.float32)
 
-        for idx in indices[1:]:
-            verts_map[idx] = indices[0]  # fist index is original, rest are duplicates
+    loop_cols[:, :3] = vcols[:, :3]
+    color_lay = mesh.color_attributes.new(name=vc_layer_name, type='BYTE_COLOR', domain='CORNER')
+    color_lay.data.foreach_set("color", loop_cols.ravel())
 
-    return verts_map
+    if vcols.shape[1] == 4:
+        loop_cols[:, :3] = vcols[:, 3:]
+        color_a_lay = mesh.color_attributes.new(name=vc_layer_name + _MESH_consts.vcol_a_suffix, type='BYTE_COLOR', domain='CORNER')
+        color_a_lay.data.foreach_set("color", loop_cols.ravel())
 
 
 def bm_make_vertices(bm, vertices):
@@ -93,7 +281,8 @@ def bm_make_faces(bm, faces, points_to_weld_list):
     :type bm: bmesh.types.BMesh
     :param faces: faces which should be created, tuples of vertex indices
     :type faces: list[tuple[float]]
-    :param points_to_weld_list:
+    :param points_to_weld_list: welding map as returned by make_points_to_weld_list or empty list if there is no welding
+    :type points_to_weld_list: numpy.ndarray | list
     :return: new faces with correct indices without back faces and back faces
     :rtype: tuple[list[tuple[int]], list[tuple[int]]]
     """
@@ -104,19 +293,21 @@ def bm_make_faces(bm, faces, points_to_weld_list):
     new_faces_dict = {}
     back_faces_dict = {}
 
+    verts_map = None
+    if points_to_weld_list is not None and len(points_to_weld_list) > 0:
+        verts_map = numpy.asarray(points_to_weld_list).tolist()
+
     if faces:
+        bm.verts.ensure_lookup_table()
         for f_idx_i, f_idx in enumerate(faces):
 
-            new_f_idx = []
-            for v_idx in f_idx:
-                new_v_idx = v_idx
-                if v_idx in points_to_weld_list:
-                    new_v_idx = points_to_weld_list[v_idx]
-                new_f_idx.append(new_v_idx)
+            if verts_map:
+                new_f_idx = [verts_map[v_idx] for v_idx in f_idx]
+            else:
+                new_f_idx = f_idx
 
             try:
 
-                bm.verts.ensure_lookup_table()
                 bm.faces.new([bm.verts[i] for i in new_f_idx])
                 new_faces.append(f_idx)
                 new_faces_dict[str(f_idx)] = True
@@ -234,32 +425,6 @@ def bm_make_vc_layer(pim_version, bm, vc_layer_name, vc_layer_data):
                 loop[color_a_lay] = vcol_a
 
 
-def bm_delete_loose(mesh):
-    """Deletes loose vertices in the mesh.
-
-    :param mesh: mesh on which loose vertices should be removed
-    :type mesh: bpy.types.Mesh
-    :return: cleanuped mesh
-    :rtype: bpy.types.Mesh
-    """
-
-    bm = bmesh.new()
-    bm.from_mesh(mesh)
-
-    used_vertices = {}
-    for f in bm.faces:
-        for v in f.verts:
-            if v.index not in used_vertices:
-                used_vertices[v.index] = True
-
-    for v in bm.verts:
-        if v.index not in used_vertices:
-            bm.verts.remove(v)
-
-    bm.to_mesh(mesh)
-    bm.free()
-
-
 def bm_prepare_mesh_for_export(mesh, transformation_matrix, triangulate=False, flip=False):
     """Triangulates given mesh with bmesh module. Data are then saved back into original mesh!
 
@@ -424,3 +589,95 @@ def vcoloring_rebake(mesh, vcolor_arrays, old_array_hash):
     mesh_vcolors[_MESH_consts.default_vcol + _MESH_consts.vcol_a_suffix].data.foreach_set("color", vcolor_arrays[1])
 
     return new_array_hash
+
+
+def vcoloring_rebake_dirty(mesh, vcolor_arrays, rebake_state):
+    """Incrementally rebakes vertex colors from 4 vertex layers(color, decal, ao, ao2) to the vertex color layer
+    used by our shaders and exporter.
+
+    As only active vertex color layer can be painted, function compares active layer with the copy from previous rebake
+    and recombines only loops which changed since then. Full rebake is done on first call, when active layer
+    or loops count changes, as cached layers data might be outdated in that case.
+
+    :param mesh: mesh on which we should rebake vertex colors
+    :type mesh: bpy.types.Mesh
+    :param vcolor_arrays: initialized arrays for saving loops colors when calculating. Should be 4 arrays of length: loop_count * 4.
+    :type vcolor_arrays: list[numpy.ndarray]
+    :param rebake_state: dictionary holding cached layers data from previous rebake, pass empty dictionary on first call
+    :type rebake_state: dict
+    :return: number of rebaked loops; 0 if nothing had to be rebaked; -1 if rebake failed
+    :rtype: int
+    """
+    mesh_vcolors = mesh.color_attributes
+    layer_names = (_VCT_consts.ColoringLayersTypes.Color,
+                   _VCT_consts.ColoringLayersTypes.Decal,
+                   _VCT_consts.ColoringLayersTypes.AO,
+                   _VCT_consts.ColoringLayersTypes.AO2)
+    output_layer_names = (_MESH_consts.default_vcol,
+                          _MESH_consts.default_vcol + _MESH_consts.vcol_a_suffix)
+
+    loops_count = len(mesh.loops)
+    active_color_name = mesh_vcolors.active_color.name if mesh_vcolors.active_color else None
+
+    is_full_rebake = (
+            rebake_state.get("loops_count") != loops_count or
+            rebake_state.get("active_layer") != active_color_name or
+            any(layer_name not in mesh_vcolors for layer_name in output_layer_names)
+    )
+
+    if is_full_rebake:
+
+        rebake_state.clear()
+
+        if vcoloring_rebake(mesh, vcolor_arrays, None) is None:
+            return -1
+
+        # cache raw layers and combined color, so next rebakes can recombine only changed loops
+        layers = []
+        for layer_name in layer_names:
+            layer_array = numpy.empty(loops_count * 4, dtype=numpy.float32)
+            mesh_vcolors[layer_name].data.foreach_get("color", layer_array)
+            layers.append(layer_array)
+
+        rebake_state["loops_count"] = loops_count
+        rebake_state["active_layer"] = active_color_name
+        rebake_state["layers"] = layers
+        rebake_state["output"] = numpy.array(vcolor_arrays[0], dtype=numpy.float32)
+
+        return loops_count
+
+    # active layer is not one of coloring layers, thus nothing could be painted
+    if active_color_name not in layer_names:
+        return 0
+
+    layer_index = layer_names.index(active_color_name)
+    layers = rebake_state["layers"]
+
+    curr_array = vcolor_arrays[0]
+    mesh_vcolors[active_color_name].data.foreach_get("color", curr_array)
+
+    curr_loops = curr_array.reshape((-1, 4))
+    cached_loops = layers[layer_index].reshape((-1, 4))
+
+    dirty_loops = numpy.flatnonzero((curr_loops != cached_loops).any(axis=1))
+    if len(dirty_loops) == 0:
+        return 0
+
+    cached_loops[dirty_loops] = curr_loops[dirty_loops]
+
+    # alpha is donated only by decal layer color, so it's enough to just write it
+    if layer_index == 1:
+        mesh_vcolors[output_layer_names[1]].data.foreach_set("color", layers[1])
+        return len(dirty_loops)
+
+    # recombine only dirty loops: convert to srgb, combine and convert back to scene linear
+    color = _convert.np_linear_to_srgb(layers[0].reshape((-1, 4))[dirty_loops])
+    ao = _convert.np_linear_to_srgb(layers[2].reshape((-1, 4))[dirty_loops])
+    ao2 = _convert.np_linear_to_srgb(layers[3].reshape((-1, 4))[dirty_loops])
+
+    output = rebake_state["output"]
+    output.reshape((-1, 4))[dirty_loops] = _convert.np_srgb_to_linear(color * ao * ao2 * 4.0)
+
+    mesh_vcolors[output_layer_names[0]].data.foreach_set("color", output)
+
+    return len(dirty_loops)
@@ -26,21 +26,97 @@ _GAME_TOKENS = {'0': 1, '1': 2, '2': 3, '3': 4, '4': 5, '5': 6, '6': 7, '7': 8,
                 'u': 31, 'v': 32, 'w': 33, 'x': 34, 'y': 35, 'z': 36, '_': 37}
 
 
+class UniqueNames:
+    """Unique names allocator appending XXX number postfix.
+
+    It remembers highest used postfix for each base name, so allocating many copies of the same name
+    continues from last postfix instead of probing all already used ones again.
+    """
+
+    def __init__(self, names=(), sep="_"):
+        """Constructor.
+
+        :param names: already used names; mapping or collection with keys is indexed by its keys
+        :type names: iter
+        :param sep: separator for number postfix
+        :type sep: str
+        """
+        self.__names = set(names.keys()) if hasattr(names, "keys") else set(names)
+        """:type: set[str]"""
+        """Set of all used names."""
+        self.__last_postfixes = {}
+        """:type: dict[tuple[str, str], int]"""
+        """Highest used number postfix for each base name and separator."""
+        self.__sep = sep
+
+    def __contains__(self, name):
+        return name in self.__names
+
+    def add(self, name):
+        """Marks given name as used.
+
+        :param name: used name
+        :type name: str
+        """
+        self.__names.add(name)
+
+    def get_unique(self, name, sep=None):
+        """Creates unique name and marks it as used.
+
+        :param name: original name without postfix
+        :type name: str
+        :param sep: separator for number postfix; None to use separator of allocator
+        :type sep: str | None
+        :return: unique name
+        :rtype: str
+        """
+
+        if name in self.__names:
+
+            if sep is None:
+                sep = self.__sep
+
+            postfix_key = (name, sep)
+            n_copies = self.__last_postfixes.get(postfix_key, 0)
+            unique_name = name
+            while unique_name in self.__names:
+                n_copies += 1
+                unique_name = name + sep + str(n_copies).zfill(3)
+
+            self.__last_postfixes[postfix_key] = n_copies
+            name = unique_name
+
+        self.__names.add(name)
+        return name
+
+
 def get_unique(name, iterable, sep="_"):
     """Creates unique name iniside given iterable with appending XXX number postfix.
 
+    For creating many names inside the same iterable use "UniqueNames" allocator, which can also be passed as iterable,
+    in that case returned name is marked as used.
+
     :param name: original name without postfix
     :type name: str
     :param iterable: iterable object inside which name should be unique
-    :type iterable: iter
+    :type iterable: iter | UniqueNames
     :param sep: separator for number postfix
     :type sep: str
     :return: unique name inside given iterable
     :rtype: str
     """
 
+    if isinstance(iterable, UniqueNames):
+        return iterable.get_unique(name, sep)
+
     if name in iterable:
 
+        # index names once, so probing doesn't search whole list or blender collection for each postfix
+        if hasattr(iterable, "keys"):
+            iterable = set(iterable.keys())
+        elif not isinstance(iterable, (set, frozenset)):
+            iterable = set(iterable)
+
         original_name = name
         n_copies = 1
         while name in iterable:
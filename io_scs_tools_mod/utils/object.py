@@ -22,6 +22,7 @@ import bpy
 import bmesh
 import re
 import math
+from contextlib import contextmanager
 from bpy_extras import object_utils as bpy_object_utils
 from mathutils import Vector, Quaternion
 from io_scs_tools_mod.utils.printout import lprint
@@ -765,7 +766,8 @@ def get_vertex_group(layer, vert_index):
     return vg_weight
 
 
-def create_locator_empty(name, loc, rot=(0, 0, 0), scale=(1, 1, 1), size=1.0, data_type='Prefab', hookup=None, blend_coords=False):
+def create_locator_empty(name, loc, rot=(0, 0, 0), scale=(1, 1, 1), size=1.0, data_type='Prefab', hookup=None, blend_coords=False,
+                         unique_names=None):
     """
     Creates an empty object for a Locator.
     :param name:
@@ -776,6 +778,8 @@ def create_locator_empty(name, loc, rot=(0, 0, 0), scale=(1, 1, 1), size=1.0, da
     :param data_type:
     :param hookup:
     :param blend_coords:
+    :param unique_names: unique names allocator of Blender objects; None to check name against all objects
+    :type unique_names: io_scs_tools_mod.utils.name.UniqueNames | None
     :return:
     """
     rot_quaternion = None
@@ -788,8 +792,12 @@ def create_locator_empty(name, loc, rot=(0, 0, 0), scale=(1, 1, 1), size=1.0, da
     else:
         location = _convert.change_to_scs_xyz_coordinates(loc, _get_scs_globals().import_scale)
 
-    unique_name = _name.get_unique(name, bpy.data.objects, sep=".")
+    unique_name = _name.get_unique(name, unique_names if unique_names is not None else bpy.data.objects, sep=".")
     locator = bpy.data.objects.new(unique_name, None)
+
+    # Blender might still adjust the name (eg. objects created meanwhile outside of allocator), so mark actual one as used
+    if unique_names is not None:
+        unique_names.add(locator.name)
     locator.empty_display_type = 'PLAIN_AXES'
     locator.scs_props.object_identity = locator.name
 
@@ -1134,3 +1142,103 @@ def select_set(obj, state, view_layer=None):
             return True
 
     return False
+
+
+@contextmanager
+def armature_edit_session(context, armature):
+    """Context manager for editing bones of given armature in single edit session.
+    Mode switching is done with context override, so it works headless and in batch imports
+    regardless of current UI context.
+
+    :param context: Blender context
+    :type context: bpy.types.Context
+    :param armature: armature object which bones should be edited
+    :type armature: bpy.types.Object
+    :return: edit bones of the armature
+    :rtype: bpy.types.ArmatureEditBones
+    """
+    context.view_layer.objects.active = armature
+
+    override = {
+        "active_object": armature,
+        "object": armature,
+        "selected_objects": [armature],
+        "selected_editable_objects": [armature]
+    }
+
+    with context.temp_override(**override):
+        bpy.ops.object.mode_set(mode='EDIT')
+
+    try:
+        yield armature.data.edit_bones
+    finally:
+        with context.temp_override(**override):
+            bpy.ops.object.mode_set(mode='OBJECT')
+
+
+def create_armature(context, bone_names, name="Armature", bones_rest=None):
+    """Creates armature object and all of it's bones through data API.
+    Bones are created in one edit session. Bones without given rest data get default rest position,
+    pointing up Z axis with unit length.
+
+    :param context: Blender context
+    :type context: bpy.types.Context
+    :param bone_names: names of the bones to create
+    :type bone_names: list[str]
+    :param name: name of armature object and data-block
+    :type name: str
+    :param bones_rest: rest data of the bones; bones_rest[bone_name] = (head, tail, roll, parent_name, use_connect)
+    :type bones_rest: dict[str, tuple] | None
+    :return: created armature object linked to active layer collection
+    :rtype: bpy.types.Object
+    """
+    if bones_rest is None:
+        bones_rest = {}
+
+    armature_data = bpy.data.armatures.new(name)
+    armature = bpy.data.objects.new(name, armature_data)
+    context.view_layer.active_layer_collection.collection.objects.link(armature)
+
+    with armature_edit_session(context, armature) as edit_bones:
+        for bone_name in bone_names:
+            edit_bone = edit_bones.new(bone_name)
+            edit_bone.head = (0.0, 0.0, 0.0)
+            edit_bone.tail = (0.0, 0.0, 1.0)
+
+        # parents can be set only after all the bones exist
+        for bone_name in bone_names:
+            if bone_name not in bones_rest:
+                continue
+
+            head, tail, roll, parent_name, use_connect = bones_rest[bone_name]
+
+            edit_bone = edit_bones[bone_name]
+            if parent_name in edit_bones:
+                edit_bone.parent = edit_bones[parent_name]
+            edit_bone.head = head
+            edit_bone.tail = tail
+            edit_bone.roll = roll
+
+        # connect bones only once all of them are placed, so heads aren't snapped to tails not yet set
+        for bone_name in bone_names:
+            if bone_name in bones_rest and bones_rest[bone_name][4]:
+                edit_bones[bone_name].use_connect = True
+
+    return armature
+
+
+def add_armature_modifier(obj, armature):
+    """Adds armature modifier using given armature to the object and parents object to the armature.
+
+    :param obj: skinned object
+    :type obj: bpy.types.Object
+    :param armature: armature object
+    :type armature: bpy.types.Object
+    :return: created armature modifier
+    :rtype: bpy.types.ArmatureModifier
+    """
+    arm_modifier = obj.modifiers.new(name="Armature", type='ARMATURE')
+    arm_modifier.object = armature
+    obj.parent = armature
+
+    return arm_modifier
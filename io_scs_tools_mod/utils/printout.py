@@ -24,6 +24,8 @@ from time import time
 from tempfile import NamedTemporaryFile
 
 _PRECH_TABLE = {'E', 'W', 'I', 'D', 'S'}
+_DUMP_LEVEL_TABLE = {'I': 2, 'D': 3, 'S': 4}
+"""Minimal dump level on which messages with given sign are printed."""
 
 
 class _FileLogger:
@@ -144,12 +146,25 @@ class _ImmediateMsgHandler:
 file_logger = _FileLogger()
 immediate_messenger = _ImmediateMsgHandler()
 
+_dump_level = None
+"""Cached dump level from SCS globals, so filtered out messages can return without accessing SCS globals."""
+
 dev_error_messages = []
 error_messages = []
 dev_warning_messages = []
 warning_messages = []
 
 
+def set_dump_level(dump_level):
+    """Sets dump level used by printouts. Should be called whenever dump level in SCS globals changes.
+
+    :param dump_level: new dump level
+    :type dump_level: str | int
+    """
+    global _dump_level
+    _dump_level = int(dump_level)
+
+
 def lprint(string, values=(), report_errors=0, report_warnings=0, immediate_timeout=-1):
     """Handy printout function with alert levels and more fancy stuff.
 
@@ -164,47 +179,65 @@ def lprint(string, values=(), report_errors=0, report_warnings=0, immediate_time
     :param immediate_timeout: -1 - skip immediate report, >=0 - do immediate report if elapsed time from last report is bigger than specified timeout
     :type immediate_timeout: float
     """
-    from io_scs_tools_mod.utils import get_scs_globals as _get_scs_globals
-
-    dump_level = int(_get_scs_globals().dump_level)
-
-    prech = ''
+    # find message sign after leading new lines and tabs without slicing message string
+    prech_len = 0
     if string != "":
-        while string[0] in '\n\t':
-            prech += string[0]
-            string = string[1:]
+        while string[prech_len] in '\n\t':
+            prech_len += 1
 
-        # no matter the dump level always report message to immediate messenger
+    sign = string[prech_len] if string != "" else ""
+
+    # no matter the dump level always reset immediate messenger
+    if sign != "":
         immediate_messenger.reset_message()
-        if immediate_messenger.can_report(immediate_timeout):
-            immediate_messenger.report_message_and_redraw(string[2:] % values)
+
+    # dump level is read from SCS globals only on first printout, later it's updated by dump level setter
+    if _dump_level is None:
+        from io_scs_tools_mod.utils import get_scs_globals as _get_scs_globals
+        set_dump_level(_get_scs_globals().dump_level)
+
+    dump_level = _dump_level
+    can_report_immediate = immediate_messenger.can_report(immediate_timeout)
+
+    # early exit for messages which will be filtered out anyway,
+    # so nothing gets formatted and file logger doesn't get flushed for nothing
+    if (sign in _DUMP_LEVEL_TABLE and dump_level < _DUMP_LEVEL_TABLE[sign] and
+            report_errors == 0 and report_warnings == 0 and not can_report_immediate):
+        return False
+
+    if sign != "":
+        prech = string[:prech_len]
+        body = string[prech_len + 2:] % values
+
+        if can_report_immediate:
+            immediate_messenger.report_message_and_redraw(body)
 
         message = None
-        if string[0] == 'E':
-            message = str(prech + 'ERROR\t-  ' + string[2:] % values)
+        if sign == 'E':
+            message = prech + 'ERROR\t-  ' + body
             error_messages.append(message.strip('\n'))
             # raise Exception('ERROR - ' + string[2:])
-        if string[0] == 'W':
-            message = str(prech + 'WARNING\t-  ' + string[2:] % values)
+        elif sign == 'W':
+            message = prech + 'WARNING\t-  ' + body
             warning_messages.append(message.strip('\n'))
             if not dump_level >= 1:
                 message = None
-        if dump_level >= 2:
-            if string[0] == 'I':
-                message = str(prech + 'INFO\t-  ' + string[2:] % values)
-        if dump_level >= 3:
-            if string[0] == 'D':
-                message = prech + 'DEBUG\t-  ' + string[2:] % values
-        if dump_level >= 4:
-            if string[0] == 'S':
-                message = prech + string[2:] % values
+        elif sign == 'I':
+            if dump_level >= 2:
+                message = prech + 'INFO\t-  ' + body
+        elif sign == 'D':
+            if dump_level >= 3:
+                message = prech + 'DEBUG\t-  ' + body
+        elif sign == 'S':
+            if dump_level >= 4:
+                message = prech + body
 
         if message is not None:
             print(message)
             file_logger.write(message + "\n")
 
-        if string[0] not in _PRECH_TABLE:
-            print(prech + '!!! UNKNOWN MESSAGE SIGN !!! - "' + string + '"' % values)
+        if sign not in _PRECH_TABLE:
+            print(prech + '!!! UNKNOWN MESSAGE SIGN !!! - "' + string[prech_len:] + '"' % values)
 
     # CLEAR ERROR AND WARNING STACK IF REQUESTED
     if report_errors == -1:
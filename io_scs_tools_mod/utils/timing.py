@@ -0,0 +1,219 @@
+# ##### BEGIN GPL LICENSE BLOCK #####
+#
+# This program is free software; you can redistribute it and/or
+# modify it under the terms of the GNU General Public License
+# as published by the Free Software Foundation; either version 2
+# of the License, or (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program; if not, write to the Free Software Foundation,
+# Inc., 51 Franklin Street, Fifth Floor, Boston, MA 02110-1301, USA.
+#
+# ##### END GPL LICENSE BLOCK #####
+
+import json
+import os
+import re
+import tempfile
+from contextlib import contextmanager
+from time import perf_counter, strftime
+from io_scs_tools_mod.consts import Cache as _CACHE_consts
+from io_scs_tools_mod.utils.printout import lprint
+
+
+class _StagesTimer:
+    """Stages timer collecting wall time and call counts of named stages during one import/export operation.
+
+    Operations can be nested (eg. import of multiple files), in that case stages are collected
+    from beginning of the outermost operation and reported at its end.
+    """
+
+    def __init__(self):
+        self.__depth = 0
+        """Depth of currently running operations."""
+        self.__start = 0.0
+        """Start time of outermost running operation."""
+        self.__stages = {}
+        """:type: dict[str, list]"""
+        """Collected stages as dictionary of stage name -> [total time, call count], ordered by first appearance."""
+
+    def begin(self):
+        """Begins new operation. If no operation is running yet, previously collected stages are cleared.
+        """
+        if self.__depth == 0:
+            self.__stages.clear()
+            self.__start = perf_counter()
+
+        self.__depth += 1
+
+    def end(self):
+        """Ends lastly begun operation.
+
+        :return: True if outermost operation was ended; False otherwise
+        :rtype: bool
+        """
+        self.__depth = max(self.__depth - 1, 0)
+        return self.__depth == 0
+
+    def add(self, name, duration):
+        """Adds duration of one call to the stage with given name.
+
+        :param name: name of the stage
+        :type name: str
+        :param duration: duration of the call in seconds
+        :type duration: float
+        """
+        if name not in self.__stages:
+            self.__stages[name] = [0.0, 0]
+
+        stage = self.__stages[name]
+        stage[0] += duration
+        stage[1] += 1
+
+    def get_summary(self):
+        """Gets summary of collected stages.
+
+        :return: dictionary with total time of the operation and list of stages with their time and call count
+        :rtype: dict
+        """
+        return {
+            "total": perf_counter() - self.__start,
+            "stages": [{"name": name, "time": stage[0], "calls": stage[1]} for name, stage in self.__stages.items()]
+        }
+
+
+_timer = _StagesTimer()
+
+
+@contextmanager
+def stage(name):
+    """Context manager measuring wall time of the code block as one call of the stage with given name.
+
+    :param name: name of the stage (eg. "parse", "mesh build", "file write")
+    :type name: str
+    """
+    start = perf_counter()
+    try:
+        yield
+    finally:
+        _timer.add(name, perf_counter() - start)
+
+
+def start_stage():
+    """Starts measuring of the stage, for the code blocks where "stage" context manager is not handy.
+
+    :return: start time which should be passed to "end_stage"
+    :rtype: float
+    """
+    return perf_counter()
+
+
+def end_stage(name, start):
+    """Ends measuring of the stage started with "start_stage" and records it as one call of the stage with given name.
+
+    :param name: name of the stage
+    :type name: str
+    :param start: start time returned by "start_stage"
+    :type start: float
+    """
+    _timer.add(name, perf_counter() - start)
+
+
+def add_stage(name, duration):
+    """Records one call of the stage with given name, for durations measured elsewhere (eg. on worker thread).
+
+    :param name: name of the stage
+    :type name: str
+    :param duration: duration of the call in seconds
+    :type duration: float
+    """
+    _timer.add(name, duration)
+
+
+def begin_operation():
+    """Begins timing of import/export operation. Should be always paired with "end_operation",
+    even if operation fails, otherwise summaries of all following operations are lost.
+    Use "operation" context manager where possible.
+    """
+    _timer.begin()
+
+
+@contextmanager
+def operation(title, to_stdout=False, print_summary=True):
+    """Context manager timing the code block as import/export operation with given title.
+    Operation is ended and summary printed even if code block raises an exception.
+
+    :param title: title of the summary (eg. "Export of 'my_model'")
+    :type title: str
+    :param to_stdout: print summary directly to standard output, see "end_operation"
+    :type to_stdout: bool
+    :param print_summary: should summary be printed at all
+    :type print_summary: bool
+    """
+    begin_operation()
+    try:
+        yield
+    finally:
+        end_operation(title, to_stdout=to_stdout, print_summary=print_summary)
+
+
+def end_operation(title, json_filepath=None, to_stdout=False, print_summary=True):
+    """Ends timing of import/export operation and prints summary table of collected stages.
+
+    Summary is printed only at the end of the outermost operation. On developer dump level
+    summary is also dumped as JSON into temporary directory, if JSON file path is not given explicitly.
+
+    :param title: title of the summary (eg. "Export of 'my_model'")
+    :type title: str
+    :param json_filepath: file path to which summary should be dumped as JSON; None to use dump level decision
+    :type json_filepath: str | None
+    :param to_stdout: print summary directly to standard output and skip dump level decision,
+                      for usage while add-on preferences are not available yet (eg. on add-on registration)
+    :type to_stdout: bool
+    :param print_summary: should summary be printed at all; if not, operation is only ended
+    :type print_summary: bool
+    :return: summary of the operation if outermost operation was ended; None otherwise
+    :rtype: dict | None
+    """
+    if not _timer.end():
+        return None
+
+    if not print_summary:
+        return None
+
+    summary = _timer.get_summary()
+    summary["title"] = title
+
+    table = "I Timings summary of %s (total: %.3f sec):\n\t   %-24s %10s %8s"
+    values = [title, summary["total"], "STAGE", "TIME [s]", "CALLS"]
+    for stage_entry in summary["stages"]:
+        table += "\n\t   %-24s %10.3f %8i"
+        values.extend((stage_entry["name"], stage_entry["time"], stage_entry["calls"]))
+
+    if to_stdout:
+        print("INFO\t- " + table[2:] % tuple(values))
+    else:
+        lprint(table, tuple(values))
+
+    if json_filepath is None and not to_stdout:
+        from io_scs_tools_mod.utils import get_scs_globals as _get_scs_globals
+
+        if int(_get_scs_globals().dump_level) == 5:
+            json_filename = "timings-%s-%s.json" % (strftime("%Y%m%d-%H%M%S"), re.sub(r'[^\w.-]', "_", title))
+            json_filepath = os.path.join(tempfile.gettempdir(), _CACHE_consts.dir_name, json_filename)
+
+    if json_filepath is not None:
+        try:
+            os.makedirs(os.path.dirname(json_filepath), exist_ok=True)
+            with open(json_filepath, mode="w", encoding="utf8") as file:
+                json.dump(summary, file, indent=2)
+            lprint("D Timings summary dumped to: %r", (json_filepath,))
+        except OSError:
+            lprint("W Can't dump timings summary to: %r", (json_filepath,))
+
+    return summary
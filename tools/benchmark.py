@@ -0,0 +1,527 @@
+# ##### BEGIN GPL LICENSE BLOCK #####
+#
+# This program is free software; you can redistribute it and/or
+# modify it under the terms of the GNU General Public License
+# as published by the Free Software Foundation; either version 2
+# of the License, or (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program; if not, write to the Free Software Foundation,
+# Inc., 51 Franklin Street, Fifth Floor, Boston, MA 02110-1301, USA.
+#
+# ##### END GPL LICENSE BLOCK #####
+
+"""Headless benchmark of PIX/SII parsing & writing and hex conversion helpers over synthetic files.
+
+It doesn't require any scene data, however add-on has to be enabled as parsers are using
+add-on preferences for printouts and include paths. It's a developer tool and is not packaged
+with the add-on. Run it with Blender in background mode, eg.:
+
+    blender -b --addons io_scs_tools_mod --python tools/benchmark.py -- --vertices 100000 --output results.json
+
+Results are printed (or saved) as JSON, so runs can be compared between each other.
+"""
+
+import argparse
+import json
+import os
+import platform
+import statistics
+import sys
+import tempfile
+from time import perf_counter
+from io_scs_tools_mod.internals.containers.parsers import pix as _pix_parser
+from io_scs_tools_mod.internals.containers.parsers import sii as _sii_parser
+from io_scs_tools_mod.internals.containers.writers import pix as _pix_writer
+from io_scs_tools_mod.internals.structure import SectionData as _SectionData
+from io_scs_tools_mod.utils.convert import float_array_to_hex_string
+from io_scs_tools_mod.utils.convert import float_to_hex_string
+from io_scs_tools_mod.utils.convert import hex_string_to_float
+from io_scs_tools_mod.utils.info import get_tools_version
+
+_IND = "    "
+"""Indentation used in generated PIX files."""
+
+
+def _get_value(i, offset=0.0):
+    """Gets deterministic pseudo random float value for given index.
+
+    :param i: index of the value
+    :type i: int
+    :param offset: offset added to the value
+    :type offset: float
+    :return: float value in range of <-50.0, 50.0> plus offset
+    :rtype: float
+    """
+    return ((i * 7919) % 10007) / 100.07 - 50.0 + offset
+
+
+def _get_hex_values(i, count):
+    """Gets hex string of given count of values for given index.
+
+    :param i: index of the first value
+    :type i: int
+    :param count: number of values
+    :type count: int
+    :return: hex string of values separated by double space
+    :rtype: str
+    """
+    return float_array_to_hex_string([_get_value(i + j) for j in range(count)])
+
+
+def _get_pieces_sizes(vertices, pieces):
+    """Splits vertices among pieces, each piece getting multiple of three vertices.
+
+    :param vertices: total number of vertices
+    :type vertices: int
+    :param pieces: number of pieces
+    :type pieces: int
+    :return: number of vertices for each piece
+    :rtype: list[int]
+    """
+    piece_size = max(vertices // pieces // 3 * 3, 3)
+    return [piece_size] * pieces
+
+
+def generate_pim(vertices, pieces, bones):
+    """Generates synthetic PIM file content.
+
+    :param vertices: total number of vertices
+    :type vertices: int
+    :param pieces: number of pieces
+    :type pieces: int
+    :param bones: number of bones, if bigger than zero skin section is generated
+    :type bones: int
+    :return: PIM file content
+    :rtype: str
+    """
+    pieces_sizes = _get_pieces_sizes(vertices, pieces)
+    total_vertices = sum(pieces_sizes)
+
+    lines = [
+        'Header {', _IND + 'FormatVersion: 5', _IND + 'Source: "benchmark"', _IND + 'Type: "Model"', _IND + 'Name: "benchmark"', '}',
+        'Global {',
+        _IND + 'VertexCount: %i' % total_vertices,
+        _IND + 'TriangleCount: %i' % (total_vertices // 3),
+        _IND + 'MaterialCount: 1',
+        _IND + 'PieceCount: %i' % pieces,
+        _IND + 'PartCount: 1',
+        _IND + 'BoneCount: %i' % bones,
+        _IND + 'LocatorCount: 0',
+        _IND + 'Skeleton: "benchmark.pis"',
+        '}',
+        'Material {', _IND + 'Alias: "material"', _IND + 'Effect: "eut2.dif"', '}',
+    ]
+
+    streams = (("_POSITION", "FLOAT3", 3), ("_NORMAL", "FLOAT3", 3), ("_UV0", "FLOAT2", 2), ("_RGBA", "FLOAT4", 4))
+    for piece_i, piece_size in enumerate(pieces_sizes):
+
+        lines.extend((
+            'Piece {',
+            _IND + 'Index: %i' % piece_i,
+            _IND + 'Material: 0',
+            _IND + 'VertexCount: %i' % piece_size,
+            _IND + 'TriangleCount: %i' % (piece_size // 3),
+            _IND + 'StreamCount: %i' % len(streams),
+        ))
+
+        for tag, data_format, size in streams:
+            lines.extend((_IND + 'Stream {', _IND * 2 + 'Format: %s' % data_format, _IND * 2 + 'Tag: "%s"' % tag))
+            for vert_i in range(piece_size):
+                lines.append('%s%s( %s )' % (_IND * 2, str(vert_i).ljust(5), _get_hex_values(vert_i, size)))
+            lines.append(_IND + '}')
+
+        lines.append(_IND + 'Triangles {')
+        for tri_i in range(piece_size // 3):
+            lines.append('%s%s( %s )' % (_IND * 2, str(tri_i).ljust(5), ' '.join([str(tri_i * 3 + j).ljust(5) for j in range(3)])))
+        lines.append(_IND + '}')
+
+        lines.append('}')
+
+    lines.extend((
+        'Part {',
+        _IND + 'Name: "defaultpart"',
+        _IND + 'PieceCount: %i' % pieces,
+        _IND + 'LocatorCount: 0',
+        _IND + 'Pieces: ( %s )' % ' '.join([str(i) for i in range(pieces)]),
+        '}',
+    ))
+
+    if bones > 0:
+
+        lines.append('Bones {')
+        for bone_i in range(bones):
+            lines.append('%s%s( "bone%i" )' % (_IND, str(bone_i).ljust(5), bone_i))
+        lines.append('}')
+
+        lines.extend((
+            'Skin {',
+            _IND + 'StreamCount: 1',
+            _IND + 'SkinStream {',
+            _IND * 2 + 'Format: FLOAT3',
+            _IND * 2 + 'Tag: "_POSITION"',
+            _IND * 2 + 'ItemCount: %i' % total_vertices,
+            _IND * 2 + 'TotalWeightCount: %i' % total_vertices,
+            _IND * 2 + 'TotalCloneCount: %i' % total_vertices,
+        ))
+
+        item_i = 0
+        for piece_i, piece_size in enumerate(pieces_sizes):
+            for vert_i in range(piece_size):
+                lines.extend((
+                    '%s%s( ( %s )' % (_IND * 2, str(item_i).ljust(6), _get_hex_values(vert_i, 3)),
+                    '%s%sWeights: 1      %s%s' % (_IND * 2, 8 * " ", str(item_i % bones).ljust(5), float_to_hex_string(1.0)),
+                    '%s%sClones: 1      %s%s' % (_IND * 2, 8 * " ", str(piece_i).ljust(5), vert_i),
+                    '%s%s)' % (_IND * 2, 6 * " "),
+                ))
+                item_i += 1
+
+        lines.extend((_IND + '}', '}'))
+
+    lines.append('')
+    return "\n".join(lines)
+
+
+def generate_pit(looks, materials):
+    """Generates synthetic PIT file content.
+
+    :param looks: number of looks
+    :type looks: int
+    :param materials: number of materials in each look
+    :type materials: int
+    :return: PIT file content
+    :rtype: str
+    """
+    lines = [
+        'Header {', _IND + 'FormatVersion: 1', _IND + 'Source: "benchmark"', _IND + 'Type: "Trait"', _IND + 'Name: "benchmark"', '}',
+        'Global {', _IND + 'LookCount: %i' % looks, _IND + 'VariantCount: 1', _IND + 'PartCount: 1', _IND + 'MaterialCount: %i' % materials, '}',
+    ]
+
+    for look_i in range(looks):
+
+        lines.extend(('Look {', _IND + 'Name: "look%i"' % look_i))
+        for mat_i in range(materials):
+            lines.extend((
+                _IND + 'Material {',
+                _IND * 2 + 'Alias: "material%i"' % mat_i,
+                _IND * 2 + 'Effect: "eut2.dif.spec"',
+                _IND * 2 + 'Flags: 0',
+                _IND * 2 + 'AttributeCount: 2',
+                _IND * 2 + 'TextureCount: 1',
+                _IND * 2 + 'Attribute {',
+                _IND * 3 + 'Format: FLOAT3',
+                _IND * 3 + 'Tag: "diffuse"',
+                _IND * 3 + 'Value: ( %s )' % _get_hex_values(mat_i, 3),
+                _IND * 2 + '}',
+                _IND * 2 + 'Attribute {',
+                _IND * 3 + 'Format: FLOAT',
+                _IND * 3 + 'Tag: "shininess"',
+                _IND * 3 + 'Value: ( %s )' % _get_hex_values(mat_i, 1),
+                _IND * 2 + '}',
+                _IND * 2 + 'Texture {',
+                _IND * 3 + 'Tag: "texture[0]:texture_base"',
+                _IND * 3 + 'Value: "/material/benchmark/material%i.tobj"' % mat_i,
+                _IND * 2 + '}',
+                _IND + '}',
+            ))
+        lines.append('}')
+
+    lines.extend(('Variant {', _IND + 'Name: "default"', _IND + 'Part {', _IND * 2 + 'Name: "defaultpart"', _IND * 2 + 'AttributeCount: 0',
+                  _IND + '}', '}', ''))
+    return "\n".join(lines)
+
+
+def generate_pip(curves):
+    """Generates synthetic PIP file content.
+
+    :param curves: number of curves
+    :type curves: int
+    :return: PIP file content
+    :rtype: str
+    """
+    lines = [
+        'Header {', _IND + 'FormatVersion: 8', _IND + 'Source: "benchmark"', _IND + 'Type: "Prefab"', _IND + 'Name: "benchmark"', '}',
+        'Global {', _IND + 'NodeCount: 0', _IND + 'TerrainPointCount: 0', _IND + 'NavCurveCount: %i' % curves, _IND + 'SignCount: 0',
+        _IND + 'SpawnPointCount: 0', _IND + 'SemaphoreCount: 0', _IND + 'MapPointCount: 0', _IND + 'TriggerPointCount: 0',
+        _IND + 'IntersectionCount: 0', '}',
+    ]
+
+    for curve_i in range(curves):
+        lines.extend((
+            'Curve {',
+            _IND + 'Index: %i' % curve_i,
+            _IND + 'Name: "curve%i"' % curve_i,
+            _IND + 'Flags: 0',
+            _IND + 'LeadsToNodes: 0',
+            _IND + 'StartPosition: ( %s )' % _get_hex_values(curve_i, 3),
+            _IND + 'StartRotation: ( %s )' % _get_hex_values(curve_i, 4),
+            _IND + 'EndPosition: ( %s )' % _get_hex_values(curve_i + 1, 3),
+            _IND + 'EndRotation: ( %s )' % _get_hex_values(curve_i + 1, 4),
+            _IND + 'Length: %s' % float_to_hex_string(abs(_get_value(curve_i))),
+            _IND + 'NextCurves: ( %i -1 -1 -1 -1 -1 -1 -1 )' % ((curve_i + 1) % curves),
+            _IND + 'PrevCurves: ( %i -1 -1 -1 -1 -1 -1 -1 )' % ((curve_i - 1) % curves),
+            '}',
+        ))
+
+    lines.append('')
+    return "\n".join(lines)
+
+
+def generate_pia(bones, frames):
+    """Generates synthetic PIA file content.
+
+    :param bones: number of bone channels
+    :type bones: int
+    :param frames: number of keyframes in each bone channel
+    :type frames: int
+    :return: PIA file content
+    :rtype: str
+    """
+    lines = [
+        'Header {', _IND + 'FormatVersion: 3', _IND + 'Source: "benchmark"', _IND + 'Type: "Animation"', _IND + 'Name: "benchmark"', '}',
+        'Global {',
+        _IND + 'Skeleton: "benchmark.pis"',
+        _IND + 'TotalTime: %s' % float_to_hex_string(frames / 30.0),
+        _IND + 'BoneChannelCount: %i' % bones,
+        _IND + 'CustomChannelCount: 0',
+        '}',
+    ]
+
+    for bone_i in range(bones):
+
+        lines.extend((
+            'BoneChannel {',
+            _IND + 'Name: "bone%i"' % bone_i,
+            _IND + 'StreamCount: 2',
+            _IND + 'KeyframeCount: %i' % frames,
+            _IND + 'Stream {', _IND * 2 + 'Format: FLOAT', _IND * 2 + 'Tag: "_TIME"',
+        ))
+        for frame_i in range(frames):
+            lines.append('%s%s( %s )' % (_IND * 2, str(frame_i).ljust(5), float_to_hex_string(1 / 30.0)))
+        lines.append(_IND + '}')
+
+        lines.extend((_IND + 'Stream {', _IND * 2 + 'Format: FLOAT4x4', _IND * 2 + 'Tag: "_MATRIX"'))
+        for frame_i in range(frames):
+            offset = _IND * 2 + 7 * " "
+            lines.extend((
+                '%s%s( %s' % (_IND * 2, str(frame_i).ljust(5), _get_hex_values(frame_i, 4)),
+                offset + _get_hex_values(frame_i + 4, 4),
+                offset + _get_hex_values(frame_i + 8, 4),
+                offset + _get_hex_values(frame_i + 12, 4) + ' )',
+            ))
+        lines.extend((_IND + '}', '}'))
+
+    lines.append('')
+    return "\n".join(lines)
+
+
+def generate_sii(units):
+    """Generates synthetic SII file content.
+
+    :param units: number of units
+    :type units: int
+    :return: SII file content
+    :rtype: str
+    """
+    lines = ['SiiNunit', '{']
+
+    for unit_i in range(units):
+        lines.extend((
+            'sign_model : sign.benchmark.u%i' % unit_i,
+            '{',
+            '\tmodel_desc: "/model/benchmark/sign%i.pmd"' % unit_i,
+            '\tcategory: "benchmark"',
+            '\twidth: %.3f' % abs(_get_value(unit_i)),
+            '\toffset: (%.3f, %.3f, %.3f)' % (_get_value(unit_i), _get_value(unit_i + 1), _get_value(unit_i + 2)),
+            '\tcolor: &%08x' % (unit_i * 2654435761 % 0xffffffff),
+            '\tvariants[]: v0',
+            '\tvariants[]: v1',
+            '}',
+            '',
+        ))
+
+    lines.extend(('}', ''))
+    return "\n".join(lines)
+
+
+def get_pim_container(vertices, pieces):
+    """Creates PIM like container, as exporter would, to be written by PIX writer.
+
+    :param vertices: total number of vertices
+    :type vertices: int
+    :param pieces: number of pieces
+    :type pieces: int
+    :return: list of PIX sections
+    :rtype: list[io_scs_tools_mod.internals.structure.SectionData]
+    """
+    container = []
+
+    header = _SectionData("Header")
+    header.props.extend((("FormatVersion", 5), ("Source", "benchmark"), ("Type", "Model"), ("Name", "benchmark")))
+    container.append(header)
+
+    streams = (("_POSITION", "FLOAT3", 3), ("_NORMAL", "FLOAT3", 3), ("_UV0", "FLOAT2", 2), ("_RGBA", "FLOAT4", 4))
+    for piece_i, piece_size in enumerate(_get_pieces_sizes(vertices, pieces)):
+
+        piece = _SectionData("Piece")
+        piece.props.extend((("Index", piece_i), ("Material", 0), ("VertexCount", piece_size), ("TriangleCount", piece_size // 3),
+                            ("StreamCount", len(streams))))
+
+        for tag, data_format, size in streams:
+            stream = _SectionData("Stream")
+            stream.props.extend((("Format", data_format), ("Tag", tag)))
+            for vert_i in range(piece_size):
+                stream.data.append([_get_value(vert_i + j) for j in range(size)])
+            piece.sections.append(stream)
+
+        triangles = _SectionData("Triangles")
+        for tri_i in range(piece_size // 3):
+            triangles.data.append((tri_i * 3, tri_i * 3 + 1, tri_i * 3 + 2))
+        piece.sections.append(triangles)
+
+        container.append(piece)
+
+    return container
+
+
+def _measure(func, repeat):
+    """Measures wall time of given function for given number of repeats.
+
+    :param func: function without arguments to measure
+    :type func: collections.abc.Callable
+    :param repeat: number of repeats
+    :type repeat: int
+    :return: dictionary of minimal, median and mean time in seconds and number of repeats
+    :rtype: dict
+    """
+    times = []
+    for i in range(repeat):
+        start = perf_counter()
+        func()
+        times.append(perf_counter() - start)
+
+    return {
+        "min": min(times),
+        "median": statistics.median(times),
+        "mean": statistics.mean(times),
+        "repeat": repeat,
+    }
+
+
+def run(vertices=20000, pieces=4, curves=500, bones=32, frames=60, looks=4, materials=16, units=2000, repeat=5):
+    """Generates synthetic files into temporary directory and benchmarks parsers, writer and hex conversion helpers on them.
+
+    :param vertices: total number of vertices in PIM file
+    :type vertices: int
+    :param pieces: number of pieces in PIM file
+    :type pieces: int
+    :param curves: number of curves in PIP file
+    :type curves: int
+    :param bones: number of bones in PIM skin and PIA bone channels
+    :type bones: int
+    :param frames: number of keyframes in PIA bone channels
+    :type frames: int
+    :param looks: number of looks in PIT file
+    :type looks: int
+    :param materials: number of materials in each PIT look
+    :type materials: int
+    :param units: number of units in SII file
+    :type units: int
+    :param repeat: number of repeats for each measurement
+    :type repeat: int
+    :return: benchmark results
+    :rtype: dict
+    """
+    config = {
+        "vertices": vertices, "pieces": pieces, "curves": curves, "bones": bones, "frames": frames,
+        "looks": looks, "materials": materials, "units": units, "repeat": repeat,
+    }
+    results = {}
+
+    with tempfile.TemporaryDirectory(prefix="scs_benchmark_") as tmp_dir:
+
+        files = {
+            "pim": (generate_pim(vertices, pieces, bones), "benchmark.pim"),
+            "pit": (generate_pit(looks, materials), "benchmark.pit"),
+            "pip": (generate_pip(curves), "benchmark.pip"),
+            "pia": (generate_pia(bones, frames), "benchmark.pia"),
+            "sii": (generate_sii(units), "benchmark.sii"),
+        }
+
+        for file_type, (content, filename) in files.items():
+
+            filepath = os.path.join(tmp_dir, filename)
+            with open(filepath, mode="w", encoding="utf8", newline="\n") as file:
+                file.write(content)
+
+            if file_type == "sii":
+                result = _measure(lambda: _sii_parser.parse_file(filepath), repeat)
+            else:
+                result = _measure(lambda: _pix_parser.read_data(filepath, _IND), repeat)
+
+            result["size_bytes"] = os.path.getsize(filepath)
+            results["parse_" + file_type] = result
+
+        pim_container = get_pim_container(vertices, pieces)
+        out_filepath = os.path.join(tmp_dir, "benchmark_out.pim")
+        results["write_pim"] = _measure(lambda: _pix_writer.write_data(pim_container, out_filepath, _IND, False, False), repeat)
+        results["write_pim"]["size_bytes"] = os.path.getsize(out_filepath)
+
+    floats = [_get_value(i) for i in range(vertices * 3)]
+    triplets = [floats[i:i + 3] for i in range(0, len(floats), 3)]
+    hex_strings = [float_to_hex_string(value) for value in floats]
+
+    results["float_to_hex_string"] = _measure(lambda: [float_to_hex_string(value) for value in floats], repeat)
+    results["float_array_to_hex_string"] = _measure(lambda: [float_array_to_hex_string(value) for value in triplets], repeat)
+    results["hex_string_to_float"] = _measure(lambda: [hex_string_to_float(value) for value in hex_strings], repeat)
+    for name in ("float_to_hex_string", "float_array_to_hex_string", "hex_string_to_float"):
+        results[name]["items"] = len(floats) if name != "float_array_to_hex_string" else len(triplets)
+
+    return {
+        "tools_version": get_tools_version(),
+        "python_version": platform.python_version(),
+        "platform": platform.platform(),
+        "config": config,
+        "results": results,
+    }
+
+
+def main(argv=None):
+    """Runs benchmark with command line arguments and prints results as JSON or saves them to output file.
+
+    :param argv: command line arguments; if None arguments after "--" from "sys.argv" are used
+    :type argv: list[str] | None
+    """
+    if argv is None:
+        argv = sys.argv[sys.argv.index("--") + 1:] if "--" in sys.argv else []
+
+    parser = argparse.ArgumentParser(description="Benchmark of SCS Blender Tools parsers, writers and hex conversions.")
+    parser.add_argument("--vertices", type=int, default=20000)
+    parser.add_argument("--pieces", type=int, default=4)
+    parser.add_argument("--curves", type=int, default=500)
+    parser.add_argument("--bones", type=int, default=32)
+    parser.add_argument("--frames", type=int, default=60)
+    parser.add_argument("--looks", type=int, default=4)
+    parser.add_argument("--materials", type=int, default=16)
+    parser.add_argument("--units", type=int, default=2000)
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--output", type=str, default=None, help="JSON file path to save results to, printed if not given")
+    args = vars(parser.parse_args(argv))
+
+    output = args.pop("output")
+    results = run(**args)
+
+    if output:
+        with open(output, mode="w", encoding="utf8") as file:
+            json.dump(results, file, indent=2)
+    else:
+        print(json.dumps(results, indent=2))
+
+
+if __name__ == "__main__":
+    main()